@@ -1,7 +1,24 @@
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
 from fastapi import FastAPI
 from application.api.users.handlers import router as user_router
 from application.api.auth.handlers import router as auth_router
 from application.api.tasks.handlers import router as task_router
+from application.api.monitoring.handlers import router as monitoring_router, metrics_router
+from logic.events.bus import BaseEventBus
+from logic.init import get_container
+from logic.mediator.base import Mediator
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    container = get_container()
+    event_bus: BaseEventBus = container.resolve(BaseEventBus)
+
+    await event_bus.start(mediator=container.resolve(Mediator))
+    yield
+    await event_bus.stop()
 
 
 def create_app() -> FastAPI:
@@ -9,10 +26,13 @@ def create_app() -> FastAPI:
         title="simple todo list",
         docs_url="/api/docs",
         description="simple todo list with email notification + DDD",
-        debug=True
+        debug=True,
+        lifespan=lifespan
     )
     app.include_router(router=user_router, prefix='/users')
     app.include_router(router=auth_router, prefix='/auth')
     app.include_router(router=task_router, prefix='/tasks')
+    app.include_router(router=monitoring_router, prefix='/monitoring')
+    app.include_router(router=metrics_router)
 
     return app
@@ -0,0 +1,66 @@
+from fastapi import APIRouter, status, Depends
+from fastapi.responses import PlainTextResponse
+from punq import Container
+
+from application.api.monitoring.schemas import DatabasePoolSchema, EventBusSchema
+from infra.db.manager.base import BaseDatabaseManager
+from infra.metrics.registry import MetricsRegistry
+from logic.events.bus import BaseEventBus
+from logic.init import get_container
+
+router = APIRouter(tags=['monitoring'])
+# Mounted at the root, where Prometheus scrapes by default
+metrics_router = APIRouter(tags=['monitoring'])
+
+
+@router.get(
+    '/db-pool',
+    response_model=DatabasePoolSchema,
+    status_code=status.HTTP_200_OK,
+    description='Connection pool usage of this worker: checked out, idle and overflow connections, checkout waits',
+    responses={
+        status.HTTP_200_OK: {'model': DatabasePoolSchema},
+    }
+)
+async def get_database_pool_status(
+        container: Container = Depends(get_container)
+) -> DatabasePoolSchema:
+    database_manager: BaseDatabaseManager = container.resolve(BaseDatabaseManager)
+
+    return DatabasePoolSchema.from_status(status=database_manager.get_pool_status())
+
+
+@router.get(
+    '/event-bus',
+    response_model=EventBusSchema,
+    status_code=status.HTTP_200_OK,
+    description='Event bus of this worker: queue depth, delivered and failed events, publishers blocked by a full queue, '
+                'outbox lag',
+    responses={
+        status.HTTP_200_OK: {'model': EventBusSchema},
+    }
+)
+async def get_event_bus_stats(
+        container: Container = Depends(get_container)
+) -> EventBusSchema:
+    event_bus: BaseEventBus = container.resolve(BaseEventBus)
+
+    return EventBusSchema.from_stats(stats=event_bus.get_stats())
+
+
+@metrics_router.get(
+    '/metrics',
+    response_class=PlainTextResponse,
+    status_code=status.HTTP_200_OK,
+    description='Metrics of this worker in Prometheus text format: command and query latency, errors and in-flight, '
+                'cache hits and misses',
+    responses={
+        status.HTTP_200_OK: {'content': {'text/plain': {}}},
+    }
+)
+async def get_metrics(
+        container: Container = Depends(get_container)
+) -> PlainTextResponse:
+    registry: MetricsRegistry = container.resolve(MetricsRegistry)
+
+    return PlainTextResponse(registry.render(), media_type='text/plain; version=0.0.4')
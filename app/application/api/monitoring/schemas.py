@@ -0,0 +1,60 @@
+from pydantic import BaseModel
+
+from infra.db.manager.base import PoolStatus
+from logic.events.bus import EventBusStats
+
+
+class DatabasePoolSchema(BaseModel):
+    size: int
+    checked_out: int
+    idle: int
+    overflow: int
+    waits: int
+    total_wait_seconds: float
+    max_wait_seconds: float
+
+    @classmethod
+    def from_status(cls, status: PoolStatus) -> 'DatabasePoolSchema':
+        return cls(
+            size=status.size,
+            checked_out=status.checked_out,
+            idle=status.idle,
+            overflow=status.overflow,
+            waits=status.waits,
+            total_wait_seconds=status.total_wait,
+            max_wait_seconds=status.max_wait
+        )
+
+
+class EventBusSchema(BaseModel):
+    queued: int
+    max_size: int
+    workers: int
+    published: int
+    delivered: int
+    failed: int
+    dropped: int
+    batches: int
+    blocked: int
+    total_blocked_seconds: float
+    max_blocked_seconds: float
+    dead: int
+    lag_seconds: float
+
+    @classmethod
+    def from_stats(cls, stats: EventBusStats) -> 'EventBusSchema':
+        return cls(
+            queued=stats.queued,
+            max_size=stats.max_size,
+            workers=stats.workers,
+            published=stats.published,
+            delivered=stats.delivered,
+            failed=stats.failed,
+            dropped=stats.dropped,
+            batches=stats.batches,
+            blocked=stats.blocked,
+            total_blocked_seconds=stats.total_blocked,
+            max_blocked_seconds=stats.max_blocked,
+            dead=stats.dead,
+            lag_seconds=stats.lag
+        )
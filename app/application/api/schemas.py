@@ -7,7 +7,7 @@ IT = TypeVar('IT')
 
 
 class BaseQueryResponseSchema(BaseModel, Generic[IT]):
-    count: int
+    count: int | None
     limit: int
     offset: int
     items: IT
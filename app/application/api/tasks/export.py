@@ -0,0 +1,65 @@
+import csv
+import io
+import json
+from enum import Enum
+from typing import AsyncIterator
+
+from domain.entities.tasks import Task
+
+EXPORT_FIELDS = ('oid', 'title', 'task_body', 'importance', 'created_at', 'is_completed')
+
+
+class TaskFileFormat(str, Enum):
+    ndjson = 'ndjson'
+    csv = 'csv'
+
+    @property
+    def media_type(self) -> str:
+        if self is TaskFileFormat.csv:
+            return 'text/csv'
+
+        return 'application/x-ndjson'
+
+
+def convert_task_to_export_row(task: Task) -> tuple:
+    return (
+        task.oid,
+        task.title.as_generic_type(),
+        task.task_body.as_generic_type(),
+        task.importance.as_generic_type(),
+        task.created_at.isoformat(),
+        task.is_completed,
+    )
+
+
+async def encode_ndjson(chunks: AsyncIterator[list[Task]]) -> AsyncIterator[bytes]:
+    async for tasks in chunks:
+        yield ''.join(
+            json.dumps(dict(zip(EXPORT_FIELDS, convert_task_to_export_row(task)))) + '\n'
+            for task in tasks
+        ).encode()
+
+
+async def encode_csv(chunks: AsyncIterator[list[Task]]) -> AsyncIterator[bytes]:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(EXPORT_FIELDS)
+
+    async for tasks in chunks:
+        writer.writerows(convert_task_to_export_row(task) for task in tasks)
+
+        yield buffer.getvalue().encode()
+
+        buffer.seek(0)
+        buffer.truncate()
+
+    # Header alone, when user has no tasks
+    if buffer.tell():
+        yield buffer.getvalue().encode()
+
+
+def encode_tasks(chunks: AsyncIterator[list[Task]], export_format: TaskFileFormat) -> AsyncIterator[bytes]:
+    if export_format is TaskFileFormat.csv:
+        return encode_csv(chunks)
+
+    return encode_ndjson(chunks)
@@ -1,13 +1,90 @@
-from pydantic import BaseModel
+from datetime import datetime
 
+from pydantic import BaseModel, Field
+
+from infra.repositories.dtos.task import TASK_READ_FIELDS
 from infra.repositories.filters.tasks import (
     GetTasksFilters as GetTaskInfraFilters,
+    SearchTasksFilters as SearchTasksInfraFilters,
+    TaskCursor,
+    TaskSearchCursor,
+    TaskSort,
+    to_naive_utc,
 )
+from logic.exceptions.tasks import InvalidTaskCursorException, InvalidTaskFieldsException
+
+
+def parse_task_fields(fields: str | None) -> tuple[str, ...] | None:
+    """ Comma separated sparse fieldset, oid is always included """
+    if not fields:
+        return None
+
+    requested = {field.strip() for field in fields.split(',') if field.strip()}
+    unknown = requested.difference(TASK_READ_FIELDS)
+
+    if unknown:
+        raise InvalidTaskFieldsException(fields=', '.join(sorted(unknown)))
+
+    requested.add('oid')
+
+    return tuple(field for field in TASK_READ_FIELDS if field in requested)
+
+
+# Upper bound of a page, pages are read and serialized as a whole
+MAX_TASKS_PAGE_SIZE = 100
 
 
 class GetTasksFilters(BaseModel):
-    limit: int = 10
-    offset: int = 0
+    limit: int = Field(default=10, ge=1, le=MAX_TASKS_PAGE_SIZE)
+    offset: int = Field(default=0, ge=0)
+    cursor: str | None = None
+    with_count: bool = True
+    fields: str | None = None
+    sort: TaskSort = TaskSort.created_at
+    is_completed: bool | None = None
+    importance_min: int | None = None
+    importance_max: int | None = None
+    created_from: datetime | None = None
+    created_to: datetime | None = None
+
+    def to_infra(self):
+        try:
+            cursor = TaskCursor.decode(self.cursor) if self.cursor else None
+        except ValueError:
+            raise InvalidTaskCursorException(cursor=self.cursor)
+
+        # Cursor has to carry the key of the requested sort
+        if cursor and (cursor.importance is not None) != (self.sort is TaskSort.importance_desc):
+            raise InvalidTaskCursorException(cursor=self.cursor)
+
+        return GetTaskInfraFilters(
+            limit=self.limit,
+            offset=self.offset,
+            cursor=cursor,
+            with_count=self.with_count,
+            fields=parse_task_fields(self.fields),
+            sort=self.sort,
+            is_completed=self.is_completed,
+            importance_min=self.importance_min,
+            importance_max=self.importance_max,
+            created_from=to_naive_utc(self.created_from),
+            created_to=to_naive_utc(self.created_to)
+        )
+
+
+class SearchTasksFilters(BaseModel):
+    q: str = Field(min_length=1, max_length=256)
+    limit: int = Field(default=10, ge=1, le=MAX_TASKS_PAGE_SIZE)
+    cursor: str | None = None
 
     def to_infra(self):
-        return GetTaskInfraFilters(limit=self.limit, offset=self.offset)
+        try:
+            cursor = TaskSearchCursor.decode(self.cursor) if self.cursor else None
+        except ValueError:
+            raise InvalidTaskCursorException(cursor=self.cursor)
+
+        return SearchTasksInfraFilters(
+            text=self.q,
+            limit=self.limit,
+            cursor=cursor
+        )
@@ -1,17 +1,26 @@
-from fastapi import APIRouter, status, Depends, HTTPException
+from fastapi import APIRouter, status, Depends, HTTPException, Query, Request
+from fastapi.responses import StreamingResponse, ORJSONResponse
 from punq import Container
 
-from application.api.tasks.filters import GetTasksFilters
+from application.api.tasks.export import TaskFileFormat, encode_tasks
+
+from application.api.tasks.filters import GetTasksFilters, parse_task_fields, SearchTasksFilters
+from application.api.tasks.imports import parse_tasks, RejectsSample
 from application.api.tasks.schemas import TaskDetailSchema, TaskCreateSchema, GetTasksQueryResponseSchema, \
-    DeleteTaskSchema, CompleteTaskSchema
+    DeleteTaskSchema, CompleteTaskSchema, TasksBulkCreateSchema, TasksBulkCreateResponseSchema, TaskBulkErrorSchema, \
+    TasksBulkOidsSchema, TasksBulkResultSchema, TasksImportResultSchema, SearchTasksResponseSchema, TaskStatsSchema, \
+    TaskImportRejectSchema, TaskFieldsSchema
 from application.api.users.schemas import ErrorSchema
 from domain.entities.users import User
 from domain.exceptions.base import ApplicationException
 from infra.services.user.auth.current_user import get_current_user
-from logic.commands.tasks import CreateTaskCommand, DeleteTaskCommand, CompleteTaskCommand
+from logic.commands.tasks import CreateTaskCommand, DeleteTaskCommand, CompleteTaskCommand, \
+    CreateTasksBatchCommand, CreateTaskItem, CompleteTasksBatchCommand, DeleteTasksBatchCommand, ImportTasksCommand
 from logic.init import get_container
 from logic.mediator.base import Mediator
-from logic.queries.tasks import GetAllUserTasksQuery, GetUserTaskByOidQuery
+from logic.queries.tasks import GetAllUserTasksQuery, GetUserTaskByOidQuery, ExportUserTasksQuery, \
+    SearchUserTasksQuery, GetUserTaskStatsQuery
+from settings.config import Config
 
 router = APIRouter(tags=['task'])
 
@@ -48,11 +57,98 @@ async def create_task(
     return TaskDetailSchema.from_entity(task=task)
 
 
+@router.post(
+    '/bulk',
+    response_model=TasksBulkCreateResponseSchema,
+    status_code=status.HTTP_201_CREATED,
+    description='Create many tasks for current authenticated user, invalid items are reported by their index',
+    responses={
+        status.HTTP_201_CREATED: {'model': TasksBulkCreateResponseSchema},
+        status.HTTP_400_BAD_REQUEST: {'model': ErrorSchema}
+    }
+)
+async def create_tasks_bulk(
+        tasks_schema: TasksBulkCreateSchema,
+        container: Container = Depends(get_container),
+        current_user: User = Depends(get_current_user)
+) -> TasksBulkCreateResponseSchema:
+    mediator: Mediator = container.resolve(Mediator)
+
+    try:
+        result, *_ = await mediator.handle_command(
+            CreateTasksBatchCommand(
+                items=[
+                    CreateTaskItem(
+                        title=task_schema.title,
+                        task_body=task_schema.task_body,
+                        importance=task_schema.importance
+                    )
+                    for task_schema in tasks_schema.tasks
+                ],
+                user_oid=current_user.oid
+            )
+        )
+    except ApplicationException as error:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail={'error': error.message})
+
+    return TasksBulkCreateResponseSchema(
+        created=[TaskDetailSchema.from_entity(task=task) for task in result.created],
+        errors=[TaskBulkErrorSchema(index=error.index, error=error.error) for error in result.errors]
+    )
+
+
+@router.post(
+    '/import',
+    response_model=TasksImportResultSchema,
+    status_code=status.HTTP_201_CREATED,
+    description='Import NDJSON or CSV request body as current authenticated user tasks, '
+                'the first invalid rows are returned with their line number and error',
+    responses={
+        status.HTTP_201_CREATED: {'model': TasksImportResultSchema},
+        status.HTTP_400_BAD_REQUEST: {'model': ErrorSchema}
+    }
+)
+async def import_user_tasks(
+        request: Request,
+        import_format: TaskFileFormat = Query(default=TaskFileFormat.ndjson, alias='format'),
+        container: Container = Depends(get_container),
+        current_user: User = Depends(get_current_user)
+) -> TasksImportResultSchema:
+    mediator: Mediator = container.resolve(Mediator)
+    config: Config = container.resolve(Config)
+    rejects = RejectsSample(max_size=config.tasks_import_rejects_sample)
+
+    try:
+        result, *_ = await mediator.handle_command(
+            ImportTasksCommand(
+                rows=parse_tasks(
+                    stream=request.stream(),
+                    import_format=import_format,
+                    max_line_length=config.tasks_import_max_line_length
+                ),
+                user_oid=current_user.oid,
+                rejects=rejects,
+                batch_size=config.tasks_import_batch_size
+            )
+        )
+    except ApplicationException as error:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail={'error': error.message})
+
+    return TasksImportResultSchema(
+        imported=result.imported,
+        rejected=result.rejected,
+        rejects=[TaskImportRejectSchema(**row) for row in rejects.rows]
+    )
+
+
 @router.get(
     '/user{user_oid}/my-tasks',
     response_model=GetTasksQueryResponseSchema,
+    response_class=ORJSONResponse,
     status_code=status.HTTP_200_OK,
-    description='Get all current authenticated user tasks',
+    description='Get current authenticated user tasks, pass next_cursor back as cursor to get the next page, '
+                'fields is a comma separated subset of task fields to return, '
+                'sort is one of created_at, -created_at, -importance',
     responses={
         status.HTTP_200_OK: {'model': GetTasksQueryResponseSchema},
         status.HTTP_400_BAD_REQUEST: {'model': ErrorSchema}
@@ -62,57 +158,160 @@ async def get_all_user_tasks(
         filters: GetTasksFilters = Depends(),
         container: Container = Depends(get_container),
         current_user: User = Depends(get_current_user)
-) -> GetTasksQueryResponseSchema:
+) -> ORJSONResponse:
     mediator: Mediator = container.resolve(Mediator)
 
     try:
-        tasks, count = await mediator.handle_query(
+        tasks, count, next_cursor = await mediator.handle_query(
             GetAllUserTasksQuery(
                 user_oid=current_user.oid,
-                filters=filters
+                filters=filters.to_infra()
             )
         )
 
     except ApplicationException as error:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail={'error': error.message})
 
-    return GetTasksQueryResponseSchema(
-        count=count,
-        limit=filters.limit,
-        offset=filters.offset,
-        items=[TaskDetailSchema.from_entity(task) for task in tasks]
+    # Read models are already in response shape, so they skip response_model validation
+    return ORJSONResponse(
+        content={
+            'count': count,
+            'limit': filters.limit,
+            'offset': filters.offset,
+            'items': tasks,
+            'next_cursor': next_cursor
+        }
     )
 
 
+@router.get(
+    '/export',
+    response_class=StreamingResponse,
+    status_code=status.HTTP_200_OK,
+    description='Stream all current authenticated user tasks as NDJSON or CSV',
+    responses={
+        status.HTTP_200_OK: {'content': {'application/x-ndjson': {}, 'text/csv': {}}},
+        status.HTTP_400_BAD_REQUEST: {'model': ErrorSchema}
+    }
+)
+async def export_user_tasks(
+        export_format: TaskFileFormat = Query(default=TaskFileFormat.ndjson, alias='format'),
+        container: Container = Depends(get_container),
+        current_user: User = Depends(get_current_user)
+) -> StreamingResponse:
+    mediator: Mediator = container.resolve(Mediator)
+
+    try:
+        chunks = await mediator.handle_query(
+            ExportUserTasksQuery(
+                user_oid=current_user.oid
+            )
+        )
+
+    except ApplicationException as error:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail={'error': error.message})
+
+    return StreamingResponse(
+        encode_tasks(chunks=chunks, export_format=export_format),
+        media_type=export_format.media_type,
+        headers={'Content-Disposition': f'attachment; filename="tasks.{export_format.value}"'}
+    )
+
+
+@router.get(
+    '/search',
+    response_model=SearchTasksResponseSchema,
+    response_class=ORJSONResponse,
+    status_code=status.HTTP_200_OK,
+    description='Search current authenticated user tasks by title and body, most relevant first',
+    responses={
+        status.HTTP_200_OK: {'model': SearchTasksResponseSchema},
+        status.HTTP_400_BAD_REQUEST: {'model': ErrorSchema}
+    }
+)
+async def search_user_tasks(
+        filters: SearchTasksFilters = Depends(),
+        container: Container = Depends(get_container),
+        current_user: User = Depends(get_current_user)
+) -> ORJSONResponse:
+    mediator: Mediator = container.resolve(Mediator)
+
+    try:
+        tasks, next_cursor = await mediator.handle_query(
+            SearchUserTasksQuery(
+                user_oid=current_user.oid,
+                filters=filters.to_infra()
+            )
+        )
+
+    except ApplicationException as error:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail={'error': error.message})
+
+    return ORJSONResponse(content={'items': tasks, 'next_cursor': next_cursor})
+
+
+@router.get(
+    '/stats',
+    response_model=TaskStatsSchema,
+    response_class=ORJSONResponse,
+    status_code=status.HTTP_200_OK,
+    description='Get total, completed and open task counts of current authenticated user, overall and per importance',
+    responses={
+        status.HTTP_200_OK: {'model': TaskStatsSchema},
+        status.HTTP_400_BAD_REQUEST: {'model': ErrorSchema}
+    }
+)
+async def get_user_task_stats(
+        container: Container = Depends(get_container),
+        current_user: User = Depends(get_current_user)
+) -> ORJSONResponse:
+    mediator: Mediator = container.resolve(Mediator)
+
+    try:
+        stats = await mediator.handle_query(
+            GetUserTaskStatsQuery(
+                user_oid=current_user.oid
+            )
+        )
+
+    except ApplicationException as error:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail={'error': error.message})
+
+    return ORJSONResponse(content=stats)
+
+
 @router.get(
     '/{task_oid}',
-    response_model=TaskDetailSchema,
+    response_model=TaskFieldsSchema,
+    response_class=ORJSONResponse,
     status_code=status.HTTP_200_OK,
-    description='Get user task by task_oid',
+    description='Get user task by task_oid, fields is a comma separated subset of task fields to return',
     responses={
-        status.HTTP_200_OK: {'model': TaskDetailSchema},
+        status.HTTP_200_OK: {'model': TaskFieldsSchema},
         status.HTTP_400_BAD_REQUEST: {'model': ErrorSchema}
     }
 )
 async def get_user_task_by_oid(
         task_oid: str,
+        fields: str | None = None,
         container: Container = Depends(get_container),
         current_user: User = Depends(get_current_user)
-) -> TaskDetailSchema:
+) -> ORJSONResponse:
     mediator: Mediator = container.resolve(Mediator)
 
     try:
         task = await mediator.handle_query(
             GetUserTaskByOidQuery(
                 user_oid=current_user.oid,
-                task_oid=task_oid
+                task_oid=task_oid,
+                fields=parse_task_fields(fields)
             )
         )
 
     except ApplicationException as error:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail={'error': error.message})
 
-    return TaskDetailSchema.from_entity(task=task)
+    return ORJSONResponse(content=task)
 
 
 @router.delete(
@@ -175,3 +374,73 @@ async def complete_user_task(
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail={'error': error.message})
 
     return CompleteTaskSchema
+
+
+@router.put(
+    '/bulk/make-complete',
+    response_model=TasksBulkResultSchema,
+    status_code=status.HTTP_200_OK,
+    description='Complete many user tasks, reports which tasks were completed, foreign or missing',
+    responses={
+        status.HTTP_200_OK: {'model': TasksBulkResultSchema},
+        status.HTTP_400_BAD_REQUEST: {'model': ErrorSchema}
+    }
+)
+async def complete_user_tasks_bulk(
+        oids_schema: TasksBulkOidsSchema,
+        container: Container = Depends(get_container),
+        current_user: User = Depends(get_current_user)
+) -> TasksBulkResultSchema:
+    mediator: Mediator = container.resolve(Mediator)
+
+    try:
+        result, *_ = await mediator.handle_command(
+            CompleteTasksBatchCommand(
+                task_oids=oids_schema.task_oids,
+                user_oid=current_user.oid
+            )
+        )
+
+    except ApplicationException as error:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail={'error': error.message})
+
+    return TasksBulkResultSchema(
+        affected=result.affected,
+        denied=result.denied,
+        missing=result.missing
+    )
+
+
+@router.delete(
+    '/bulk/delete',
+    response_model=TasksBulkResultSchema,
+    status_code=status.HTTP_200_OK,
+    description='Delete many user tasks, reports which tasks were deleted, foreign or missing',
+    responses={
+        status.HTTP_200_OK: {'model': TasksBulkResultSchema},
+        status.HTTP_400_BAD_REQUEST: {'model': ErrorSchema}
+    }
+)
+async def delete_user_tasks_bulk(
+        oids_schema: TasksBulkOidsSchema,
+        container: Container = Depends(get_container),
+        current_user: User = Depends(get_current_user)
+) -> TasksBulkResultSchema:
+    mediator: Mediator = container.resolve(Mediator)
+
+    try:
+        result, *_ = await mediator.handle_command(
+            DeleteTasksBatchCommand(
+                task_oids=oids_schema.task_oids,
+                user_oid=current_user.oid
+            )
+        )
+
+    except ApplicationException as error:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail={'error': error.message})
+
+    return TasksBulkResultSchema(
+        affected=result.affected,
+        denied=result.denied,
+        missing=result.missing
+    )
@@ -0,0 +1,167 @@
+import codecs
+import csv
+import json
+from dataclasses import dataclass, field
+from typing import AsyncIterator
+
+from application.api.tasks.export import TaskFileFormat
+from logic.commands.tasks import ImportTaskRow
+
+# Characters, longer lines are rejected without being buffered whole
+MAX_IMPORT_LINE_LENGTH = 64 * 1024
+
+
+def get_line_too_long_error(max_line_length: int) -> str:
+    return f'Line is longer than {max_line_length} characters'
+
+
+async def iter_lines(stream: AsyncIterator[bytes], max_line_length: int) -> AsyncIterator[str | None]:
+    """ Lines of the stream, None in place of a line longer than max_line_length """
+    decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+    tail = ''
+    # Rest of an oversized line is dropped until its end
+    skipping = False
+
+    async for chunk in stream:
+        *lines, tail = (tail + decoder.decode(chunk)).split('\n')
+
+        for line in lines:
+            if skipping or len(line) > max_line_length:
+                skipping = False
+                yield None
+                continue
+
+            yield line.rstrip('\r')
+
+        if skipping or len(tail) > max_line_length:
+            skipping = True
+            tail = ''
+
+    tail += decoder.decode(b'', final=True)
+
+    if skipping or len(tail) > max_line_length:
+        yield None
+    elif tail:
+        yield tail.rstrip('\r')
+
+
+async def parse_ndjson(stream: AsyncIterator[bytes], max_line_length: int) -> AsyncIterator[ImportTaskRow]:
+    number = 0
+
+    async for line in iter_lines(stream, max_line_length=max_line_length):
+        number += 1
+
+        if line is None:
+            yield ImportTaskRow(number=number, error=get_line_too_long_error(max_line_length))
+            continue
+
+        if not line.strip():
+            continue
+
+        try:
+            data = json.loads(line)
+        except ValueError as error:
+            yield ImportTaskRow(number=number, error=f'Invalid JSON: {error}')
+            continue
+
+        if not isinstance(data, dict):
+            yield ImportTaskRow(number=number, error='Row should be a JSON object')
+            continue
+
+        yield ImportTaskRow(number=number, data=data)
+
+
+async def iter_csv_records(
+        stream: AsyncIterator[bytes],
+        max_line_length: int
+) -> AsyncIterator[tuple[int, list[str] | None]]:
+    """ Records of the stream with their first line number, None in place of an oversized record """
+    number = 0
+    start = 0
+    length = 0
+    quotes = 0
+    record: list[str] = []
+    # Quoted fields spanning lines are capped as a whole too, the rest of
+    # an oversized record is read only to find where it ends
+    oversized = False
+
+    async for line in iter_lines(stream, max_line_length=max_line_length):
+        number += 1
+
+        if not record and not oversized:
+            start = number
+            length = 0
+
+        # Quotes of a dropped line are unknown, the record is taken to end with it
+        if line is None:
+            yield start, None
+            record, quotes, oversized = [], 0, False
+            continue
+
+        length += len(line) + 1
+        quotes += line.count('"')
+
+        if length > max_line_length + 1:
+            oversized = True
+            record = []
+        else:
+            record.append(line)
+
+        # Quoted field spans lines until quotes are balanced, escaped quotes come in pairs
+        if quotes % 2:
+            continue
+
+        if oversized:
+            yield start, None
+        elif record != ['']:
+            yield start, next(csv.reader(['\n'.join(record)]))
+
+        record, quotes, oversized = [], 0, False
+
+    if oversized:
+        yield start, None
+    elif record:
+        yield start, next(csv.reader(['\n'.join(record)]))
+
+
+async def parse_csv(stream: AsyncIterator[bytes], max_line_length: int) -> AsyncIterator[ImportTaskRow]:
+    header = None
+
+    async for number, values in iter_csv_records(stream, max_line_length=max_line_length):
+        if values is None:
+            yield ImportTaskRow(number=number, error=get_line_too_long_error(max_line_length))
+            continue
+
+        if header is None:
+            header = values
+            continue
+
+        if len(values) != len(header):
+            yield ImportTaskRow(number=number, error=f'Expected {len(header)} fields, got {len(values)}')
+            continue
+
+        yield ImportTaskRow(number=number, data=dict(zip(header, values)))
+
+
+def parse_tasks(
+        stream: AsyncIterator[bytes],
+        import_format: TaskFileFormat,
+        max_line_length: int = MAX_IMPORT_LINE_LENGTH
+) -> AsyncIterator[ImportTaskRow]:
+    if import_format is TaskFileFormat.csv:
+        return parse_csv(stream, max_line_length=max_line_length)
+
+    return parse_ndjson(stream, max_line_length=max_line_length)
+
+
+@dataclass
+class RejectsSample:
+    """ Rejects target of an import that keeps the first max_size rejected rows in memory """
+    max_size: int
+    rows: list[dict] = field(default_factory=list)
+
+    def write(self, line: str) -> int:
+        if len(self.rows) < self.max_size:
+            self.rows.append(json.loads(line))
+
+        return len(line)
@@ -1,6 +1,6 @@
 from datetime import datetime
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 from application.api.schemas import BaseQueryResponseSchema
 from domain.entities.tasks import Task
@@ -26,14 +26,85 @@ class TaskDetailSchema(BaseModel):
         )
 
 
+class TaskFieldsSchema(BaseModel):
+    """ Task in listing and detail responses, fields= leaves out fields not asked for.
+    oid is always present, other fields are absent rather than null when left out """
+    oid: str
+    title: str | None = None
+    task_body: str | None = None
+    importance: int | None = None
+    created_at: datetime | None = None
+    is_completed: bool | None = None
+
+
 class TaskCreateSchema(BaseModel):
     title: str
     task_body: str
     importance: int = 1
 
 
-class GetTasksQueryResponseSchema(BaseQueryResponseSchema[list[TaskDetailSchema]]):
-    ...
+class TasksBulkCreateSchema(BaseModel):
+    tasks: list[TaskCreateSchema] = Field(min_length=1, max_length=1000)
+
+
+class TaskBulkErrorSchema(BaseModel):
+    index: int
+    error: str
+
+
+class TasksBulkCreateResponseSchema(BaseModel):
+    created: list[TaskDetailSchema]
+    errors: list[TaskBulkErrorSchema]
+
+
+class TasksBulkOidsSchema(BaseModel):
+    task_oids: list[str] = Field(min_length=1, max_length=1000)
+
+
+class TasksBulkResultSchema(BaseModel):
+    affected: list[str]
+    denied: list[str]
+    missing: list[str]
+
+
+class TaskImportRejectSchema(BaseModel):
+    line: int
+    error: str
+    row: dict | None = None
+
+
+class TasksImportResultSchema(BaseModel):
+    imported: int
+    rejected: int
+    # First rejected rows only, rejected holds the full count
+    rejects: list[TaskImportRejectSchema] = []
+
+
+class GetTasksQueryResponseSchema(BaseQueryResponseSchema[list[TaskFieldsSchema]]):
+    next_cursor: str | None = None
+
+
+class TaskSearchResultSchema(TaskDetailSchema):
+    rank: float
+
+
+class SearchTasksResponseSchema(BaseModel):
+    items: list[TaskSearchResultSchema]
+    next_cursor: str | None = None
+
+
+class TaskImportanceStatsSchema(BaseModel):
+    importance: int
+    total: int
+    completed: int
+    open: int
+
+
+class TaskStatsSchema(BaseModel):
+    total: int
+    completed: int
+    open: int
+    by_importance: list[TaskImportanceStatsSchema]
 
 
 class DeleteTaskSchema(BaseModel):
@@ -0,0 +1,65 @@
+import argparse
+import asyncio
+import sys
+from typing import AsyncIterator, BinaryIO
+
+from application.api.tasks.export import TaskFileFormat
+from application.api.tasks.imports import parse_tasks
+from domain.exceptions.base import ApplicationException
+from logic.commands.tasks import ImportTasksCommand
+from logic.init import get_container
+from logic.mediator.base import Mediator
+from settings.config import Config
+
+CHUNK_SIZE = 64 * 1024
+
+
+async def read_chunks(file: BinaryIO) -> AsyncIterator[bytes]:
+    while chunk := await asyncio.to_thread(file.read, CHUNK_SIZE):
+        yield chunk
+
+
+async def import_tasks(args: argparse.Namespace) -> int:
+    container = get_container()
+    mediator: Mediator = container.resolve(Mediator)
+    config: Config = container.resolve(Config)
+    batch_size = args.batch_size or config.tasks_import_batch_size
+
+    source = sys.stdin.buffer if args.path == '-' else open(args.path, 'rb')
+
+    with source, open(args.rejects, 'w') as rejects:
+        try:
+            result, *_ = await mediator.handle_command(
+                ImportTasksCommand(
+                    rows=parse_tasks(
+                        stream=read_chunks(source),
+                        import_format=TaskFileFormat(args.format),
+                        max_line_length=config.tasks_import_max_line_length
+                    ),
+                    user_oid=args.user_oid,
+                    rejects=rejects,
+                    batch_size=batch_size
+                )
+            )
+        except ApplicationException as error:
+            print(error.message, file=sys.stderr)
+            return 1
+
+    print(f'imported: {result.imported}, rejected: {result.rejected}, rejects: {args.rejects}')
+
+    return 0
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Bulk import tasks for a user from NDJSON or CSV')
+    parser.add_argument('path', help="file to import, '-' reads stdin")
+    parser.add_argument('--user-oid', required=True)
+    parser.add_argument('--format', choices=[item.value for item in TaskFileFormat], default=TaskFileFormat.ndjson.value)
+    parser.add_argument('--rejects', default='rejects.ndjson', help='file to write rejected rows to')
+    parser.add_argument('--batch-size', type=int, default=None)
+
+    sys.exit(asyncio.run(import_tasks(parser.parse_args())))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,40 @@
+import argparse
+import asyncio
+import sys
+
+from infra.repositories.tasks.base import BaseTaskRepository
+from logic.init import get_container
+from settings.config import Config
+
+
+async def rebuild_task_counters(args: argparse.Namespace) -> int:
+    container = get_container()
+    task_repository: BaseTaskRepository = container.resolve(BaseTaskRepository)
+    batch_size = args.batch_size or container.resolve(Config).task_counters_batch_size
+
+    # Every batch is recounted in its own short transaction, so live writers are held up only briefly
+    batches = 0
+    last_user_oid = args.after
+
+    while last_user_oid := await task_repository.rebuild_task_counters(
+        after_user_oid=last_user_oid,
+        batch_size=batch_size
+    ):
+        batches += 1
+        print(f'batch {batches}: recounted users up to {last_user_oid}', file=sys.stderr)
+
+    print(f'rebuilt task counters in {batches} batches')
+
+    return 0
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Rebuild per-user task counters from tasks, in batches of users')
+    parser.add_argument('--batch-size', type=int, default=None)
+    parser.add_argument('--after', default=None, help='resume after this user oid')
+
+    sys.exit(asyncio.run(rebuild_task_counters(parser.parse_args())))
+
+
+if __name__ == '__main__':
+    main()
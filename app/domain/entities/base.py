@@ -6,18 +6,22 @@ from datetime import datetime
 from domain.events.base import BaseEvent
 
 
-@dataclass
+@dataclass(slots=True)
 class BaseEntity(ABC):
     oid: str = field(default_factory=lambda: str(uuid4()), kw_only=True)
     created_at: datetime = field(default_factory=datetime.now, kw_only=True)
-    _events: list[BaseEvent] = field(default_factory=list, kw_only=True)
+    # Created on first event, entities loaded only for reading never get a list
+    _events: list[BaseEvent] | None = field(default=None, kw_only=True, repr=False, compare=False)
 
     def register_event(self, event: BaseEvent) -> None:
+        if self._events is None:
+            self._events = []
+
         self._events.append(event)
 
     def pull_events(self) -> list[BaseEvent]:
-        registered_events = self._events.copy()
-        self._events.clear()
+        registered_events = self._events or []
+        self._events = None
 
         return registered_events
 
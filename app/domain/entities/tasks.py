@@ -5,7 +5,7 @@ from domain.events.tasks import NewTaskCreatedEvent
 from domain.values.tasks import Title, TaskBody, Importance
 
 
-@dataclass
+@dataclass(slots=True)
 class Task(BaseEntity):
     title: Title
     task_body: TaskBody
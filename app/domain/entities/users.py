@@ -5,7 +5,7 @@ from domain.events.users import NewUserCreatedEvent
 from domain.values.users import Username, Email, Password
 
 
-@dataclass
+@dataclass(slots=True)
 class User(BaseEntity):
     username: Username
     email: Email
@@ -13,3 +13,13 @@ class BasePasswordManager(ABC):
     @abstractmethod
     def verify_password(self, raw_password: str, hashed_password: str) -> bool:
         ...
+
+    @abstractmethod
+    async def hash_password_async(self, raw_password: str) -> str:
+        """ Same as hash_password, without blocking the event loop """
+        ...
+
+    @abstractmethod
+    async def verify_password_async(self, raw_password: str, hashed_password: str) -> bool:
+        """ Same as verify_password, without blocking the event loop """
+        ...
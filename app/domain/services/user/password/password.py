@@ -1,15 +1,49 @@
-import hashlib
-from dataclasses import dataclass
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+
+from passlib.context import CryptContext
 
 from domain.services.user.password.base import BasePasswordManager
 
 
 @dataclass
 class PasswordManager(BasePasswordManager):
+    """ PBKDF2-SHA256 hashing, plain hex SHA-256 hashes are still accepted for existing users.
+
+    Async variants run on a bounded thread pool: hashlib releases the GIL
+    while deriving the key, so logins do not stall other requests.
+    """
+    rounds: int = 29000
+    max_workers: int = 4
+
+    _context: CryptContext = field(init=False, repr=False)
+    _executor: ThreadPoolExecutor = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self._context = CryptContext(
+            schemes=['pbkdf2_sha256', 'hex_sha256'],
+            deprecated=['hex_sha256'],
+            pbkdf2_sha256__default_rounds=self.rounds
+        )
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.max_workers,
+            thread_name_prefix='password-hasher'
+        )
 
     def hash_password(self, raw_password: str) -> str:
-        hashed = hashlib.sha256(raw_password.encode()).hexdigest()
-        return hashed
+        return self._context.hash(raw_password)
 
     def verify_password(self, raw_password: str, hashed_password: str) -> bool:
-        return self.hash_password(raw_password) == hashed_password
+        try:
+            return self._context.verify(raw_password, hashed_password)
+        except ValueError:
+            return False
+
+    async def hash_password_async(self, raw_password: str) -> str:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, self.hash_password, raw_password)
+
+    async def verify_password_async(self, raw_password: str, hashed_password: str) -> bool:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, self.verify_password, raw_password, hashed_password)
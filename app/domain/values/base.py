@@ -1,17 +1,34 @@
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import TypeVar, Any, Generic
+from typing import TypeVar, Any, Generic, ClassVar, Self
 
 VT = TypeVar("VT", bound=Any)
 
+_new_object = object.__new__
+_set_attribute = object.__setattr__
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class BaseValueObject(ABC, Generic[VT]):
     value: VT
 
+    # Debug switch, makes trusted() validate as well
+    validate_trusted: ClassVar[bool] = False
+
     def __post_init__(self) -> None:
         self.validate()
 
+    @classmethod
+    def trusted(cls, value: VT) -> Self:
+        """ Build from data that was validated before it was stored, e.g. a database row """
+        if BaseValueObject.validate_trusted:
+            return cls(value)
+
+        value_object = _new_object(cls)
+        _set_attribute(value_object, 'value', value)
+
+        return value_object
+
     @abstractmethod
     def validate(self) -> None:
         ...
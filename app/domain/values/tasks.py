@@ -5,7 +5,7 @@ from domain.exceptions.tasks import EmptyTitleException, TitleTooLongException,
 from domain.values.base import BaseValueObject
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Title(BaseValueObject):
     def validate(self) -> None:
         if not self.value:
@@ -18,7 +18,7 @@ class Title(BaseValueObject):
         return str(self.value)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TaskBody(BaseValueObject):
     def validate(self) -> None:
         if not self.value:
@@ -31,7 +31,7 @@ class TaskBody(BaseValueObject):
         return str(self.value)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Importance(BaseValueObject):
     def validate(self) -> None:
         if not self.value:
@@ -9,7 +9,7 @@ from domain.exceptions.users import (
 from domain.values.base import BaseValueObject
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Password(BaseValueObject):
 
     def validate(self) -> None:
@@ -20,7 +20,7 @@ class Password(BaseValueObject):
         return str(self.value)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Username(BaseValueObject):
     def validate(self) -> None:
         if not self.value:
@@ -33,7 +33,7 @@ class Username(BaseValueObject):
         return str(self.value)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Email(BaseValueObject):
     def validate(self) -> None:
         if not self.value:
@@ -0,0 +1,35 @@
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Any, Hashable
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    expirations: int = 0
+
+
+@dataclass
+class BaseCache(ABC):
+    @abstractmethod
+    def get(self, key: Hashable) -> Any | None:
+        ...
+
+    @abstractmethod
+    def set(self, key: Hashable, value: Any, ttl: float | None = None) -> None:
+        ...
+
+    @abstractmethod
+    def invalidate(self, key: Hashable) -> None:
+        ...
+
+    @abstractmethod
+    def clear(self) -> None:
+        ...
+
+    @property
+    @abstractmethod
+    def stats(self) -> CacheStats:
+        ...
@@ -0,0 +1,81 @@
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Callable, Hashable
+
+from infra.cache.base import BaseCache, CacheStats
+
+
+@dataclass
+class MemoryLRUCache(BaseCache):
+    """ In-process LRU cache with per-entry expiration.
+
+    Operations never await, so a single instance is safe to share between
+    coroutines running on one event loop.
+    """
+    max_size: int = 1024
+    ttl: float | None = 60.0
+
+    _entries: OrderedDict[Hashable, tuple[float | None, Any]] = field(
+        default_factory=OrderedDict,
+        kw_only=True
+    )
+    _stats: CacheStats = field(
+        default_factory=CacheStats,
+        kw_only=True
+    )
+    _clock: Callable[[], float] = field(
+        default=time.monotonic,
+        kw_only=True
+    )
+
+    def get(self, key: Hashable) -> Any | None:
+        entry = self._entries.get(key)
+
+        if entry is None:
+            self._stats.misses += 1
+            return None
+
+        expires_at, value = entry
+
+        if expires_at is not None and expires_at <= self._clock():
+            del self._entries[key]
+            self._stats.expirations += 1
+            self._stats.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self._stats.hits += 1
+
+        return value
+
+    def set(self, key: Hashable, value: Any, ttl: float | None = None) -> None:
+        if self.max_size <= 0:
+            return
+
+        ttl = self.ttl if ttl is None else ttl
+
+        if ttl is not None and ttl <= 0:
+            self._entries.pop(key, None)
+            return
+
+        expires_at = None if ttl is None else self._clock() + ttl
+        self._entries[key] = (expires_at, value)
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            self._stats.evictions += 1
+
+    def invalidate(self, key: Hashable) -> None:
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    @property
+    def stats(self) -> CacheStats:
+        return self._stats
+
+    def __len__(self) -> int:
+        return len(self._entries)
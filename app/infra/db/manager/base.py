@@ -1,7 +1,19 @@
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
+from typing import AsyncContextManager
 
-from sqlalchemy.ext.asyncio import async_sessionmaker
+from sqlalchemy.ext.asyncio import async_sessionmaker, AsyncSession
+
+
+@dataclass(frozen=True)
+class PoolStatus:
+    size: int
+    checked_out: int
+    idle: int
+    overflow: int
+    waits: int
+    total_wait: float
+    max_wait: float
 
 
 @dataclass
@@ -10,4 +22,11 @@ class BaseDatabaseManager(ABC):
     async def get_sessionmaker(self) -> async_sessionmaker:
         ...
 
+    @abstractmethod
+    def session(self) -> AsyncContextManager[AsyncSession]:
+        """ Session of the active unit of work, or a new single-use transaction """
+        ...
 
+    @abstractmethod
+    def get_pool_status(self) -> PoolStatus:
+        ...
@@ -0,0 +1,40 @@
+import time
+from dataclasses import dataclass
+
+from sqlalchemy.pool import AsyncAdaptedQueuePool, ConnectionPoolEntry
+
+
+@dataclass
+class PoolWaitStats:
+    waits: int = 0
+    total_wait: float = 0.0
+    max_wait: float = 0.0
+
+    def record(self, wait: float) -> None:
+        self.waits += 1
+        self.total_wait += wait
+        self.max_wait = max(self.max_wait, wait)
+
+
+class InstrumentedAsyncAdaptedQueuePool(AsyncAdaptedQueuePool):
+    """ Queue pool that records how long checkouts waited for a connection to be returned """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.wait_stats = PoolWaitStats()
+
+    def _is_exhausted(self) -> bool:
+        # Every connection is checked out and no more may be opened, the checkout has to wait
+        return self._max_overflow > -1 and self.checkedout() >= self.size() + self._max_overflow
+
+    def _do_get(self) -> ConnectionPoolEntry:
+        # Idle connections and new connects are not waits
+        if not self._is_exhausted():
+            return super()._do_get()
+
+        started_at = time.perf_counter()
+
+        try:
+            return super()._do_get()
+        finally:
+            self.wait_stats.record(time.perf_counter() - started_at)
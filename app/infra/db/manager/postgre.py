@@ -1,15 +1,43 @@
+from contextlib import asynccontextmanager
 from dataclasses import dataclass
+from typing import AsyncIterator
 
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, AsyncEngine
 
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
-
-from infra.db.manager.base import BaseDatabaseManager
+from infra.db.manager.base import BaseDatabaseManager, PoolStatus
+from infra.db.manager.pool import PoolWaitStats
+from infra.db.manager.unit_of_work import current_session
 
 
 @dataclass
 class PostgresDatabaseManager(BaseDatabaseManager):
     _session_maker: async_sessionmaker
+    _engine: AsyncEngine
 
     async def get_sessionmaker(self) -> async_sessionmaker:
         return self._session_maker
 
+    @asynccontextmanager
+    async def session(self) -> AsyncIterator[AsyncSession]:
+        session = current_session.get()
+
+        if session is not None:
+            yield session
+            return
+
+        async with self._session_maker.begin() as session:
+            yield session
+
+    def get_pool_status(self) -> PoolStatus:
+        pool = self._engine.pool
+        wait_stats = getattr(pool, 'wait_stats', PoolWaitStats())
+
+        return PoolStatus(
+            size=pool.size(),
+            checked_out=pool.checkedout(),
+            idle=pool.checkedin(),
+            overflow=max(pool.overflow(), 0),
+            waits=wait_stats.waits,
+            total_wait=wait_stats.total_wait,
+            max_wait=wait_stats.max_wait
+        )
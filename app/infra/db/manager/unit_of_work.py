@@ -0,0 +1,76 @@
+from abc import ABC, abstractmethod
+from contextlib import asynccontextmanager, nullcontext
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import AsyncIterator, AsyncContextManager, Awaitable, Callable
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from infra.db.manager.base import BaseDatabaseManager
+
+PostCommitHook = Callable[[], Awaitable[None]]
+
+current_session: ContextVar[AsyncSession | None] = ContextVar('current_session', default=None)
+# Hooks of the transaction in scope, run once it is committed
+post_commit_hooks: ContextVar[list[PostCommitHook] | None] = ContextVar('post_commit_hooks', default=None)
+
+
+@dataclass
+class BaseUnitOfWork(ABC):
+    @abstractmethod
+    def begin(self, isolated: bool = False) -> AsyncContextManager[None]:
+        """ Isolated scope gets its own transaction even inside another scope """
+        ...
+
+    async def after_commit(self, hook: PostCommitHook) -> None:
+        """ Run hook once the transaction in scope commits, right away outside of a scope.
+        Hooks of a transaction that rolls back never run """
+        hooks = post_commit_hooks.get()
+
+        if hooks is None:
+            await hook()
+            return
+
+        hooks.append(hook)
+
+
+@dataclass
+class PostgresUnitOfWork(BaseUnitOfWork):
+    """ Shares one session and transaction between all repository calls in scope.
+
+    Nested scopes join the outer one unless isolated, commit happens when the outermost
+    scope exits without an error, post-commit hooks run after that.
+    """
+    _database_manager: BaseDatabaseManager
+
+    @asynccontextmanager
+    async def begin(self, isolated: bool = False) -> AsyncIterator[None]:
+        if current_session.get() is not None and not isolated:
+            yield
+            return
+
+        # Cleared first, so an isolated scope does not join the outer session
+        token = current_session.set(None)
+        hooks_token = post_commit_hooks.set([])
+
+        try:
+            async with self._database_manager.session() as session:
+                current_session.set(session)
+                yield
+
+            hooks = post_commit_hooks.get()
+        finally:
+            current_session.reset(token)
+            post_commit_hooks.reset(hooks_token)
+
+        # Out of the committed scope, hooks that write join the outer scope if there is one
+        for hook in hooks:
+            await hook()
+
+
+def begin_isolated(unit_of_work: BaseUnitOfWork | None) -> AsyncContextManager[None]:
+    """ Own transaction for work done while the caller's scope should stay idle, no-op without a unit of work """
+    if unit_of_work is None:
+        return nullcontext()
+
+    return unit_of_work.begin(isolated=True)
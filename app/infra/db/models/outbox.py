@@ -0,0 +1,23 @@
+import datetime
+
+from sqlalchemy import String, text, Integer, Index
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import Mapped, mapped_column
+
+from infra.db.models.base import Base
+
+
+class Outbox(Base):
+    __tablename__ = "Outbox"
+    __table_args__ = (
+        Index("ix_outbox_created_at", "created_at"),
+    )
+
+    # Domain event id, a redelivered row keeps it, so handlers can deduplicate
+    id: Mapped[str] = mapped_column(primary_key=True)
+
+    event_type: Mapped[str] = mapped_column(String(100))
+    payload: Mapped[dict] = mapped_column(JSONB())
+
+    created_at: Mapped[datetime.datetime] = mapped_column(server_default=text("TIMEZONE('utc', now())"))
+    attempts: Mapped[int] = mapped_column(Integer(), server_default=text("0"))
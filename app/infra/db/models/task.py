@@ -1,13 +1,39 @@
 import datetime
 
-from sqlalchemy import String, text, Integer, ForeignKey, Boolean
+from sqlalchemy import String, text, Integer, ForeignKey, Boolean, Index, Computed
+from sqlalchemy.dialects.postgresql import TSVECTOR
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from infra.db.models.base import Base
 
+# 'simple' config neither stems nor drops stop words, so any language matches word for word.
+# Title words weigh more than body words in ranking
+TASK_SEARCH_VECTOR = (
+    "setweight(to_tsvector('simple', title), 'A') || "
+    "setweight(to_tsvector('simple', task_body), 'B')"
+)
+
 
 class Tasks(Base):
     __tablename__ = "Tasks"
+    # Listing indexes, one per sort order, so pages are read straight off an index.
+    # created_at sorts use the created_at index both ways, -importance sorts use the importance one.
+    # Open tasks are the few rows among many completed ones, so they get partial indexes of their own,
+    # completed tasks are the bulk of the rows and are filtered out of the full index scan.
+    # Range filters on the sort column narrow the index scan, other range filters are checked per row
+    __table_args__ = (
+        Index("ix_tasks_user_id_created_at_id", "user_id", "created_at", "id"),
+        Index(
+            "ix_tasks_user_id_created_at_id_open", "user_id", "created_at", "id",
+            postgresql_where=text("NOT is_completed")
+        ),
+        Index("ix_tasks_user_id_importance_created_at_id", "user_id", text("importance DESC"), "created_at", "id"),
+        Index(
+            "ix_tasks_user_id_importance_created_at_id_open", "user_id", text("importance DESC"), "created_at", "id",
+            postgresql_where=text("NOT is_completed")
+        ),
+        Index("ix_tasks_search_vector", "search_vector", postgresql_using="gin"),
+    )
 
     id: Mapped[str] = mapped_column(primary_key=True)
 
@@ -18,5 +44,7 @@ class Tasks(Base):
     user_id: Mapped[str] = mapped_column(ForeignKey("Users.id"))
     created_at: Mapped[datetime.datetime] = mapped_column(server_default=text("TIMEZONE('utc', now())"))
     is_completed: Mapped[bool] = mapped_column(Boolean())
+    # Kept up to date by the database, never loaded with the row
+    search_vector: Mapped[str] = mapped_column(TSVECTOR(), Computed(TASK_SEARCH_VECTOR, persisted=True), deferred=True)
 
     user: Mapped["Users"] = relationship("Users", back_populates="task")
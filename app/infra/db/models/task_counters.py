@@ -0,0 +1,15 @@
+from sqlalchemy import ForeignKey, Integer, text
+from sqlalchemy.orm import Mapped, mapped_column
+
+from infra.db.models.base import Base
+
+
+class TaskCounters(Base):
+    """ Task counts of a user per importance, kept in step with Tasks by the task repository """
+    __tablename__ = "TaskCounters"
+
+    user_id: Mapped[str] = mapped_column(ForeignKey("Users.id", ondelete="CASCADE"), primary_key=True)
+    importance: Mapped[int] = mapped_column(Integer(), primary_key=True)
+
+    total: Mapped[int] = mapped_column(Integer(), server_default=text("0"))
+    completed: Mapped[int] = mapped_column(Integer(), server_default=text("0"))
@@ -1,7 +1,7 @@
 import datetime
 from typing import List
 
-from sqlalchemy import String, text
+from sqlalchemy import String, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from infra.db.models.base import Base
@@ -10,6 +10,9 @@ from infra.db.models.task import Tasks
 
 class Users(Base):
     __tablename__ = "Users"
+    __table_args__ = (
+        Index("ix_users_email", "email", unique=True),
+    )
 
     id: Mapped[str] = mapped_column(primary_key=True)
 
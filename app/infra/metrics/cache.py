@@ -0,0 +1,19 @@
+from infra.cache.base import BaseCache
+from infra.metrics.registry import MetricsRegistry
+
+# CacheStats field, metric name, description
+CACHE_STATS_METRICS = (
+    ('hits', 'cache_hits_total', 'Cache lookups served from the cache'),
+    ('misses', 'cache_misses_total', 'Cache lookups that fell through to the source'),
+    ('evictions', 'cache_evictions_total', 'Cache entries dropped to make room'),
+    ('expirations', 'cache_expirations_total', 'Cache entries dropped once their ttl passed'),
+)
+
+
+def register_cache_metrics(registry: MetricsRegistry, cache_name: str, cache: BaseCache) -> None:
+    """ Export stats of the cache, labelled with its name """
+    for stat, name, description in CACHE_STATS_METRICS:
+        registry.collected_counter(name=name, description=description, label_names=('cache',)).collect(
+            lambda stat=stat: getattr(cache.stats, stat),
+            cache=cache_name
+        )
@@ -0,0 +1,171 @@
+import bisect
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from typing import Callable
+
+# Seconds, default Prometheus client buckets
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.075, 0.1, 0.25, 0.5, 0.75, 1.0, 2.5, 5.0, 7.5, 10.0)
+
+
+def format_labels(names: tuple[str, ...], values: tuple[str, ...], extra: str = '') -> str:
+    pairs = [
+        '{}="{}"'.format(name, str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n'))
+        for name, value in zip(names, values)
+    ]
+
+    if extra:
+        pairs.append(extra)
+
+    return '{' + ','.join(pairs) + '}' if pairs else ''
+
+
+def format_value(value: float) -> str:
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+@dataclass
+class Metric(ABC):
+    name: str
+    description: str
+    label_names: tuple[str, ...] = ()
+
+    metric_type = 'untyped'
+
+    def label_values(self, labels: dict[str, str]) -> tuple[str, ...]:
+        return tuple(labels[name] for name in self.label_names)
+
+    @abstractmethod
+    def render_samples(self) -> list[str]:
+        ...
+
+    def render(self) -> str:
+        return '\n'.join([
+            f'# HELP {self.name} {self.description}',
+            f'# TYPE {self.name} {self.metric_type}',
+            *self.render_samples(),
+        ])
+
+
+@dataclass
+class Counter(Metric):
+    metric_type = 'counter'
+
+    _values: dict[tuple[str, ...], float] = field(default_factory=dict, init=False)
+
+    def inc(self, amount: float = 1, **labels: str) -> None:
+        key = self.label_values(labels)
+        self._values[key] = self._values.get(key, 0) + amount
+
+    def render_samples(self) -> list[str]:
+        return [
+            f'{self.name}{format_labels(self.label_names, key)} {format_value(value)}'
+            for key, value in self._values.items()
+        ]
+
+
+@dataclass
+class Gauge(Counter):
+    metric_type = 'gauge'
+
+    def dec(self, amount: float = 1, **labels: str) -> None:
+        self.inc(-amount, **labels)
+
+
+@dataclass
+class CollectedCounter(Metric):
+    """ Counter kept by a component itself, read on render """
+    metric_type = 'counter'
+
+    _readers: dict[tuple[str, ...], Callable[[], float]] = field(default_factory=dict, init=False)
+
+    def collect(self, read: Callable[[], float], **labels: str) -> None:
+        self._readers[self.label_values(labels)] = read
+
+    def render_samples(self) -> list[str]:
+        return [
+            f'{self.name}{format_labels(self.label_names, key)} {format_value(read())}'
+            for key, read in self._readers.items()
+        ]
+
+
+@dataclass
+class HistogramSeries:
+    bucket_counts: list[int]
+    total: float = 0.0
+    count: int = 0
+
+
+@dataclass
+class Histogram(Metric):
+    buckets: tuple[float, ...] = DEFAULT_BUCKETS
+
+    metric_type = 'histogram'
+
+    _series: dict[tuple[str, ...], HistogramSeries] = field(default_factory=dict, init=False)
+
+    def observe(self, value: float, **labels: str) -> None:
+        key = self.label_values(labels)
+        series = self._series.get(key)
+
+        if series is None:
+            series = self._series[key] = HistogramSeries(bucket_counts=[0] * len(self.buckets))
+
+        # Counts are stored per bucket and made cumulative on render
+        position = bisect.bisect_left(self.buckets, value)
+        if position < len(self.buckets):
+            series.bucket_counts[position] += 1
+
+        series.total += value
+        series.count += 1
+
+    def render_samples(self) -> list[str]:
+        samples = []
+
+        for key, series in self._series.items():
+            cumulative = 0
+
+            for bound, bucket_count in zip(self.buckets, series.bucket_counts):
+                cumulative += bucket_count
+                bucket_labels = format_labels(self.label_names, key, 'le="{}"'.format(bound))
+                samples.append(f'{self.name}_bucket{bucket_labels} {cumulative}')
+
+            bucket_labels = format_labels(self.label_names, key, 'le="+Inf"')
+            samples.extend([
+                f'{self.name}_bucket{bucket_labels} {series.count}',
+                f'{self.name}_sum{format_labels(self.label_names, key)} {format_value(series.total)}',
+                f'{self.name}_count{format_labels(self.label_names, key)} {series.count}',
+            ])
+
+        return samples
+
+
+@dataclass
+class MetricsRegistry:
+    """ In-process metrics of this worker, rendered in Prometheus text exposition format """
+    _metrics: dict[str, Metric] = field(default_factory=dict, init=False)
+
+    def _register(self, metric: Metric) -> Metric:
+        return self._metrics.setdefault(metric.name, metric)
+
+    def counter(self, name: str, description: str, label_names: tuple[str, ...] = ()) -> Counter:
+        return self._register(Counter(name=name, description=description, label_names=label_names))
+
+    def gauge(self, name: str, description: str, label_names: tuple[str, ...] = ()) -> Gauge:
+        return self._register(Gauge(name=name, description=description, label_names=label_names))
+
+    def collected_counter(self, name: str, description: str, label_names: tuple[str, ...] = ()) -> CollectedCounter:
+        return self._register(CollectedCounter(name=name, description=description, label_names=label_names))
+
+    def histogram(
+            self,
+            name: str,
+            description: str,
+            label_names: tuple[str, ...] = (),
+            buckets: tuple[float, ...] = DEFAULT_BUCKETS
+    ) -> Histogram:
+        return self._register(
+            Histogram(name=name, description=description, label_names=label_names, buckets=buckets)
+        )
+
+    def render(self) -> str:
+        return '\n'.join(metric.render() for metric in self._metrics.values()) + '\n'
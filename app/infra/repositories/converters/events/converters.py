@@ -0,0 +1,53 @@
+from dataclasses import fields
+from datetime import datetime
+from typing import get_type_hints
+
+from domain.events.base import BaseEvent
+from domain.events.tasks import NewTaskCreatedEvent
+from domain.events.users import NewUserCreatedEvent
+from domain.values.base import BaseValueObject
+
+# Events that can be stored in the outbox, by their stored event_type
+OUTBOX_EVENT_TYPES: dict[str, type[BaseEvent]] = {
+    event_type.__name__: event_type for event_type in (NewTaskCreatedEvent, NewUserCreatedEvent)
+}
+
+
+def convert_event_to_outbox_row(event: BaseEvent) -> dict:
+    payload = {}
+
+    for event_field in fields(event):
+        value = getattr(event, event_field.name)
+
+        if isinstance(value, BaseValueObject):
+            value = value.as_generic_type()
+        elif isinstance(value, datetime):
+            value = value.isoformat()
+
+        payload[event_field.name] = value
+
+    return {
+        'id': event.event_id,
+        'event_type': event.__class__.__name__,
+        'payload': payload,
+    }
+
+
+def convert_outbox_row_to_event(event_type: str, payload: dict) -> BaseEvent:
+    event_class = OUTBOX_EVENT_TYPES[event_type]
+    type_hints = get_type_hints(event_class)
+    values = {}
+
+    for event_field in fields(event_class):
+        value = payload[event_field.name]
+        value_type = type_hints[event_field.name]
+
+        # Stored events were built from validated values
+        if isinstance(value_type, type) and issubclass(value_type, BaseValueObject):
+            value = value_type.trusted(value)
+        elif value_type is datetime:
+            value = datetime.fromisoformat(value)
+
+        values[event_field.name] = value
+
+    return event_class(**values)
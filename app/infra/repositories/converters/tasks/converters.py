@@ -1,14 +1,65 @@
+from typing import Iterable
+
 from domain.entities.tasks import Task
 from domain.values.tasks import Title, TaskBody, Importance
 from infra.db.models.task import Tasks
+from infra.repositories.dtos.task import TaskReadModel, TASK_READ_FIELDS, TaskStatsReadModel, \
+    TaskImportanceStatsReadModel
 
 
 def convert_task_db_model_to_entity(task: Tasks) -> Task:
     return Task(
         oid=task.id,
-        title=Title(task.title),
-        task_body=TaskBody(task.task_body),
-        importance=Importance(task.importance),
+        title=Title.trusted(task.title),
+        task_body=TaskBody.trusted(task.task_body),
+        importance=Importance.trusted(task.importance),
         user_oid=task.user_id,
+        is_completed=task.is_completed,
+        created_at=task.created_at
+    )
+
+
+def convert_task_entity_to_db_row(task: Task) -> dict:
+    return {
+        'id': task.oid,
+        'title': task.title.as_generic_type(),
+        'task_body': task.task_body.as_generic_type(),
+        'importance': task.importance.as_generic_type(),
+        'user_id': task.user_oid,
+        'created_at': task.created_at,
+        'is_completed': task.is_completed,
+    }
+
+
+def convert_task_row_to_read_model(row, fields: tuple[str, ...] = TASK_READ_FIELDS) -> TaskReadModel:
+    mapping = row._mapping
+    return TaskReadModel(**{field: mapping[field] for field in fields})
+
+
+def convert_task_entity_to_read_model(task: Task, fields: tuple[str, ...] = TASK_READ_FIELDS) -> TaskReadModel:
+    model = TaskReadModel(
+        oid=task.oid,
+        title=task.title.as_generic_type(),
+        task_body=task.task_body.as_generic_type(),
+        importance=task.importance.as_generic_type(),
+        created_at=task.created_at,
         is_completed=task.is_completed
     )
+
+    if fields is TASK_READ_FIELDS:
+        return model
+
+    return TaskReadModel(**{field: model[field] for field in fields})
+
+
+def convert_task_counts_to_stats(counts: Iterable[tuple[int, int, int]]) -> TaskStatsReadModel:
+    """ Stats from (importance, total, completed) counts, importances without tasks are left out """
+    by_importance = [
+        TaskImportanceStatsReadModel(importance=importance, total=total, completed=completed, open=total - completed)
+        for importance, total, completed in sorted(counts)
+        if total
+    ]
+    total = sum(item['total'] for item in by_importance)
+    completed = sum(item['completed'] for item in by_importance)
+
+    return TaskStatsReadModel(total=total, completed=completed, open=total - completed, by_importance=by_importance)
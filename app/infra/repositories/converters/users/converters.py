@@ -17,8 +17,8 @@ def convert_user_entity_to_dbmodel(user: User) -> Users:
 def convert_user_db_model_to_entity(user: Users) -> User:
     return User(
         oid=user.id,
-        username=Username(user.name),
-        email=Email(user.email),
-        password=Password(user.password),
+        username=Username.trusted(user.name),
+        email=Email.trusted(user.email),
+        password=Password.trusted(user.password),
         created_at=user.created_at
     )
@@ -0,0 +1,46 @@
+from datetime import datetime
+from typing import TypedDict
+
+TASK_READ_FIELDS = ('oid', 'title', 'task_body', 'importance', 'created_at', 'is_completed')
+# Keyset pagination needs these whatever fields were requested
+TASK_PAGE_KEY_FIELDS = ('oid', 'created_at')
+
+
+class TaskReadModel(TypedDict, total=False):
+    """ Plain task row for read-only queries, serialized as is without entity hydration.
+    Holds only the requested fields when a sparse fieldset is asked for """
+    oid: str
+    title: str
+    task_body: str
+    importance: int
+    created_at: datetime
+    is_completed: bool
+
+
+def get_task_page_fields(
+        fields: tuple[str, ...] | None,
+        key_fields: tuple[str, ...] = TASK_PAGE_KEY_FIELDS
+) -> tuple[str, ...]:
+    if not fields:
+        return TASK_READ_FIELDS
+
+    return tuple(field for field in TASK_READ_FIELDS if field in fields or field in key_fields)
+
+
+class TaskSearchReadModel(TaskReadModel, total=False):
+    """ Task read model with relevance of the task to the search text, higher is better """
+    rank: float
+
+
+class TaskImportanceStatsReadModel(TypedDict):
+    importance: int
+    total: int
+    completed: int
+    open: int
+
+
+class TaskStatsReadModel(TypedDict):
+    total: int
+    completed: int
+    open: int
+    by_importance: list[TaskImportanceStatsReadModel]
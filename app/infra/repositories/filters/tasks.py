@@ -1,7 +1,120 @@
+import base64
+import binascii
+import json
 from dataclasses import dataclass
+from datetime import datetime, timezone
+from enum import Enum
 
+from infra.repositories.dtos.task import TASK_PAGE_KEY_FIELDS
 
-@dataclass
+
+def to_naive_utc(value: datetime | None) -> datetime | None:
+    """ Task timestamps are stored naive, aware bounds are compared in UTC """
+    if value is None or value.tzinfo is None:
+        return value
+
+    return value.astimezone(timezone.utc).replace(tzinfo=None)
+
+
+class TaskSort(str, Enum):
+    created_at = 'created_at'
+    created_at_desc = '-created_at'
+    # Most important first, then oldest first
+    importance_desc = '-importance'
+
+    @property
+    def key_fields(self) -> tuple[str, ...]:
+        """ Read model fields the page cursor is built from """
+        if self is TaskSort.importance_desc:
+            return TASK_PAGE_KEY_FIELDS + ('importance',)
+
+        return TASK_PAGE_KEY_FIELDS
+
+
+@dataclass(frozen=True)
+class TaskCursor:
+    """ Position after the last task of a page, in (created_at, oid) order,
+    importance is set for pages sorted by importance """
+    created_at: datetime
+    oid: str
+    importance: int | None = None
+
+    def encode(self) -> str:
+        key = [self.created_at.isoformat(), self.oid]
+
+        if self.importance is not None:
+            key.append(self.importance)
+
+        raw = json.dumps(key).encode()
+        return base64.urlsafe_b64encode(raw).decode().rstrip('=')
+
+    @classmethod
+    def decode(cls, cursor: str) -> 'TaskCursor':
+        try:
+            raw = base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4))
+            created_at, oid, *importance = json.loads(raw)
+
+            if len(importance) > 1:
+                raise ValueError('Unexpected task cursor key')
+
+            return cls(
+                created_at=to_naive_utc(datetime.fromisoformat(created_at)),
+                oid=str(oid),
+                importance=int(importance[0]) if importance else None
+            )
+        except (binascii.Error, UnicodeDecodeError, TypeError, ValueError) as error:
+            raise ValueError(f'Invalid task cursor: {cursor}') from error
+
+
+@dataclass(frozen=True)
 class GetTasksFilters:
     limit: int = 10
     offset: int = 0
+    cursor: TaskCursor | None = None
+    with_count: bool = True
+    # Read model fields to load, all of them when None
+    fields: tuple[str, ...] | None = None
+    sort: TaskSort = TaskSort.created_at
+    is_completed: bool | None = None
+    # Inclusive bounds
+    importance_min: int | None = None
+    importance_max: int | None = None
+    # From inclusive, to exclusive
+    created_from: datetime | None = None
+    created_to: datetime | None = None
+
+    @property
+    def is_filtered(self) -> bool:
+        return any(
+            value is not None for value in (
+                self.is_completed, self.importance_min, self.importance_max, self.created_from, self.created_to
+            )
+        )
+
+
+@dataclass(frozen=True)
+class TaskSearchCursor:
+    """ Position after the last search result of a page, in (rank desc, oid) order """
+    rank: float
+    oid: str
+
+    def encode(self) -> str:
+        raw = json.dumps([self.rank, self.oid]).encode()
+        return base64.urlsafe_b64encode(raw).decode().rstrip('=')
+
+    @classmethod
+    def decode(cls, cursor: str) -> 'TaskSearchCursor':
+        try:
+            raw = base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4))
+            rank, oid = json.loads(raw)
+            return cls(rank=float(rank), oid=str(oid))
+        except (binascii.Error, UnicodeDecodeError, TypeError, ValueError) as error:
+            raise ValueError(f'Invalid task search cursor: {cursor}') from error
+
+
+@dataclass(frozen=True)
+class SearchTasksFilters:
+    # Web search syntax: words, "quoted phrases", or, -excluded
+    text: str
+    limit: int = 10
+    cursor: TaskSearchCursor | None = None
@@ -0,0 +1,44 @@
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+
+from domain.events.base import BaseEvent
+
+
+@dataclass(frozen=True)
+class OutboxStatus:
+    pending: int = 0
+    # Events that used up their delivery attempts and are no longer claimed
+    dead: int = 0
+    # Age in seconds of the oldest pending event
+    lag: float = 0.0
+
+
+@dataclass
+class BaseOutboxRepository(ABC):
+    @abstractmethod
+    async def add_events(self, events: list[BaseEvent]) -> None:
+        """ Store events in the current transaction """
+        ...
+
+    @abstractmethod
+    async def claim_events(
+            self,
+            limit: int,
+            max_attempts: int,
+            event_ids: list[str] | None = None
+    ) -> list[BaseEvent]:
+        """ Oldest pending events, only of event_ids when given,
+        locked until the current transaction ends and skipped by other claimers """
+        ...
+
+    @abstractmethod
+    async def delete_events(self, event_ids: list[str]) -> None:
+        ...
+
+    @abstractmethod
+    async def record_failed_attempt(self, event_ids: list[str]) -> None:
+        ...
+
+    @abstractmethod
+    async def get_status(self, max_attempts: int) -> OutboxStatus:
+        ...
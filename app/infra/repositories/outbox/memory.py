@@ -0,0 +1,53 @@
+from dataclasses import dataclass, field
+from datetime import datetime
+
+from domain.events.base import BaseEvent
+from infra.repositories.outbox.base import BaseOutboxRepository, OutboxStatus
+
+
+@dataclass
+class MemoryOutboxRepository(BaseOutboxRepository):
+    _saved_events: list[BaseEvent] = field(
+        default_factory=list,
+        kw_only=True
+    )
+    _attempts: dict[str, int] = field(
+        default_factory=dict,
+        kw_only=True
+    )
+
+    async def add_events(self, events: list[BaseEvent]) -> None:
+        self._saved_events.extend(events)
+
+    async def claim_events(
+            self,
+            limit: int,
+            max_attempts: int,
+            event_ids: list[str] | None = None
+    ) -> list[BaseEvent]:
+        return [
+            event for event in self._saved_events
+            if self._attempts.get(event.event_id, 0) < max_attempts
+            and (event_ids is None or event.event_id in event_ids)
+        ][:limit]
+
+    async def delete_events(self, event_ids: list[str]) -> None:
+        deleted = set(event_ids)
+        self._saved_events = [event for event in self._saved_events if event.event_id not in deleted]
+
+    async def record_failed_attempt(self, event_ids: list[str]) -> None:
+        for event_id in event_ids:
+            self._attempts[event_id] = self._attempts.get(event_id, 0) + 1
+
+    async def get_status(self, max_attempts: int) -> OutboxStatus:
+        pending = [
+            event for event in self._saved_events
+            if self._attempts.get(event.event_id, 0) < max_attempts
+        ]
+        lag = (datetime.now() - min(event.created_at for event in pending)).total_seconds() if pending else 0.0
+
+        return OutboxStatus(
+            pending=len(pending),
+            dead=len(self._saved_events) - len(pending),
+            lag=lag
+        )
@@ -0,0 +1,78 @@
+from dataclasses import dataclass
+
+from sqlalchemy import select, delete, update, insert, func, any_, extract
+
+from domain.events.base import BaseEvent
+from infra.db.manager.base import BaseDatabaseManager
+from infra.db.models.outbox import Outbox
+from infra.repositories.converters.events.converters import (
+    convert_event_to_outbox_row, convert_outbox_row_to_event
+)
+from infra.repositories.outbox.base import BaseOutboxRepository, OutboxStatus
+
+
+@dataclass
+class PostgresOutboxRepository(BaseOutboxRepository):
+    _database_manager: BaseDatabaseManager
+
+    async def add_events(self, events: list[BaseEvent]) -> None:
+        if not events:
+            return
+
+        async with self._database_manager.session() as session:
+            await session.execute(
+                insert(Outbox),
+                [convert_event_to_outbox_row(event=event) for event in events]
+            )
+
+    async def claim_events(
+            self,
+            limit: int,
+            max_attempts: int,
+            event_ids: list[str] | None = None
+    ) -> list[BaseEvent]:
+        async with self._database_manager.session() as session:
+            # Rows locked by another relay are skipped, so relays on many nodes never share a batch
+            query = (
+                select(Outbox.event_type, Outbox.payload)
+                .where(Outbox.attempts < max_attempts)
+                .order_by(Outbox.created_at)
+                .limit(limit)
+                .with_for_update(skip_locked=True)
+            )
+
+            if event_ids is not None:
+                query = query.where(Outbox.id == any_(event_ids))
+            result = await session.execute(query)
+
+            return [
+                convert_outbox_row_to_event(event_type=row.event_type, payload=row.payload)
+                for row in result
+            ]
+
+    async def delete_events(self, event_ids: list[str]) -> None:
+        async with self._database_manager.session() as session:
+            await session.execute(delete(Outbox).where(Outbox.id == any_(event_ids)))
+
+    async def record_failed_attempt(self, event_ids: list[str]) -> None:
+        async with self._database_manager.session() as session:
+            await session.execute(
+                update(Outbox)
+                .where(Outbox.id == any_(event_ids))
+                .values(attempts=Outbox.attempts + 1)
+            )
+
+    async def get_status(self, max_attempts: int) -> OutboxStatus:
+        async with self._database_manager.session() as session:
+            is_pending = Outbox.attempts < max_attempts
+            query = select(
+                func.count().filter(is_pending).label('pending'),
+                func.count().filter(~is_pending).label('dead'),
+                extract(
+                    'epoch',
+                    func.timezone('utc', func.now()) - func.min(Outbox.created_at).filter(is_pending)
+                ).label('lag'),
+            )
+            row = (await session.execute(query)).one()
+
+            return OutboxStatus(pending=row.pending, dead=row.dead, lag=float(row.lag or 0.0))
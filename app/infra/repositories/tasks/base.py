@@ -1,8 +1,9 @@
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import Iterable
+from typing import AsyncIterator
 
-from application.api.tasks.filters import GetTasksFilters
+from infra.repositories.dtos.task import TaskReadModel, TaskSearchReadModel, TaskStatsReadModel
+from infra.repositories.filters.tasks import GetTasksFilters, SearchTasksFilters
 from domain.entities.tasks import Task
 
 
@@ -13,7 +14,43 @@ class BaseTaskRepository(ABC):
         ...
 
     @abstractmethod
-    async def get_tasks_by_user_oid(self, user_oid: str, filters: GetTasksFilters) -> Iterable[Task] | None:
+    async def create_tasks(self, tasks: list[Task]) -> None:
+        """ Insert many tasks with a single statement """
+        ...
+
+    @abstractmethod
+    async def copy_tasks(self, tasks: list[Task]) -> None:
+        """ Bulk load tasks, bypassing per-row statements """
+        ...
+
+    @abstractmethod
+    async def get_tasks_by_user_oid(
+            self,
+            user_oid: str,
+            filters: GetTasksFilters
+    ) -> tuple[list[TaskReadModel], int | None]:
+        """ Page of user tasks and total amount of user tasks, if filters ask for it.
+        Rows hold the requested fields plus oid and created_at, which the page cursor is built from """
+        ...
+
+    @abstractmethod
+    async def get_user_task(
+            self,
+            task_oid: str,
+            user_oid: str,
+            fields: tuple[str, ...] | None = None
+    ) -> TaskReadModel | None:
+        """ Task that belongs to user, as a read model with only the given fields """
+        ...
+
+    @abstractmethod
+    async def search_user_tasks(self, user_oid: str, filters: SearchTasksFilters) -> list[TaskSearchReadModel]:
+        """ Page of user tasks matching search text, most relevant first, ties in oid order """
+        ...
+
+    @abstractmethod
+    def stream_tasks_by_user_oid(self, user_oid: str, chunk_size: int) -> AsyncIterator[list[Task]]:
+        """ All user tasks in (created_at, oid) order, in chunks of at most chunk_size """
         ...
 
     @abstractmethod
@@ -21,9 +58,36 @@ class BaseTaskRepository(ABC):
         ...
 
     @abstractmethod
-    async def delete_task(self, task_oid: str) -> None:
+    async def delete_user_task(self, task_oid: str, user_oid: str) -> bool:
+        """ Delete task only if it belongs to user, return whether it was deleted """
+        ...
+
+    @abstractmethod
+    async def complete_user_task(self, task_oid: str, user_oid: str) -> bool:
+        """ Complete task only if it belongs to user, return whether it was updated """
+        ...
+
+    @abstractmethod
+    async def delete_user_tasks(self, task_oids: list[str], user_oid: str) -> list[str]:
+        """ Delete tasks that belong to user, return oids of deleted tasks """
+        ...
+
+    @abstractmethod
+    async def complete_user_tasks(self, task_oids: list[str], user_oid: str) -> list[str]:
+        """ Complete tasks that belong to user, return oids of updated tasks """
+        ...
+
+    @abstractmethod
+    async def get_existing_task_oids(self, task_oids: list[str]) -> set[str]:
+        ...
+
+    @abstractmethod
+    async def get_user_task_stats(self, user_oid: str) -> TaskStatsReadModel:
+        """ Total, completed and open task counts of user, overall and per importance """
         ...
 
     @abstractmethod
-    async def complete_user_task(self, task_oid: str, user_oid: str) -> None:
+    async def rebuild_task_counters(self, after_user_oid: str | None, batch_size: int) -> str | None:
+        """ Recount tasks of the next batch_size users after after_user_oid in oid order.
+        Return the last user oid of the batch, None once there are no users left """
         ...
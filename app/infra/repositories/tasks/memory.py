@@ -1,9 +1,48 @@
+import re
+from collections import defaultdict
 from dataclasses import dataclass, field
-from typing import Iterable
+from typing import AsyncIterator
 
+from infra.repositories.converters.tasks.converters import convert_task_entity_to_read_model, \
+    convert_task_counts_to_stats
+from infra.repositories.dtos.task import TaskReadModel, TASK_READ_FIELDS, get_task_page_fields, TaskSearchReadModel, \
+    TaskStatsReadModel
+from infra.repositories.filters.tasks import GetTasksFilters, SearchTasksFilters, TaskSort, TaskCursor
 from domain.entities.tasks import Task
 from infra.repositories.tasks.base import BaseTaskRepository
 
+# Same weights ts_rank gives to title (A) and body (B) words
+TITLE_WEIGHT = 1.0
+BODY_WEIGHT = 0.4
+
+
+def tokenize(text: str) -> list[str]:
+    return re.findall(r'\w+', text.lower())
+
+
+def get_importance(item: Task | TaskCursor) -> int:
+    return item.importance if isinstance(item, TaskCursor) else item.importance.as_generic_type()
+
+
+# Sort key of tasks and cursors, and whether pages go in descending key order
+TASK_SORT_KEYS = {
+    TaskSort.created_at: (lambda item: (item.created_at, item.oid), False),
+    TaskSort.created_at_desc: (lambda item: (item.created_at, item.oid), True),
+    TaskSort.importance_desc: (lambda item: (-get_importance(item), item.created_at, item.oid), False),
+}
+
+
+def matches_filters(task: Task, filters: GetTasksFilters) -> bool:
+    importance = task.importance.as_generic_type()
+
+    return (
+        (filters.is_completed is None or task.is_completed is filters.is_completed)
+        and (filters.importance_min is None or importance >= filters.importance_min)
+        and (filters.importance_max is None or importance <= filters.importance_max)
+        and (filters.created_from is None or task.created_at >= filters.created_from)
+        and (filters.created_to is None or task.created_at < filters.created_to)
+    )
+
 
 @dataclass
 class MemoryTaskRepository(BaseTaskRepository):
@@ -12,15 +51,194 @@ class MemoryTaskRepository(BaseTaskRepository):
         kw_only=True
     )
 
+    # Inverted index, word to weight of the word in each task that has it
+    _search_index: defaultdict[str, dict[str, float]] = field(
+        default_factory=lambda: defaultdict(dict),
+        init=False
+    )
+    _indexed_tasks: dict[str, Task] = field(default_factory=dict, init=False)
+
+    def __post_init__(self):
+        for task in self._saved_tasks:
+            self._index_task(task)
+
+    def _index_task(self, task: Task) -> None:
+        weights = defaultdict(float)
+
+        for word in tokenize(task.title.as_generic_type()):
+            weights[word] += TITLE_WEIGHT
+
+        for word in tokenize(task.task_body.as_generic_type()):
+            weights[word] += BODY_WEIGHT
+
+        for word, weight in weights.items():
+            self._search_index[word][task.oid] = weight
+
+        self._indexed_tasks[task.oid] = task
+
+    def _unindex_task(self, task: Task) -> None:
+        words = set(tokenize(task.title.as_generic_type())) | set(tokenize(task.task_body.as_generic_type()))
+
+        for word in words:
+            postings = self._search_index.get(word)
+
+            if postings is not None:
+                postings.pop(task.oid, None)
+
+                if not postings:
+                    del self._search_index[word]
+
+        self._indexed_tasks.pop(task.oid, None)
+
     async def create_task(self, task: Task):
         self._saved_tasks.append(task)
+        self._index_task(task)
+
+    async def create_tasks(self, tasks: list[Task]) -> None:
+        self._saved_tasks.extend(tasks)
+
+        for task in tasks:
+            self._index_task(task)
+
+    async def copy_tasks(self, tasks: list[Task]) -> None:
+        await self.create_tasks(tasks)
+
+    async def get_tasks_by_user_oid(
+            self,
+            user_oid: str,
+            filters: GetTasksFilters
+    ) -> tuple[list[TaskReadModel], int | None]:
+        tasks = [task for task in self._saved_tasks if task.user_oid == user_oid and matches_filters(task, filters)]
+        count = len(tasks) if filters.with_count else None
+
+        key, descending = TASK_SORT_KEYS[filters.sort]
+        tasks.sort(key=key, reverse=descending)
+
+        if filters.cursor:
+            position = key(filters.cursor)
+            tasks = [task for task in tasks if (key(task) < position if descending else key(task) > position)]
+        else:
+            tasks = tasks[filters.offset:]
+
+        fields = get_task_page_fields(filters.fields, key_fields=filters.sort.key_fields)
 
-    async def get_tasks_by_user_oid(self, user_oid: str) -> Iterable[Task]:
-        tasks = [task for task in self._saved_tasks if task.user_oid == user_oid]
+        return [convert_task_entity_to_read_model(task=task, fields=fields) for task in tasks[:filters.limit]], count
 
-        return tasks
+    async def get_user_task(
+            self,
+            task_oid: str,
+            user_oid: str,
+            fields: tuple[str, ...] | None = None
+    ) -> TaskReadModel | None:
+        task = await self.get_task_by_oid(task_oid=task_oid)
+
+        if not task or task.user_oid != user_oid:
+            return None
+
+        return convert_task_entity_to_read_model(task=task, fields=fields or TASK_READ_FIELDS)
+
+    async def search_user_tasks(self, user_oid: str, filters: SearchTasksFilters) -> list[TaskSearchReadModel]:
+        """ Every word has to match and -word excludes tasks with it, phrases and "or" are not supported """
+        words = tokenize(' '.join(word for word in filters.text.split() if not word.startswith('-')))
+        excluded = tokenize(' '.join(word[1:] for word in filters.text.split() if word.startswith('-')))
+
+        if not words:
+            return []
+
+        postings = [self._search_index.get(word, {}) for word in words]
+        # Walk the shortest postings list, the others are probed
+        candidates = set(min(postings, key=len)).difference(
+            *(self._search_index.get(word, {}) for word in excluded)
+        )
+
+        results = []
+
+        for task_oid in candidates:
+            if not all(task_oid in word_postings for word_postings in postings):
+                continue
+
+            task = self._indexed_tasks[task_oid]
+
+            if task.user_oid != user_oid:
+                continue
+
+            rank = sum(word_postings[task_oid] for word_postings in postings)
+
+            if filters.cursor and (-rank, task_oid) <= (-filters.cursor.rank, filters.cursor.oid):
+                continue
+
+            results.append((rank, task))
+
+        results.sort(key=lambda item: (-item[0], item[1].oid))
+
+        return [
+            TaskSearchReadModel(**convert_task_entity_to_read_model(task=task), rank=rank)
+            for rank, task in results[:filters.limit]
+        ]
+
+    async def stream_tasks_by_user_oid(self, user_oid: str, chunk_size: int) -> AsyncIterator[list[Task]]:
+        tasks = sorted(
+            (task for task in self._saved_tasks if task.user_oid == user_oid),
+            key=lambda task: (task.created_at, task.oid)
+        )
+
+        for start in range(0, len(tasks), chunk_size):
+            yield tasks[start:start + chunk_size]
 
     async def get_task_by_oid(self, task_oid: str) -> Task:
         for task in self._saved_tasks:
             if task.oid == task_oid:
                 return task
+
+    async def delete_user_task(self, task_oid: str, user_oid: str) -> bool:
+        task = await self.get_task_by_oid(task_oid=task_oid)
+
+        if not task or task.user_oid != user_oid:
+            return False
+
+        self._saved_tasks.remove(task)
+        self._unindex_task(task)
+
+        return True
+
+    async def complete_user_task(self, task_oid: str, user_oid: str) -> bool:
+        task = await self.get_task_by_oid(task_oid=task_oid)
+
+        if not task or task.user_oid != user_oid:
+            return False
+
+        task.is_completed = True
+
+        return True
+
+    async def delete_user_tasks(self, task_oids: list[str], user_oid: str) -> list[str]:
+        return [
+            task_oid for task_oid in task_oids
+            if await self.delete_user_task(task_oid=task_oid, user_oid=user_oid)
+        ]
+
+    async def complete_user_tasks(self, task_oids: list[str], user_oid: str) -> list[str]:
+        return [
+            task_oid for task_oid in task_oids
+            if await self.complete_user_task(task_oid=task_oid, user_oid=user_oid)
+        ]
+
+    async def get_existing_task_oids(self, task_oids: list[str]) -> set[str]:
+        return {task.oid for task in self._saved_tasks if task.oid in task_oids}
+
+    async def get_user_task_stats(self, user_oid: str) -> TaskStatsReadModel:
+        counts = defaultdict(lambda: [0, 0])
+
+        for task in self._saved_tasks:
+            if task.user_oid == user_oid:
+                count = counts[task.importance.as_generic_type()]
+                count[0] += 1
+                count[1] += task.is_completed
+
+        return convert_task_counts_to_stats(
+            (importance, total, completed) for importance, (total, completed) in counts.items()
+        )
+
+    async def rebuild_task_counters(self, after_user_oid: str | None, batch_size: int) -> str | None:
+        # Stats are counted from saved tasks, there are no counters to rebuild
+        return None
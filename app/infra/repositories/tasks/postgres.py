@@ -1,29 +1,147 @@
+from collections import defaultdict
 from dataclasses import dataclass
-from typing import Iterable
+from typing import AsyncIterator, Iterable
 
-from sqlalchemy import select, delete, update
-from sqlalchemy.ext.asyncio import async_sessionmaker
+from sqlalchemy import select, delete, update, insert, tuple_, func, any_, cast, or_, and_, Select, ColumnElement
+from sqlalchemy.dialects.postgresql import REGCONFIG, insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from application.api.tasks.filters import GetTasksFilters
+from infra.repositories.filters.tasks import GetTasksFilters, SearchTasksFilters, TaskSort
 from domain.entities.tasks import Task
 from infra.db.manager.base import BaseDatabaseManager
 from infra.db.models.task import Tasks
-from infra.repositories.converters.tasks.converters import convert_task_db_model_to_entity
+from infra.db.models.task_counters import TaskCounters
+from infra.db.models.user import Users
+from infra.repositories.converters.tasks.converters import (
+    convert_task_db_model_to_entity, convert_task_entity_to_db_row, convert_task_row_to_read_model,
+    convert_task_counts_to_stats
+)
+from infra.repositories.dtos.task import TaskReadModel, TASK_READ_FIELDS, get_task_page_fields, TaskSearchReadModel, \
+    TaskStatsReadModel
 from infra.repositories.tasks.base import BaseTaskRepository
 
+TASK_COPY_COLUMNS = ('id', 'title', 'task_body', 'importance', 'user_id', 'created_at', 'is_completed')
+
+# Read side selects plain columns, rows never become ORM objects or entities
+TASK_READ_COLUMNS = {
+    'oid': Tasks.id.label('oid'),
+    'title': Tasks.title,
+    'task_body': Tasks.task_body,
+    'importance': Tasks.importance,
+    'created_at': Tasks.created_at,
+    'is_completed': Tasks.is_completed,
+}
+
+
+def filter_user_tasks(query: Select, user_oid: str, filters: GetTasksFilters) -> Select:
+    query = query.where(Tasks.user_id == user_oid)
+
+    # Plain boolean predicates, so the planner can match them to partial indexes
+    if filters.is_completed is True:
+        query = query.where(Tasks.is_completed)
+    elif filters.is_completed is False:
+        query = query.where(~Tasks.is_completed)
+
+    if filters.importance_min is not None:
+        query = query.where(Tasks.importance >= filters.importance_min)
+    if filters.importance_max is not None:
+        query = query.where(Tasks.importance <= filters.importance_max)
+    if filters.created_from is not None:
+        query = query.where(Tasks.created_at >= filters.created_from)
+    if filters.created_to is not None:
+        query = query.where(Tasks.created_at < filters.created_to)
+
+    return query
+
+
+def order_user_tasks(query: Select, filters: GetTasksFilters) -> Select:
+    """ Sort in the order of a listing index and continue after the cursor, if there is one """
+    cursor = filters.cursor
+
+    if filters.sort is TaskSort.created_at_desc:
+        query = query.order_by(Tasks.created_at.desc(), Tasks.id.desc())
+
+        if cursor:
+            query = query.where(tuple_(Tasks.created_at, Tasks.id) < tuple_(cursor.created_at, cursor.oid))
+
+        return query
+
+    if filters.sort is TaskSort.importance_desc:
+        query = query.order_by(Tasks.importance.desc(), Tasks.created_at, Tasks.id)
+
+        if cursor:
+            # Leading bound keeps the scan on the index range, the rest skips rows of the cursor importance
+            query = query.where(
+                Tasks.importance <= cursor.importance,
+                or_(
+                    Tasks.importance < cursor.importance,
+                    tuple_(Tasks.created_at, Tasks.id) > tuple_(cursor.created_at, cursor.oid)
+                )
+            )
+
+        return query
+
+    query = query.order_by(Tasks.created_at, Tasks.id)
+
+    if cursor:
+        query = query.where(tuple_(Tasks.created_at, Tasks.id) > tuple_(cursor.created_at, cursor.oid))
+
+    return query
+
+
+def get_counters_lock_key(user_id: str | ColumnElement[str]) -> ColumnElement[int]:
+    """ Transaction advisory lock key that guards counters of a user """
+    return func.hashtextextended(user_id, 0)
+
+
+def get_counter_changes(tasks: Iterable[Task], sign: int = 1) -> list[tuple[str, int, int, int]]:
+    return [
+        (task.user_oid, task.importance.as_generic_type(), sign, sign * task.is_completed)
+        for task in tasks
+    ]
+
+
+async def update_task_counters(session: AsyncSession, changes: Iterable[tuple[str, int, int, int]]) -> None:
+    """ Add (user_id, importance, total, completed) deltas to the counters, in the transaction of the change """
+    deltas = defaultdict(lambda: [0, 0])
+
+    for user_id, importance, total, completed in changes:
+        delta = deltas[user_id, importance]
+        delta[0] += total
+        delta[1] += completed
+
+    # Rows go in key order, so concurrent writers lock counters in the same order and do not deadlock
+    rows = [
+        {'user_id': user_id, 'importance': importance, 'total': total, 'completed': completed}
+        for (user_id, importance), (total, completed) in sorted(deltas.items())
+        if total or completed
+    ]
+
+    if not rows:
+        return
+
+    # Writers share the lock, a rebuild of the user takes it exclusively, see rebuild_task_counters
+    for user_id in sorted({row['user_id'] for row in rows}):
+        await session.execute(select(func.pg_advisory_xact_lock_shared(get_counters_lock_key(user_id))))
+
+    query = pg_insert(TaskCounters).values(rows)
+    await session.execute(
+        query.on_conflict_do_update(
+            index_elements=[TaskCounters.user_id, TaskCounters.importance],
+            set_={
+                'total': TaskCounters.total + query.excluded.total,
+                'completed': TaskCounters.completed + query.excluded.completed,
+            }
+        )
+    )
+
 
 @dataclass
 class PostgresTaskRepository(BaseTaskRepository):
     _database_manager: BaseDatabaseManager
 
-    @property
-    async def get_session(self) -> async_sessionmaker:
-        return await self._database_manager.get_sessionmaker()
-
     async def get_task_by_oid(self, task_oid: str) -> Task | None:
-        session = await self.get_session
-
-        async with session.begin() as session:
+        async with self._database_manager.session() as session:
             query = select(Tasks).where(Tasks.id == task_oid)
             result = await session.execute(query)
             task = result.scalars().one_or_none()
@@ -34,9 +152,7 @@ class PostgresTaskRepository(BaseTaskRepository):
             return convert_task_db_model_to_entity(task=task)
 
     async def create_task(self, task: Task) -> None:
-        session = await self.get_session
-
-        async with session.begin() as session:
+        async with self._database_manager.session() as session:
             new_task = Tasks(
                 id=task.oid,
                 title=task.title.as_generic_type(),
@@ -47,35 +163,253 @@ class PostgresTaskRepository(BaseTaskRepository):
                 is_completed=task.is_completed
             )
             session.add(new_task)
+            await update_task_counters(session, get_counter_changes([task]))
+
+    async def create_tasks(self, tasks: list[Task]) -> None:
+        async with self._database_manager.session() as session:
+            # executemany of a Core insert is batched into multi-row VALUES by the dialect
+            await session.execute(
+                insert(Tasks),
+                [convert_task_entity_to_db_row(task=task) for task in tasks]
+            )
+            await update_task_counters(session, get_counter_changes(tasks))
+
+    async def copy_tasks(self, tasks: list[Task]) -> None:
+        if not tasks:
+            return
+
+        async with self._database_manager.session() as session:
+            # The asyncpg adapter sends BEGIN only before the first statement it executes itself,
+            # COPY goes straight to the driver connection. Counters are updated first so their
+            # statements open the transaction, and COPY runs inside it rather than in autocommit
+            await update_task_counters(session, get_counter_changes(tasks))
+
+            connection = await session.connection()
+            raw_connection = await connection.get_raw_connection()
+            await raw_connection.driver_connection.copy_records_to_table(
+                Tasks.__tablename__,
+                columns=TASK_COPY_COLUMNS,
+                records=[
+                    tuple(row[column] for column in TASK_COPY_COLUMNS)
+                    for row in map(convert_task_entity_to_db_row, tasks)
+                ]
+            )
+
+    async def get_tasks_by_user_oid(
+            self,
+            user_oid: str,
+            filters: GetTasksFilters
+    ) -> tuple[list[TaskReadModel], int | None]:
+        fields = get_task_page_fields(filters.fields, key_fields=filters.sort.key_fields)
+
+        async with self._database_manager.session() as session:
+            query = filter_user_tasks(
+                select(*(TASK_READ_COLUMNS[field] for field in fields)),
+                user_oid=user_oid,
+                filters=filters
+            )
+            query = order_user_tasks(query, filters=filters).limit(filters.limit)
+
+            if not filters.cursor:
+                query = query.offset(filters.offset)
+
+            if not filters.with_count:
+                result = await session.execute(query)
+                return [convert_task_row_to_read_model(row=row, fields=fields) for row in result], None
+
+            # Total is an uncorrelated subquery, so it rides along with the page in one round trip
+            count_query = filter_user_tasks(
+                select(func.count()).select_from(Tasks),
+                user_oid=user_oid,
+                filters=filters
+            )
+            result = await session.execute(query.add_columns(count_query.scalar_subquery().label('total')))
+            rows = result.all()
 
-            await session.commit()
+            if rows:
+                count = rows[0].total
+            elif filters.cursor or filters.offset:
+                count = await session.scalar(count_query)
+            else:
+                count = 0
 
-    async def get_tasks_by_user_oid(self, user_oid: str, filters: GetTasksFilters) -> Iterable[Task] | None:
-        session = await self.get_session
+            return [convert_task_row_to_read_model(row=row, fields=fields) for row in rows], count
 
-        async with session.begin() as session:
-            query = select(Tasks).where(Tasks.user_id == user_oid).limit(filters.limit).offset(filters.offset)
+    async def get_user_task(
+            self,
+            task_oid: str,
+            user_oid: str,
+            fields: tuple[str, ...] | None = None
+    ) -> TaskReadModel | None:
+        fields = fields or TASK_READ_FIELDS
+
+        async with self._database_manager.session() as session:
+            query = (
+                select(*(TASK_READ_COLUMNS[field] for field in fields))
+                .where(Tasks.id == task_oid, Tasks.user_id == user_oid)
+            )
             result = await session.execute(query)
-            tasks = result.scalars().all()
+            row = result.one_or_none()
 
-            if not tasks:
+            if not row:
                 return None
 
-            return [convert_task_db_model_to_entity(task=task) for task in tasks]
+            return convert_task_row_to_read_model(row=row, fields=fields)
+
+    async def search_user_tasks(self, user_oid: str, filters: SearchTasksFilters) -> list[TaskSearchReadModel]:
+        # Same text search config as the generated column, otherwise the GIN index is not used
+        text_query = func.websearch_to_tsquery(cast('simple', REGCONFIG), filters.text)
+        rank = func.ts_rank(Tasks.search_vector, text_query)
+
+        async with self._database_manager.session() as session:
+            # Index narrows rows down to matches, only matching rows are ranked and sorted
+            query = (
+                select(*TASK_READ_COLUMNS.values(), rank.label('rank'))
+                .where(Tasks.user_id == user_oid, Tasks.search_vector.bool_op('@@')(text_query))
+                .order_by(rank.desc(), Tasks.id)
+                .limit(filters.limit)
+            )
+
+            if filters.cursor:
+                query = query.where(
+                    or_(
+                        rank < filters.cursor.rank,
+                        and_(rank == filters.cursor.rank, Tasks.id > filters.cursor.oid)
+                    )
+                )
 
-    async def delete_task(self, task_oid: str) -> None:
-        session = await self.get_session
+            result = await session.execute(query)
+
+            return [
+                TaskSearchReadModel(**convert_task_row_to_read_model(row=row), rank=row.rank)
+                for row in result
+            ]
+
+    async def stream_tasks_by_user_oid(self, user_oid: str, chunk_size: int) -> AsyncIterator[list[Task]]:
+        async with self._database_manager.session() as session:
+            query = (
+                select(Tasks)
+                .where(Tasks.user_id == user_oid)
+                .order_by(Tasks.created_at, Tasks.id)
+                .execution_options(yield_per=chunk_size)
+            )
+            # Server-side cursor, only one chunk of rows is held in memory at a time
+            result = await session.stream_scalars(query)
 
-        async with session.begin() as session:
-            query = delete(Tasks).where(Tasks.id == task_oid)
-            await session.execute(query)
-            await session.commit()
+            async for tasks in result.partitions(chunk_size):
+                yield [convert_task_db_model_to_entity(task=task) for task in tasks]
 
-    async def complete_user_task(self, task_oid: str, user_oid: str) -> None:
-        session = await self.get_session
+    async def delete_user_task(self, task_oid: str, user_oid: str) -> bool:
+        async with self._database_manager.session() as session:
+            query = (
+                delete(Tasks)
+                .where(Tasks.id == task_oid, Tasks.user_id == user_oid)
+                .returning(Tasks.importance, Tasks.is_completed)
+            )
+            result = await session.execute(query)
+            deleted = result.all()
 
-        async with session.begin() as session:
-            query = update(Tasks).where(Tasks.id == task_oid, Tasks.user_id == user_oid).values(is_completed=True)
-            await session.execute(query)
-            await session.commit()
+            await update_task_counters(
+                session, [(user_oid, importance, -1, -is_completed) for importance, is_completed in deleted]
+            )
+
+            return bool(deleted)
+
+    async def complete_user_task(self, task_oid: str, user_oid: str) -> bool:
+        return bool(await self.complete_user_tasks(task_oids=[task_oid], user_oid=user_oid))
+
+    async def delete_user_tasks(self, task_oids: list[str], user_oid: str) -> list[str]:
+        async with self._database_manager.session() as session:
+            query = (
+                delete(Tasks)
+                .where(Tasks.id == any_(task_oids), Tasks.user_id == user_oid)
+                .returning(Tasks.id, Tasks.importance, Tasks.is_completed)
+            )
+            result = await session.execute(query)
+            deleted = result.all()
+
+            await update_task_counters(
+                session, [(user_oid, importance, -1, -is_completed) for _, importance, is_completed in deleted]
+            )
+
+            return [task_oid for task_oid, _, _ in deleted]
+
+    async def complete_user_tasks(self, task_oids: list[str], user_oid: str) -> list[str]:
+        async with self._database_manager.session() as session:
+            # Rows are locked before the update, so the state they had is known and counted once
+            previous = (
+                select(Tasks.id, Tasks.is_completed)
+                .where(Tasks.id == any_(task_oids), Tasks.user_id == user_oid)
+                .with_for_update()
+                .cte('previous')
+            )
+            query = (
+                update(Tasks)
+                .where(Tasks.id == previous.c.id)
+                .values(is_completed=True)
+                .returning(Tasks.id, Tasks.importance, previous.c.is_completed)
+            )
+            result = await session.execute(query)
+            updated = result.all()
+
+            await update_task_counters(
+                session,
+                [(user_oid, importance, 0, 1) for _, importance, was_completed in updated if not was_completed]
+            )
+
+            return [task_oid for task_oid, _, _ in updated]
+
+    async def get_existing_task_oids(self, task_oids: list[str]) -> set[str]:
+        async with self._database_manager.session() as session:
+            query = select(Tasks.id).where(Tasks.id == any_(task_oids))
+            result = await session.execute(query)
+
+            return set(result.scalars().all())
+
+    async def get_user_task_stats(self, user_oid: str) -> TaskStatsReadModel:
+        async with self._database_manager.session() as session:
+            query = (
+                select(TaskCounters.importance, TaskCounters.total, TaskCounters.completed)
+                .where(TaskCounters.user_id == user_oid)
+            )
+            result = await session.execute(query)
+
+            return convert_task_counts_to_stats(result.tuples())
+
+    async def rebuild_task_counters(self, after_user_oid: str | None, batch_size: int) -> str | None:
+        async with self._database_manager.session() as session:
+            users_query = select(Users.id).order_by(Users.id).limit(batch_size)
+
+            if after_user_oid is not None:
+                users_query = users_query.where(Users.id > after_user_oid)
+
+            user_oids = list((await session.scalars(users_query)).all())
+
+            if not user_oids:
+                return None
+
+            # Writers of these users can not touch their counters until the recount commits, so every
+            # task change is either seen by the recount or added to the counters after it.
+            # Volatile select list is evaluated after sorting, so locks are taken in user oid order
+            await session.execute(
+                select(func.pg_advisory_xact_lock(get_counters_lock_key(Users.id)))
+                .where(Users.id == any_(user_oids))
+                .order_by(Users.id)
+            )
+            await session.execute(delete(TaskCounters).where(TaskCounters.user_id == any_(user_oids)))
+
+            counts_query = (
+                select(
+                    Tasks.user_id,
+                    Tasks.importance,
+                    func.count().label('total'),
+                    func.count().filter(Tasks.is_completed).label('completed')
+                )
+                .where(Tasks.user_id == any_(user_oids))
+                .group_by(Tasks.user_id, Tasks.importance)
+            )
+            await session.execute(
+                insert(TaskCounters).from_select(['user_id', 'importance', 'total', 'completed'], counts_query)
+            )
 
+            return user_oids[-1]
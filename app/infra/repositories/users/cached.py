@@ -0,0 +1,64 @@
+from dataclasses import dataclass
+
+from domain.entities.users import User
+from infra.cache.base import BaseCache, CacheStats
+from infra.repositories.users.base import BaseUserRepository
+
+
+@dataclass
+class CachedUserRepository(BaseUserRepository):
+    """ Read-through cache of user entities keyed by oid and by email """
+    _user_repository: BaseUserRepository
+    _cache: BaseCache
+
+    @property
+    def cache_stats(self) -> CacheStats:
+        return self._cache.stats
+
+    def _remember(self, user: User) -> None:
+        self._cache.set(('oid', user.oid), user)
+        self._cache.set(('email', user.email.as_generic_type()), user)
+
+    def _forget(self, user: User) -> None:
+        self._cache.invalidate(('oid', user.oid))
+        self._cache.invalidate(('email', user.email.as_generic_type()))
+
+    async def get_user_by_oid(self, user_oid: str) -> User | None:
+        user = self._cache.get(('oid', user_oid))
+
+        if user is None:
+            user = await self._user_repository.get_user_by_oid(user_oid=user_oid)
+
+            if user:
+                self._remember(user)
+
+        return user
+
+    async def get_user_by_email(self, email: str) -> User | None:
+        user = self._cache.get(('email', email))
+
+        if user is None:
+            user = await self._user_repository.get_user_by_email(email=email)
+
+            if user:
+                self._remember(user)
+
+        return user
+
+    async def check_user_by_email(self, email: str) -> bool:
+        if self._cache.get(('email', email)) is not None:
+            return True
+
+        return await self._user_repository.check_user_by_email(email=email)
+
+    async def register_user(self, new_user: User) -> None:
+        await self._user_repository.register_user(new_user=new_user)
+
+    async def delete_user(self, user_oid: str) -> None:
+        # Resolved through the cache so the email key can be dropped as well
+        user = await self.get_user_by_oid(user_oid=user_oid)
+
+        await self._user_repository.delete_user(user_oid=user_oid)
+
+        if user:
+            self._forget(user)
@@ -33,3 +33,5 @@ class MemoryUserRepository(BaseUserRepository):
                 return user
         return None
 
+    async def delete_user(self, user_oid: str) -> None:
+        self._saved_users = [user for user in self._saved_users if user.oid != user_oid]
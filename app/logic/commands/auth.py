@@ -5,6 +5,7 @@ import jwt
 
 from domain.entities.users import User
 from domain.services.user.password.base import BasePasswordManager
+from infra.db.manager.unit_of_work import BaseUnitOfWork, begin_isolated
 from infra.repositories.users.base import BaseUserRepository
 from logic.commands.base import BaseCommand, BaseCommandHandler
 from logic.exceptions.users import WrongPasswordException, IncorrectEmailOrPasswordException
@@ -21,14 +22,17 @@ class AuthenticateUserCommand(BaseCommand):
 class AuthenticateUserCommandHandler(BaseCommandHandler):
     user_repository: BaseUserRepository
     password_hasher: BasePasswordManager
+    unit_of_work: BaseUnitOfWork | None = None
 
     async def handle(self, command: AuthenticateUserCommand) -> User:
-        user = await self.user_repository.get_user_by_email(email=command.email)
+        # Connection goes back to the pool before the password is checked
+        async with begin_isolated(self.unit_of_work):
+            user = await self.user_repository.get_user_by_email(email=command.email)
 
         if not user:
             raise IncorrectEmailOrPasswordException()
 
-        if not self.password_hasher.verify_password(
+        if not await self.password_hasher.verify_password_async(
                 raw_password=command.password,
                 hashed_password=user.password.as_generic_type()
         ):
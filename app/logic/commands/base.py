@@ -7,7 +7,9 @@ from logic.mediator.event import EventMediator
 
 @dataclass(frozen=True)
 class BaseCommand:
-    ...
+    def invalidates(self) -> tuple[str, ...]:
+        """ Cache tags of query results that are stale once this command succeeds """
+        return ()
 
 
 CT = TypeVar('CT', bound=BaseCommand)
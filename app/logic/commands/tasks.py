@@ -1,12 +1,19 @@
-from dataclasses import dataclass
+import json
+from dataclasses import dataclass, field
+from typing import AsyncIterator, TextIO
 
 from domain.entities.tasks import Task
+from domain.exceptions.base import ApplicationException
+from domain.exceptions.tasks import InvalidImportanceException
 from domain.values.tasks import Title, TaskBody, Importance
+from infra.db.manager.unit_of_work import BaseUnitOfWork, begin_isolated
 from infra.repositories.tasks.base import BaseTaskRepository
 from infra.repositories.users.base import BaseUserRepository
 from logic.commands.base import BaseCommand, BaseCommandHandler
-from logic.exceptions.tasks import TaskNotFoundException, TaskAccessDeniedException, GetTasksAccessDenied
+from logic.events.bus import BaseEventBus
+from logic.exceptions.tasks import TaskNotFoundException, TaskAccessDeniedException, InvalidImportFieldException
 from logic.exceptions.users import UserNotFoundByIdException
+from logic.queries.tasks import get_user_tasks_cache_tag
 
 
 @dataclass(frozen=True)
@@ -16,11 +23,15 @@ class CreateTaskCommand(BaseCommand):
     importance: int
     user_oid: str
 
+    def invalidates(self) -> tuple[str, ...]:
+        return (get_user_tasks_cache_tag(self.user_oid),)
+
 
 @dataclass(frozen=True)
 class CreateTaskCommandHandler(BaseCommandHandler):
     task_repository: BaseTaskRepository
     user_repository: BaseUserRepository
+    event_bus: BaseEventBus
 
     async def handle(self, command: CreateTaskCommand) -> Task:
         user = await self.user_repository.get_user_by_oid(user_oid=command.user_oid)
@@ -40,36 +51,93 @@ class CreateTaskCommandHandler(BaseCommandHandler):
         )
 
         await self.task_repository.create_task(task=new_task)
+        await self.event_bus.publish(new_task.pull_events())
 
         return new_task
 
 
+@dataclass(frozen=True)
+class CreateTaskItem:
+    title: str
+    task_body: str
+    importance: int
+
+
+@dataclass(frozen=True)
+class TaskBatchError:
+    index: int
+    error: str
+
+
+@dataclass(frozen=True)
+class CreateTasksBatchResult:
+    created: list[Task] = field(default_factory=list)
+    errors: list[TaskBatchError] = field(default_factory=list)
+
+
+@dataclass(frozen=True)
+class CreateTasksBatchCommand(BaseCommand):
+    items: list[CreateTaskItem]
+    user_oid: str
+
+    def invalidates(self) -> tuple[str, ...]:
+        return (get_user_tasks_cache_tag(self.user_oid),)
+
+
+@dataclass(frozen=True)
+class CreateTasksBatchCommandHandler(BaseCommandHandler):
+    task_repository: BaseTaskRepository
+    event_bus: BaseEventBus
+
+    async def handle(self, command: CreateTasksBatchCommand) -> CreateTasksBatchResult:
+        result = CreateTasksBatchResult()
+
+        for index, item in enumerate(command.items):
+            try:
+                task = Task.create_task(
+                    title=Title(item.title),
+                    task_body=TaskBody(item.task_body),
+                    importance=Importance(item.importance),
+                    user_oid=command.user_oid
+                )
+            except ApplicationException as error:
+                result.errors.append(TaskBatchError(index=index, error=error.message))
+                continue
+
+            result.created.append(task)
+
+        if result.created:
+            await self.task_repository.create_tasks(tasks=result.created)
+            await self.event_bus.publish(event for task in result.created for event in task.pull_events())
+
+        return result
+
+
 @dataclass(frozen=True)
 class DeleteTaskCommand(BaseCommand):
     task_oid: str
     user_oid: str
 
+    def invalidates(self) -> tuple[str, ...]:
+        return (get_user_tasks_cache_tag(self.user_oid),)
+
 
 @dataclass(frozen=True)
 class DeleteTaskCommandHandler(BaseCommandHandler):
     task_repository: BaseTaskRepository
-    user_repository: BaseUserRepository
 
     async def handle(self, command: DeleteTaskCommand) -> None:
-        user = await self.user_repository.get_user_by_oid(user_oid=command.user_oid)
-
-        if not user:
-            raise UserNotFoundByIdException(user_oid=command.user_oid)
-
-        task = await self.task_repository.get_task_by_oid(task_oid=command.task_oid)
+        if await self.task_repository.delete_user_task(
+                task_oid=command.task_oid,
+                user_oid=command.user_oid
+        ):
+            return
 
-        if not task:
+        # Nothing deleted, probe once to tell a missing task from a foreign one
+        if not await self.task_repository.get_task_by_oid(task_oid=command.task_oid):
             raise TaskNotFoundException(task_oid=command.task_oid)
 
-        if not task.user_oid == command.user_oid:
-            raise TaskAccessDeniedException()
-
-        await self.task_repository.delete_task(task_oid=command.task_oid)
+        raise TaskAccessDeniedException()
 
 
 @dataclass(frozen=True)
@@ -77,27 +145,207 @@ class CompleteTaskCommand(BaseCommand):
     task_oid: str
     user_oid: str
 
+    def invalidates(self) -> tuple[str, ...]:
+        return (get_user_tasks_cache_tag(self.user_oid),)
+
 
 @dataclass(frozen=True)
 class CompleteTaskCommandHandler(BaseCommandHandler):
     task_repository: BaseTaskRepository
-    user_repository: BaseUserRepository
 
     async def handle(self, command: CompleteTaskCommand) -> None:
-        user = await self.user_repository.get_user_by_oid(user_oid=command.user_oid)
+        if await self.task_repository.complete_user_task(
+                task_oid=command.task_oid,
+                user_oid=command.user_oid
+        ):
+            return
 
-        if not user:
-            raise UserNotFoundByIdException(user_oid=command.user_oid)
+        # Nothing updated, probe once to tell a missing task from a foreign one
+        if not await self.task_repository.get_task_by_oid(task_oid=command.task_oid):
+            raise TaskNotFoundException(task_oid=command.task_oid)
 
-        task = await self.task_repository.get_task_by_oid(task_oid=command.task_oid)
+        raise TaskAccessDeniedException()
+
+
+@dataclass(frozen=True)
+class TasksBatchResult:
+    affected: list[str] = field(default_factory=list)
+    denied: list[str] = field(default_factory=list)
+    missing: list[str] = field(default_factory=list)
+
+
+async def classify_batch_result(
+        task_repository: BaseTaskRepository,
+        task_oids: list[str],
+        affected: list[str]
+) -> TasksBatchResult:
+    """ Split oids that were not affected into foreign and missing ones with a single probe """
+    affected_oids = set(affected)
+    rest = [task_oid for task_oid in task_oids if task_oid not in affected_oids]
+    existing = await task_repository.get_existing_task_oids(task_oids=rest) if rest else set()
+
+    return TasksBatchResult(
+        affected=[task_oid for task_oid in task_oids if task_oid in affected_oids],
+        denied=[task_oid for task_oid in rest if task_oid in existing],
+        missing=[task_oid for task_oid in rest if task_oid not in existing]
+    )
+
+
+@dataclass(frozen=True)
+class CompleteTasksBatchCommand(BaseCommand):
+    task_oids: list[str]
+    user_oid: str
+
+    def invalidates(self) -> tuple[str, ...]:
+        return (get_user_tasks_cache_tag(self.user_oid),)
 
-        if not task:
-            raise TaskNotFoundException(task_oid=command.task_oid)
 
-        if task.user_oid != user.oid:
-            raise TaskAccessDeniedException()
+@dataclass(frozen=True)
+class CompleteTasksBatchCommandHandler(BaseCommandHandler):
+    task_repository: BaseTaskRepository
 
-        await self.task_repository.complete_user_task(
-            task_oid=command.task_oid,
+    async def handle(self, command: CompleteTasksBatchCommand) -> TasksBatchResult:
+        task_oids = list(dict.fromkeys(command.task_oids))
+        affected = await self.task_repository.complete_user_tasks(
+            task_oids=task_oids,
             user_oid=command.user_oid
         )
+
+        return await classify_batch_result(self.task_repository, task_oids=task_oids, affected=affected)
+
+
+@dataclass(frozen=True)
+class DeleteTasksBatchCommand(BaseCommand):
+    task_oids: list[str]
+    user_oid: str
+
+    def invalidates(self) -> tuple[str, ...]:
+        return (get_user_tasks_cache_tag(self.user_oid),)
+
+
+@dataclass(frozen=True)
+class DeleteTasksBatchCommandHandler(BaseCommandHandler):
+    task_repository: BaseTaskRepository
+
+    async def handle(self, command: DeleteTasksBatchCommand) -> TasksBatchResult:
+        task_oids = list(dict.fromkeys(command.task_oids))
+        affected = await self.task_repository.delete_user_tasks(
+            task_oids=task_oids,
+            user_oid=command.user_oid
+        )
+
+        return await classify_batch_result(self.task_repository, task_oids=task_oids, affected=affected)
+
+
+# Accepted spellings of is_completed in imported rows
+IMPORT_BOOLEANS = {'': False, '0': False, 'false': False, '1': True, 'true': True}
+
+
+@dataclass(frozen=True)
+class ImportTaskRow:
+    """ Parsed input row, error is set when the row could not be parsed at all """
+    number: int
+    data: dict | None = None
+    error: str | None = None
+
+
+@dataclass
+class TasksImportResult:
+    imported: int = 0
+    rejected: int = 0
+
+
+@dataclass(frozen=True)
+class ImportTasksCommand(BaseCommand):
+    rows: AsyncIterator[ImportTaskRow]
+    user_oid: str
+    rejects: TextIO
+    batch_size: int = 5000
+
+    def invalidates(self) -> tuple[str, ...]:
+        return (get_user_tasks_cache_tag(self.user_oid),)
+
+
+@dataclass(frozen=True)
+class ImportTasksCommandHandler(BaseCommandHandler):
+    """ Every batch is committed on its own, so an upload does not hold a connection
+    while the client is still sending it, and batches already copied stay imported """
+    task_repository: BaseTaskRepository
+    user_repository: BaseUserRepository
+    unit_of_work: BaseUnitOfWork | None = None
+
+    async def _copy_batch(self, batch: list[Task], result: TasksImportResult) -> None:
+        async with begin_isolated(self.unit_of_work):
+            await self.task_repository.copy_tasks(tasks=batch)
+
+        # Counted once committed
+        result.imported += len(batch)
+
+    @staticmethod
+    def _convert_row(row: ImportTaskRow, user_oid: str) -> Task:
+        title = row.data.get('title')
+        task_body = row.data.get('task_body')
+        importance = row.data.get('importance')
+        is_completed = row.data.get('is_completed', False)
+
+        # Rows come from untrusted files, values are checked before value objects see them
+        if not isinstance(title, str):
+            raise InvalidImportFieldException(field='title', expected='a string')
+
+        if not isinstance(task_body, str):
+            raise InvalidImportFieldException(field='task_body', expected='a string')
+
+        if importance in (None, ''):
+            importance = None
+        elif isinstance(importance, str) and importance.strip().isdigit():
+            importance = int(importance)
+        elif not isinstance(importance, int) or isinstance(importance, bool):
+            raise InvalidImportanceException(text=str(importance))
+
+        if isinstance(is_completed, str) and is_completed.strip().lower() in IMPORT_BOOLEANS:
+            is_completed = IMPORT_BOOLEANS[is_completed.strip().lower()]
+        elif not isinstance(is_completed, bool):
+            raise InvalidImportFieldException(field='is_completed', expected='true or false')
+
+        return Task(
+            title=Title(title),
+            task_body=TaskBody(task_body),
+            importance=Importance(importance),
+            user_oid=user_oid,
+            is_completed=is_completed
+        )
+
+    def _reject(self, command: ImportTasksCommand, row: ImportTaskRow, error: str) -> None:
+        command.rejects.write(json.dumps({'line': row.number, 'error': error, 'row': row.data}) + '\n')
+
+    async def handle(self, command: ImportTasksCommand) -> TasksImportResult:
+        async with begin_isolated(self.unit_of_work):
+            user = await self.user_repository.get_user_by_oid(user_oid=command.user_oid)
+
+        if not user:
+            raise UserNotFoundByIdException(user_oid=command.user_oid)
+
+        result = TasksImportResult()
+        batch: list[Task] = []
+
+        async for row in command.rows:
+            if row.error:
+                self._reject(command, row, row.error)
+                result.rejected += 1
+                continue
+
+            try:
+                batch.append(self._convert_row(row, user_oid=command.user_oid))
+            except ApplicationException as error:
+                self._reject(command, row, error.message)
+                result.rejected += 1
+                continue
+
+            if len(batch) >= command.batch_size:
+                await self._copy_batch(batch, result)
+                batch = []
+
+        if batch:
+            await self._copy_batch(batch, result)
+
+        return result
@@ -7,7 +7,9 @@ from domain.values.users import Username, Password, Email
 from infra.repositories.converters.users.converters import convert_user_entity_to_dbmodel
 from infra.repositories.users.base import BaseUserRepository
 from logic.commands.base import BaseCommand, BaseCommandHandler
-from logic.exceptions.users import UserWithThatEmailAlreadyExists, UserNotFoundByEmailException
+from logic.events.bus import BaseEventBus
+from logic.exceptions.users import UserWithThatEmailAlreadyExists, UserNotFoundByIdException
+from logic.queries.tasks import get_user_tasks_cache_tag
 
 
 @dataclass(frozen=True)
@@ -21,12 +23,15 @@ class CreateUserCommand(BaseCommand):
 class CreateUserCommandHandler(BaseCommandHandler):
     user_repository: BaseUserRepository
     password_hasher: BasePasswordManager
+    event_bus: BaseEventBus
 
     async def handle(self, command: CreateUserCommand) -> User:
+        # Hashed before the repository is touched, so no connection is held while hashing
+        password = Password(value=await self.password_hasher.hash_password_async(command.password))
+
         if await self.user_repository.check_user_by_email(email=command.email):
             raise UserWithThatEmailAlreadyExists(text=command.email)
 
-        password = Password(value=self.password_hasher.hash_password(command.password))
         username = Username(value=command.username)
         email = Email(value=command.email)
 
@@ -37,6 +42,7 @@ class CreateUserCommandHandler(BaseCommandHandler):
         )
 
         await self.user_repository.register_user(new_user=convert_user_entity_to_dbmodel(user=new_user))
+        await self.event_bus.publish(new_user.pull_events())
 
         return new_user
 
@@ -45,6 +51,9 @@ class CreateUserCommandHandler(BaseCommandHandler):
 class DeleteUserCommand(BaseCommand):
     user_oid: str
 
+    def invalidates(self) -> tuple[str, ...]:
+        return (get_user_tasks_cache_tag(self.user_oid),)
+
 
 @dataclass(frozen=True)
 class DeleteUserCommandHandler(BaseCommandHandler):
@@ -54,6 +63,7 @@ class DeleteUserCommandHandler(BaseCommandHandler):
         user = await self.user_repository.get_user_by_oid(user_oid=command.user_oid)
 
         if not user:
-            raise UserNotFoundByEmailException(email=user.email)
+            raise UserNotFoundByIdException(user_oid=command.user_oid)
 
+        # Cached user repository drops both oid and email entries here
         await self.user_repository.delete_user(user_oid=command.user_oid)
@@ -0,0 +1,161 @@
+import asyncio
+import logging
+import time
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field, replace
+from functools import partial
+from typing import Iterable
+
+from domain.events.base import BaseEvent
+from domain.exceptions.base import ApplicationException
+from infra.db.manager.unit_of_work import BaseUnitOfWork
+from logic.mediator.event import EventMediator
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class EventBusStats:
+    queued: int = 0
+    max_size: int = 0
+    workers: int = 0
+    published: int = 0
+    delivered: int = 0
+    failed: int = 0
+    dropped: int = 0
+    batches: int = 0
+    # Publishers that found the queue full and had to wait for room
+    blocked: int = 0
+    total_blocked: float = 0.0
+    max_blocked: float = 0.0
+    # Durable buses only: events given up on, age in seconds of the oldest undelivered event
+    dead: int = 0
+    lag: float = 0.0
+
+    def record_blocked(self, wait: float) -> None:
+        self.blocked += 1
+        self.total_blocked += wait
+        self.max_blocked = max(self.max_blocked, wait)
+
+
+@dataclass
+class BaseEventBus(ABC):
+    @abstractmethod
+    async def publish(self, events: Iterable[BaseEvent]) -> None:
+        """ Hand events over for delivery, does not wait for event handlers """
+        ...
+
+    @abstractmethod
+    async def start(self, mediator: EventMediator) -> None:
+        ...
+
+    @abstractmethod
+    async def stop(self) -> None:
+        ...
+
+    @abstractmethod
+    def get_stats(self) -> EventBusStats:
+        ...
+
+
+@dataclass
+class AsyncioEventBus(BaseEventBus):
+    """ In-process bus, workers deliver queued events to the mediator in batches.
+
+    A full queue makes publishers wait, which is counted as blocked. Events published
+    before start are queued, events that do not fit before start are dropped.
+    Events published in a unit of work are queued once it commits, never for a rollback.
+    """
+    max_size: int = 10000
+    workers: int = 2
+    batch_size: int = 100
+    stop_timeout: float = 10.0
+    unit_of_work: BaseUnitOfWork | None = None
+
+    _queue: asyncio.Queue | None = field(default=None, init=False)
+    _workers: list[asyncio.Task] = field(default_factory=list, init=False)
+    _mediator: EventMediator | None = field(default=None, init=False)
+    _stats: EventBusStats = field(default_factory=EventBusStats, init=False)
+
+    @property
+    def queue(self) -> asyncio.Queue:
+        # Created lazily, so the queue binds to the running loop
+        if self._queue is None:
+            self._queue = asyncio.Queue(maxsize=self.max_size)
+
+        return self._queue
+
+    async def publish(self, events: Iterable[BaseEvent]) -> None:
+        # Taken now, events may be pulled from entities lazily
+        events = list(events)
+
+        if self.unit_of_work is None:
+            await self._enqueue(events)
+            return
+
+        await self.unit_of_work.after_commit(partial(self._enqueue, events))
+
+    async def _enqueue(self, events: list[BaseEvent]) -> None:
+        for event in events:
+            self._stats.published += 1
+
+            try:
+                self.queue.put_nowait(event)
+                continue
+            except asyncio.QueueFull:
+                if not self._workers:
+                    self._stats.dropped += 1
+                    continue
+
+            started_at = time.perf_counter()
+            await self.queue.put(event)
+            self._stats.record_blocked(time.perf_counter() - started_at)
+
+    async def start(self, mediator: EventMediator) -> None:
+        if self._workers:
+            return
+
+        self._mediator = mediator
+        self._workers = [
+            asyncio.create_task(self._work(), name=f'event-bus-worker-{number}')
+            for number in range(self.workers)
+        ]
+
+    async def stop(self) -> None:
+        if not self._workers:
+            return
+
+        # Deliver what is already queued, then stop workers
+        try:
+            await asyncio.wait_for(self.queue.join(), timeout=self.stop_timeout)
+        except TimeoutError:
+            logger.warning('Event bus stopped with %s undelivered events', self.queue.qsize())
+
+        for worker in self._workers:
+            worker.cancel()
+
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+
+    async def _work(self) -> None:
+        while True:
+            batch = [await self.queue.get()]
+
+            while len(batch) < self.batch_size and not self.queue.empty():
+                batch.append(self.queue.get_nowait())
+
+            try:
+                await self._mediator.publish(batch)
+                self._stats.delivered += len(batch)
+            except (Exception, ApplicationException):
+                self._stats.failed += len(batch)
+                logger.exception('Event handlers failed for a batch of %s events', len(batch))
+            finally:
+                self._stats.batches += 1
+
+                for _ in batch:
+                    self.queue.task_done()
+
+    def get_stats(self) -> EventBusStats:
+        return replace(self._stats, queued=self.queue.qsize(), max_size=self.max_size, workers=len(self._workers))
+
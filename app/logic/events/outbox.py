@@ -0,0 +1,137 @@
+import asyncio
+import logging
+from dataclasses import dataclass, field, replace
+from typing import Iterable
+
+from domain.events.base import BaseEvent
+from domain.exceptions.base import ApplicationException
+from infra.db.manager.unit_of_work import BaseUnitOfWork
+from infra.repositories.outbox.base import BaseOutboxRepository
+from logic.events.bus import BaseEventBus, EventBusStats
+from logic.mediator.event import EventMediator
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class OutboxEventBus(BaseEventBus):
+    """ Durable bus, events are written to the outbox in the transaction of the command.
+
+    Relay workers claim the oldest events in batches, publish them through the mediator
+    and delete them in the same transaction. Delivery is at least once: events of a failed
+    batch are retried one by one, an event that fails is retried until it runs out of attempts.
+    """
+    outbox_repository: BaseOutboxRepository
+    unit_of_work: BaseUnitOfWork
+    workers: int = 1
+    batch_size: int = 100
+    poll_interval: float = 1.0
+    max_attempts: int = 5
+
+    _workers: list[asyncio.Task] = field(default_factory=list, init=False)
+    _mediator: EventMediator | None = field(default=None, init=False)
+    _stats: EventBusStats = field(default_factory=EventBusStats, init=False)
+
+    async def publish(self, events: Iterable[BaseEvent]) -> None:
+        events = list(events)
+
+        await self.outbox_repository.add_events(events=events)
+        self._stats.published += len(events)
+
+    async def start(self, mediator: EventMediator) -> None:
+        if self._workers:
+            return
+
+        self._mediator = mediator
+        self._workers = [
+            asyncio.create_task(self._work(), name=f'outbox-relay-{number}')
+            for number in range(self.workers)
+        ]
+
+    async def stop(self) -> None:
+        # Unfinished batches roll back and stay in the outbox
+        for worker in self._workers:
+            worker.cancel()
+
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+
+    async def _relay(self, limit: int, event_ids: list[str] | None = None) -> tuple[list[BaseEvent], bool]:
+        """ Claim events and deliver them in one transaction, return claimed events and whether they were delivered """
+        events = []
+
+        try:
+            async with self.unit_of_work.begin(isolated=True):
+                events = await self.outbox_repository.claim_events(
+                    limit=limit,
+                    max_attempts=self.max_attempts,
+                    event_ids=event_ids
+                )
+
+                if events:
+                    await self._mediator.publish(events)
+                    await self.outbox_repository.delete_events(event_ids=[event.event_id for event in events])
+        except (Exception, ApplicationException):
+            if not events:
+                raise
+
+            logger.exception('Event handlers failed for a batch of %s outbox events', len(events))
+            return events, False
+
+        if events:
+            self._stats.delivered += len(events)
+            self._stats.batches += 1
+
+        return events, True
+
+    async def _record_failed(self, events: list[BaseEvent]) -> None:
+        self._stats.failed += len(events)
+
+        async with self.unit_of_work.begin(isolated=True):
+            await self.outbox_repository.record_failed_attempt(event_ids=[event.event_id for event in events])
+
+    async def relay_batch(self) -> int:
+        events, delivered = await self._relay(limit=self.batch_size)
+
+        if delivered:
+            return len(events)
+
+        if len(events) == 1:
+            await self._record_failed(events)
+            return 0
+
+        # One failing event fails its whole batch, so the batch is retried event by event
+        # and only events that fail on their own are charged an attempt
+        relayed = 0
+
+        for event in events:
+            claimed, delivered = await self._relay(limit=1, event_ids=[event.event_id])
+
+            if delivered:
+                relayed += len(claimed)
+            else:
+                await self._record_failed(claimed)
+
+        return relayed
+
+    async def refresh_status(self) -> None:
+        async with self.unit_of_work.begin(isolated=True):
+            status = await self.outbox_repository.get_status(max_attempts=self.max_attempts)
+
+        self._stats = replace(self._stats, queued=status.pending, dead=status.dead, lag=status.lag)
+
+    async def _work(self) -> None:
+        while True:
+            try:
+                relayed = await self.relay_batch()
+                await self.refresh_status()
+            except (Exception, ApplicationException):
+                logger.exception('Outbox relay failed')
+                relayed = 0
+
+            # Full batch means there is likely more waiting
+            if relayed < self.batch_size:
+                await asyncio.sleep(self.poll_interval)
+
+    def get_stats(self) -> EventBusStats:
+        return replace(self._stats, max_size=0, workers=len(self._workers))
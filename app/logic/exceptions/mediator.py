@@ -1,5 +1,6 @@
 from dataclasses import dataclass
 
+from domain.exceptions.base import ApplicationException
 from logic.exceptions.base import LogicException
 
 
@@ -10,3 +11,22 @@ class CommandHandlerNotRegistered(LogicException):
     @property
     def message(self):
         return f"Cant find command handler for command {self.command_type}"
+
+
+@dataclass
+class HandlerTimeoutException(LogicException):
+    handler_type: type
+    timeout: float
+
+    @property
+    def message(self):
+        return f"Handler {self.handler_type.__name__} did not finish in {self.timeout} seconds"
+
+
+@dataclass
+class HandlersFailedException(LogicException):
+    errors: list[ApplicationException]
+
+    @property
+    def message(self):
+        return '; '.join(error.message for error in self.errors)
@@ -44,3 +44,30 @@ class UserTaskNotFound(LogicException):
     def message(self):
         return f"Task with oid: {self.task_oid} not found."
 
+
+@dataclass
+class InvalidTaskCursorException(LogicException):
+    cursor: str
+
+    @property
+    def message(self):
+        return "Invalid pagination cursor."
+
+
+@dataclass
+class InvalidTaskFieldsException(LogicException):
+    fields: str
+
+    @property
+    def message(self):
+        return f"Unknown task fields: {self.fields}."
+
+
+@dataclass
+class InvalidImportFieldException(LogicException):
+    field: str
+    expected: str
+
+    @property
+    def message(self):
+        return f"Field {self.field} should be {self.expected}."
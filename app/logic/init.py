@@ -7,25 +7,39 @@ from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sess
 
 from domain.services.user.password.base import BasePasswordManager
 from domain.services.user.password.password import PasswordManager
+from domain.values.base import BaseValueObject
+from infra.cache.memory import MemoryLRUCache
 from infra.db.manager.base import BaseDatabaseManager
+from infra.db.manager.pool import InstrumentedAsyncAdaptedQueuePool
 from infra.db.manager.postgre import PostgresDatabaseManager
+from infra.db.manager.unit_of_work import BaseUnitOfWork, PostgresUnitOfWork
+from infra.metrics.cache import register_cache_metrics
+from infra.metrics.registry import MetricsRegistry
+from infra.repositories.outbox.base import BaseOutboxRepository
+from infra.repositories.outbox.postgres import PostgresOutboxRepository
 from infra.repositories.tasks.base import BaseTaskRepository
 from infra.repositories.tasks.postgres import PostgresTaskRepository
 from infra.repositories.users.base import BaseUserRepository
-
+from infra.repositories.users.cached import CachedUserRepository
 from infra.repositories.users.postgres import PostgresUserRepository
 from logic.commands.auth import (
     CreateAccessTokenCommandHandler, AuthenticateUserCommand,
     AuthenticateUserCommandHandler, CreateAccessTokenCommand
 )
 from logic.commands.tasks import CreateTaskCommand, CreateTaskCommandHandler, DeleteTaskCommandHandler, \
-    DeleteTaskCommand, CompleteTaskCommandHandler, CompleteTaskCommand
+    DeleteTaskCommand, CompleteTaskCommandHandler, CompleteTaskCommand, CreateTasksBatchCommand, \
+    CreateTasksBatchCommandHandler, CompleteTasksBatchCommand, CompleteTasksBatchCommandHandler, \
+    DeleteTasksBatchCommand, DeleteTasksBatchCommandHandler, ImportTasksCommand, ImportTasksCommandHandler
 from logic.commands.users import (
     CreateUserCommand, CreateUserCommandHandler, DeleteUserCommandHandler, DeleteUserCommand
 )
+from logic.events.bus import BaseEventBus, AsyncioEventBus
+from logic.events.outbox import OutboxEventBus
 from logic.mediator.base import Mediator
+from logic.mediator.behaviors import MetricsBehavior, QueryCacheBehavior
 from logic.queries.tasks import GetAllUserTasksQueryHandler, GetAllUserTasksQuery, GetUserTaskByOidQuery, \
-    GetUserTaskByOidQueryHandler
+    GetUserTaskByOidQueryHandler, ExportUserTasksQuery, ExportUserTasksQueryHandler, SearchUserTasksQuery, \
+    SearchUserTasksQueryHandler, GetUserTaskStatsQuery, GetUserTaskStatsQueryHandler
 from logic.queries.users import GetUserByEmailQueryHandler, GetCurrentUserQueryHandler, GetCurrentUserQuery, \
     GetUserByEmailQuery
 from settings.config import Config
@@ -42,52 +56,147 @@ def init_container() -> Container:
     # register Config
     container.register(Config, instance=Config(), scope=Scope.singleton)
 
+    # Values read back from the database are trusted unless debugging says otherwise
+    BaseValueObject.validate_trusted = container.resolve(Config).validate_trusted_values
+
+    # register metrics, shared by everything that reports to /metrics
+    container.register(MetricsRegistry, instance=MetricsRegistry(), scope=Scope.singleton)
+
     # register Repositories
     def init_postgres_database_manager() -> BaseDatabaseManager:
         config: Config = container.resolve(Config)
-        engine = create_async_engine(config.database_url, echo=True, future=True)
+        engine = create_async_engine(
+            config.database_url,
+            echo=config.database_echo,
+            poolclass=InstrumentedAsyncAdaptedQueuePool,
+            pool_size=config.database_pool_size,
+            max_overflow=config.database_max_overflow,
+            pool_timeout=config.database_pool_timeout,
+            pool_pre_ping=config.database_pool_pre_ping,
+            pool_recycle=config.database_pool_recycle,
+            connect_args={'prepared_statement_cache_size': config.database_statement_cache_size},
+        )
 
         return PostgresDatabaseManager(
             _session_maker=async_sessionmaker(
                 engine,
                 class_=AsyncSession,
                 expire_on_commit=False
-            )
+            ),
+            _engine=engine
         )
 
     container.register(BaseDatabaseManager, factory=init_postgres_database_manager, scope=Scope.singleton)
 
+    def init_postgres_unit_of_work() -> BaseUnitOfWork:
+        return PostgresUnitOfWork(
+            _database_manager=container.resolve(BaseDatabaseManager)
+        )
+
+    container.register(BaseUnitOfWork, factory=init_postgres_unit_of_work, scope=Scope.singleton)
+
     def init_postgres_task_repository() -> BaseTaskRepository:
         return PostgresTaskRepository(
             _database_manager=container.resolve(BaseDatabaseManager)
         )
 
     def init_postgres_user_repository() -> BaseUserRepository:
-        return PostgresUserRepository(
-            _database_manager=container.resolve(BaseDatabaseManager)
+        config: Config = container.resolve(Config)
+        cache = MemoryLRUCache(
+            max_size=config.user_cache_size,
+            ttl=config.user_cache_ttl
+        )
+        register_cache_metrics(registry=container.resolve(MetricsRegistry), cache_name='users', cache=cache)
+
+        return CachedUserRepository(
+            _user_repository=PostgresUserRepository(
+                _database_manager=container.resolve(BaseDatabaseManager)
+            ),
+            _cache=cache
         )
 
     container.register(BaseUserRepository, factory=init_postgres_user_repository, scope=Scope.singleton)
     container.register(BaseTaskRepository, factory=init_postgres_task_repository, scope=Scope.singleton)
 
+    def init_postgres_outbox_repository() -> BaseOutboxRepository:
+        return PostgresOutboxRepository(
+            _database_manager=container.resolve(BaseDatabaseManager)
+        )
+
+    container.register(BaseOutboxRepository, factory=init_postgres_outbox_repository, scope=Scope.singleton)
+
     # register password hasher
-    container.register(BasePasswordManager, instance=PasswordManager(), scope=Scope.singleton)
+    def init_password_manager() -> BasePasswordManager:
+        config: Config = container.resolve(Config)
+
+        return PasswordManager(
+            rounds=config.password_hash_rounds,
+            max_workers=config.password_hash_workers
+        )
+
+    container.register(BasePasswordManager, factory=init_password_manager, scope=Scope.singleton)
+
+    # register event bus, workers are started with the application
+    def init_event_bus() -> BaseEventBus:
+        config: Config = container.resolve(Config)
+
+        if config.event_bus_backend == 'outbox':
+            return OutboxEventBus(
+                outbox_repository=container.resolve(BaseOutboxRepository),
+                unit_of_work=container.resolve(BaseUnitOfWork),
+                workers=config.event_bus_workers,
+                batch_size=config.event_bus_batch_size,
+                poll_interval=config.outbox_poll_interval,
+                max_attempts=config.outbox_max_attempts
+            )
+
+        return AsyncioEventBus(
+            max_size=config.event_bus_queue_size,
+            workers=config.event_bus_workers,
+            batch_size=config.event_bus_batch_size,
+            unit_of_work=container.resolve(BaseUnitOfWork)
+        )
+
+    container.register(BaseEventBus, factory=init_event_bus, scope=Scope.singleton)
 
     # init mediator
     def init_mediator() -> Mediator:
-        mediator = Mediator()
+        mediator = Mediator(
+            unit_of_work=container.resolve(BaseUnitOfWork),
+            behaviors=[
+                MetricsBehavior(registry=container.resolve(MetricsRegistry)),
+                QueryCacheBehavior(
+                    cache=MemoryLRUCache(
+                        max_size=container.resolve(Config).query_cache_size,
+                        ttl=container.resolve(Config).query_cache_ttl
+                    ),
+                    tag_versions=MemoryLRUCache(
+                        max_size=container.resolve(Config).query_cache_size,
+                        ttl=container.resolve(Config).query_cache_ttl
+                    ),
+                    cached_queries={
+                        GetAllUserTasksQuery: None,
+                        GetUserTaskByOidQuery: None,
+                        SearchUserTasksQuery: None,
+                        GetUserTaskStatsQuery: None,
+                    }
+                )
+            ]
+        )
 
         # initialize handlers for commands
         # User handlers command handlers
         create_user_command_handler = CreateUserCommandHandler(
             _mediator=mediator,
             user_repository=container.resolve(BaseUserRepository),
-            password_hasher=container.resolve(BasePasswordManager)
+            password_hasher=container.resolve(BasePasswordManager),
+            event_bus=container.resolve(BaseEventBus)
         )
         authenticate_user_command_handler = AuthenticateUserCommandHandler(
             _mediator=mediator,
             user_repository=container.resolve(BaseUserRepository),
-            password_hasher=container.resolve(BasePasswordManager)
+            password_hasher=container.resolve(BasePasswordManager),
+            unit_of_work=container.resolve(BaseUnitOfWork)
         )
         create_access_token_command_handler = CreateAccessTokenCommandHandler(
             _mediator=mediator,
@@ -101,37 +210,67 @@ def init_container() -> Container:
         create_task_command_handler = CreateTaskCommandHandler(
             _mediator=mediator,
             task_repository=container.resolve(BaseTaskRepository),
-            user_repository=container.resolve(BaseUserRepository)
+            user_repository=container.resolve(BaseUserRepository),
+            event_bus=container.resolve(BaseEventBus)
         )
-        delete_user_task_command_handler = DeleteTaskCommandHandler(
+        create_tasks_batch_command_handler = CreateTasksBatchCommandHandler(
             _mediator=mediator,
             task_repository=container.resolve(BaseTaskRepository),
-            user_repository=container.resolve(BaseUserRepository)
+            event_bus=container.resolve(BaseEventBus)
+        )
+        delete_user_task_command_handler = DeleteTaskCommandHandler(
+            _mediator=mediator,
+            task_repository=container.resolve(BaseTaskRepository)
         )
         complete_user_task_command_handler = CompleteTaskCommandHandler(
+            _mediator=mediator,
+            task_repository=container.resolve(BaseTaskRepository)
+        )
+        delete_user_tasks_batch_command_handler = DeleteTasksBatchCommandHandler(
+            _mediator=mediator,
+            task_repository=container.resolve(BaseTaskRepository)
+        )
+        complete_user_tasks_batch_command_handler = CompleteTasksBatchCommandHandler(
+            _mediator=mediator,
+            task_repository=container.resolve(BaseTaskRepository)
+        )
+        import_tasks_command_handler = ImportTasksCommandHandler(
             _mediator=mediator,
             task_repository=container.resolve(BaseTaskRepository),
-            user_repository=container.resolve(BaseUserRepository)
+            user_repository=container.resolve(BaseUserRepository),
+            unit_of_work=container.resolve(BaseUnitOfWork)
         )
 
         # initialize handlers for queries
         # Users
         get_current_user_query_handler = GetCurrentUserQueryHandler(
             user_repository=container.resolve(BaseUserRepository),
-            config=container.resolve(Config)
+            config=container.resolve(Config),
+            claims_cache=MemoryLRUCache(
+                max_size=container.resolve(Config).token_cache_size,
+                ttl=None
+            )
         )
         get_user_by_email_query_handler = GetUserByEmailQueryHandler(
             user_repository=container.resolve(BaseUserRepository)
         )
         # Tasks
         get_all_user_tasks_query_handler = GetAllUserTasksQueryHandler(
-            task_repository=container.resolve(BaseTaskRepository),
-            user_repository=container.resolve(BaseUserRepository)
+            task_repository=container.resolve(BaseTaskRepository)
         )
         get_user_task_by_oid_query_handler = GetUserTaskByOidQueryHandler(
             task_repository=container.resolve(BaseTaskRepository),
             user_repository=container.resolve(BaseUserRepository)
         )
+        export_user_tasks_query_handler = ExportUserTasksQueryHandler(
+            task_repository=container.resolve(BaseTaskRepository)
+        )
+        search_user_tasks_query_handler = SearchUserTasksQueryHandler(
+            task_repository=container.resolve(BaseTaskRepository)
+        )
+        get_user_task_stats_query_handler = GetUserTaskStatsQueryHandler(
+            task_repository=container.resolve(BaseTaskRepository)
+        )
 
         # register handlers for commands
         # Users
@@ -156,6 +295,10 @@ def init_container() -> Container:
             CreateTaskCommand,
             [create_task_command_handler]
         )
+        mediator.register_command(
+            CreateTasksBatchCommand,
+            [create_tasks_batch_command_handler]
+        )
         mediator.register_command(
             DeleteTaskCommand,
             [delete_user_task_command_handler]
@@ -164,6 +307,18 @@ def init_container() -> Container:
             CompleteTaskCommand,
             [complete_user_task_command_handler]
         )
+        mediator.register_command(
+            DeleteTasksBatchCommand,
+            [delete_user_tasks_batch_command_handler]
+        )
+        mediator.register_command(
+            CompleteTasksBatchCommand,
+            [complete_user_tasks_batch_command_handler]
+        )
+        mediator.register_command(
+            ImportTasksCommand,
+            [import_tasks_command_handler]
+        )
 
         # register handlers for queries
         # Users
@@ -184,6 +339,18 @@ def init_container() -> Container:
             GetUserTaskByOidQuery,
             get_user_task_by_oid_query_handler
         )
+        mediator.register_query(
+            ExportUserTasksQuery,
+            export_user_tasks_query_handler
+        )
+        mediator.register_query(
+            SearchUserTasksQuery,
+            search_user_tasks_query_handler
+        )
+        mediator.register_query(
+            GetUserTaskStatsQuery,
+            get_user_task_stats_query_handler
+        )
 
         return mediator
 
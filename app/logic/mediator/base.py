@@ -1,11 +1,16 @@
 from collections import defaultdict
+from contextlib import nullcontext
 from dataclasses import dataclass, field
-from typing import Iterable
+from functools import partial
+from typing import Iterable, AsyncContextManager, Any, Awaitable, Callable
 
+from infra.db.manager.unit_of_work import BaseUnitOfWork
 from logic.commands.base import CT, CR, BaseCommandHandler, BaseCommand
 from logic.events.base import ET, ER, BaseEventHandler, BaseEvent
 from logic.exceptions.mediator import CommandHandlerNotRegistered
+from logic.mediator.behaviors import BaseMediatorBehavior
 from logic.mediator.command import CommandMediator
+from logic.mediator.dispatch import DispatchPolicy, SEQUENTIAL, dispatch
 from logic.mediator.event import EventMediator
 from logic.mediator.query import QueryMediator
 from logic.queries.base import QT, QR, BaseQueryHandler, BaseQuery
@@ -28,11 +33,53 @@ class Mediator(EventMediator, CommandMediator, QueryMediator):
         kw_only=True,
     )
 
-    def register_event(self, event: ET, event_handlers: Iterable[BaseEventHandler[ET, ER]]):
+    dispatch_policies: dict[type, DispatchPolicy] = field(
+        default_factory=dict,
+        kw_only=True
+    )
+
+    unit_of_work: BaseUnitOfWork | None = field(
+        default=None,
+        kw_only=True
+    )
+
+    behaviors: list[BaseMediatorBehavior] = field(
+        default_factory=list,
+        kw_only=True
+    )
+
+    def _begin_unit_of_work(self, isolated: bool = False) -> AsyncContextManager[None]:
+        if self.unit_of_work is None:
+            return nullcontext()
+
+        return self.unit_of_work.begin(isolated=isolated)
+
+    def _begin_isolated_unit_of_work(self) -> AsyncContextManager[None]:
+        return self._begin_unit_of_work(isolated=True)
+
+    def _run_behaviors(self, request: BaseCommand | BaseQuery, call: Callable[[], Awaitable[Any]]) -> Awaitable[Any]:
+        for behavior in reversed(self.behaviors):
+            call = partial(behavior.handle, request, call)
+
+        return call()
+
+    def register_event(
+            self,
+            event: ET,
+            event_handlers: Iterable[BaseEventHandler[ET, ER]],
+            policy: DispatchPolicy = SEQUENTIAL
+    ):
         self.events_maps[event].extend(event_handlers)
+        self.dispatch_policies[event] = policy
 
-    def register_command(self, command: CT, command_handlers: Iterable[BaseCommandHandler[CT, CR]]):
+    def register_command(
+            self,
+            command: CT,
+            command_handlers: Iterable[BaseCommandHandler[CT, CR]],
+            policy: DispatchPolicy = SEQUENTIAL
+    ):
         self.commands_map[command].extend(command_handlers)
+        self.dispatch_policies[command] = policy
 
     def register_query(self, query: QT, query_handler: BaseQueryHandler[QT, QR]) -> QR:
         self.queries_map[query] = query_handler
@@ -42,7 +89,14 @@ class Mediator(EventMediator, CommandMediator, QueryMediator):
 
         for event in events:
             handlers: Iterable[BaseEventHandler] = self.events_maps[event.__class__]
-            result.extend([await handler.handle(event) for handler in handlers])
+            result.extend(
+                await dispatch(
+                    handlers=handlers,
+                    call=lambda handler: handler.handle(event),
+                    policy=self.dispatch_policies.get(event.__class__, SEQUENTIAL),
+                    begin_isolated=self._begin_isolated_unit_of_work
+                )
+            )
 
         return result
 
@@ -53,7 +107,20 @@ class Mediator(EventMediator, CommandMediator, QueryMediator):
         if not handlers:
             raise CommandHandlerNotRegistered(command_type)
 
-        return [await handler.handle(command) for handler in handlers]
+        async def run() -> Iterable[CR]:
+            async with self._begin_unit_of_work():
+                return await dispatch(
+                    handlers=handlers,
+                    call=lambda handler: handler.handle(command),
+                    policy=self.dispatch_policies.get(command_type, SEQUENTIAL),
+                    begin_isolated=self._begin_isolated_unit_of_work
+                )
+
+        return await self._run_behaviors(command, run)
 
     async def handle_query(self, query: BaseQuery) -> QR:
-        return await self.queries_map[query.__class__].handle(query=query)
+        async def run() -> QR:
+            async with self._begin_unit_of_work():
+                return await self.queries_map[query.__class__].handle(query=query)
+
+        return await self._run_behaviors(query, run)
@@ -0,0 +1,123 @@
+import itertools
+import time
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Iterator
+
+from domain.exceptions.base import ApplicationException
+from infra.cache.base import BaseCache
+from infra.cache.memory import MemoryLRUCache
+from infra.metrics.registry import MetricsRegistry, Histogram, Counter, Gauge
+from logic.commands.base import BaseCommand
+from logic.queries.base import BaseQuery
+
+CallNext = Callable[[], Awaitable[Any]]
+
+
+@dataclass
+class BaseMediatorBehavior(ABC):
+    """ Step of the pipeline every command and query dispatch goes through, first registered is outermost """
+
+    @abstractmethod
+    async def handle(self, request: BaseCommand | BaseQuery, call_next: CallNext) -> Any:
+        ...
+
+
+def get_request_labels(request: BaseCommand | BaseQuery) -> dict[str, str]:
+    return {
+        'kind': 'command' if isinstance(request, BaseCommand) else 'query',
+        'type': request.__class__.__name__,
+    }
+
+
+@dataclass
+class MetricsBehavior(BaseMediatorBehavior):
+    registry: MetricsRegistry
+
+    duration: Histogram = field(init=False)
+    errors: Counter = field(init=False)
+    in_flight: Gauge = field(init=False)
+
+    def __post_init__(self) -> None:
+        self.duration = self.registry.histogram(
+            'mediator_request_duration_seconds',
+            'Time to handle a command or query, unit of work included',
+            label_names=('kind', 'type')
+        )
+        self.errors = self.registry.counter(
+            'mediator_request_errors_total',
+            'Commands and queries that raised, by error type',
+            label_names=('kind', 'type', 'error')
+        )
+        self.in_flight = self.registry.gauge(
+            'mediator_requests_in_flight',
+            'Commands and queries being handled right now',
+            label_names=('kind', 'type')
+        )
+
+    async def handle(self, request: BaseCommand | BaseQuery, call_next: CallNext) -> Any:
+        labels = get_request_labels(request)
+        started_at = time.perf_counter()
+        self.in_flight.inc(**labels)
+
+        try:
+            return await call_next()
+        except (Exception, ApplicationException) as error:
+            self.errors.inc(error=error.__class__.__name__, **labels)
+            raise
+        finally:
+            self.duration.observe(time.perf_counter() - started_at, **labels)
+            self.in_flight.dec(**labels)
+
+
+@dataclass
+class QueryCacheBehavior(BaseMediatorBehavior):
+    """ Caches results of opted-in query types, keyed by the query and the versions of its cache tags.
+
+    A command moves the tags it invalidates to new versions, so results cached before it
+    are no longer found and age out of the cache. Tag versions are bounded too: a forgotten
+    tag gets a version that was never used, which only costs a miss. Versions live in this
+    process only, other workers see the change once their entries expire.
+    """
+    cache: BaseCache
+    # Query type to result ttl, cache default ttl when None
+    cached_queries: dict[type[BaseQuery], float | None] = field(default_factory=dict)
+    tag_versions: BaseCache = field(default_factory=MemoryLRUCache)
+
+    _versions: Iterator[int] = field(default_factory=itertools.count, init=False)
+
+    def cache_query(self, query_type: type[BaseQuery], ttl: float | None = None) -> None:
+        self.cached_queries[query_type] = ttl
+
+    def _get_version(self, tag: str) -> int:
+        version = self.tag_versions.get(tag)
+
+        if version is None:
+            version = next(self._versions)
+            self.tag_versions.set(tag, version)
+
+        return version
+
+    def _get_key(self, query: BaseQuery) -> tuple:
+        return query, tuple(self._get_version(tag) for tag in query.cache_tags())
+
+    async def handle(self, request: BaseCommand | BaseQuery, call_next: CallNext) -> Any:
+        if isinstance(request, BaseCommand):
+            try:
+                return await call_next()
+            finally:
+                # Failed commands may have changed something too
+                for tag in request.invalidates():
+                    self.tag_versions.set(tag, next(self._versions))
+
+        if request.__class__ not in self.cached_queries:
+            return await call_next()
+
+        key = self._get_key(request)
+        result = self.cache.get(key)
+
+        if result is None:
+            result = await call_next()
+            self.cache.set(key, result, ttl=self.cached_queries[request.__class__])
+
+        return result
@@ -4,6 +4,7 @@ from collections.abc import Iterable
 from dataclasses import dataclass, field
 
 from logic.commands.base import BaseCommandHandler, CT, CR, BaseCommand
+from logic.mediator.dispatch import DispatchPolicy, SEQUENTIAL
 
 
 @dataclass(eq=False)
@@ -14,7 +15,12 @@ class CommandMediator(ABC):
     )
 
     @abstractmethod
-    def register_command(self, command: CT, command_handlers: Iterable[BaseCommandHandler[CT, CR]]):
+    def register_command(
+            self,
+            command: CT,
+            command_handlers: Iterable[BaseCommandHandler[CT, CR]],
+            policy: DispatchPolicy = SEQUENTIAL
+    ):
         ...
 
     @abstractmethod
@@ -0,0 +1,77 @@
+import asyncio
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, AsyncContextManager, Sequence
+
+from domain.exceptions.base import ApplicationException
+from logic.exceptions.mediator import HandlerTimeoutException, HandlersFailedException
+
+
+@dataclass(frozen=True)
+class DispatchPolicy:
+    """ How handlers of one command or event registration are run.
+
+    Sequential handlers run one after another in registration order and share the
+    caller unit of work. Concurrent handlers run at once, each in its own unit of work,
+    all of them finish before errors are raised.
+    """
+    concurrent: bool = False
+    # Seconds per handler, no limit when None
+    timeout: float | None = None
+
+
+SEQUENTIAL = DispatchPolicy()
+
+
+async def run_handler(handler: Any, call: Callable[[], Awaitable[Any]], timeout: float | None) -> Any:
+    deadline = asyncio.timeout(timeout)
+
+    try:
+        async with deadline:
+            return await call()
+    except TimeoutError:
+        # A TimeoutError raised by the handler itself is not ours to convert
+        if not deadline.expired():
+            raise
+
+        raise HandlerTimeoutException(handler_type=handler.__class__, timeout=timeout)
+
+
+async def dispatch(
+        handlers: Sequence[Any],
+        call: Callable[[Any], Awaitable[Any]],
+        policy: DispatchPolicy,
+        begin_isolated: Callable[[], AsyncContextManager[None]]
+) -> list[Any]:
+    if not policy.concurrent:
+        return [await run_handler(handler, lambda: call(handler), policy.timeout) for handler in handlers]
+
+    async def run_isolated(handler: Any) -> tuple[Any, BaseException | None]:
+        # Errors are returned, not raised, so one failing handler does not cancel the rest
+        try:
+            async with begin_isolated():
+                return await run_handler(handler, lambda: call(handler), policy.timeout), None
+        except (Exception, ApplicationException) as error:
+            return None, error
+
+    async with asyncio.TaskGroup() as group:
+        tasks = [group.create_task(run_isolated(handler)) for handler in handlers]
+
+    results, errors = [], []
+
+    for task in tasks:
+        result, error = task.result()
+        results.append(result)
+
+        if error is not None:
+            errors.append(error)
+
+    if len(errors) == 1:
+        raise errors[0]
+
+    if errors and all(isinstance(error, ApplicationException) for error in errors):
+        raise HandlersFailedException(errors=errors)
+
+    if errors:
+        raise BaseExceptionGroup('Handlers failed', errors)
+
+    return results
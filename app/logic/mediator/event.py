@@ -5,6 +5,7 @@ from dataclasses import dataclass, field
 
 from domain.events.base import BaseEvent
 from logic.events.base import BaseEventHandler, ET, ER
+from logic.mediator.dispatch import DispatchPolicy, SEQUENTIAL
 
 
 @dataclass(eq=False)
@@ -15,7 +16,12 @@ class EventMediator(ABC):
     )
 
     @abstractmethod
-    def register_event(self, event: ET, event_handlers: Iterable[BaseEventHandler[ET, ER]]):
+    def register_event(
+            self,
+            event: ET,
+            event_handlers: Iterable[BaseEventHandler[ET, ER]],
+            policy: DispatchPolicy = SEQUENTIAL
+    ):
         ...
 
     @abstractmethod
@@ -5,7 +5,9 @@ from typing import TypeVar, Any, Generic
 
 @dataclass(frozen=True)
 class BaseQuery:
-    ...
+    def cache_tags(self) -> tuple[str, ...]:
+        """ Tags of data the result depends on, used when the mediator caches this query type """
+        return ()
 
 
 QT = TypeVar('QT', bound=BaseQuery)
@@ -1,47 +1,75 @@
-from dataclasses import dataclass
-from typing import Iterable
+from dataclasses import dataclass, replace
+from typing import Iterable, AsyncIterator
 
 from domain.entities.tasks import Task
-from infra.repositories.filters.tasks import GetTasksFilters
+from infra.repositories.dtos.task import TaskReadModel, TaskSearchReadModel, TaskStatsReadModel
+from infra.repositories.filters.tasks import GetTasksFilters, TaskCursor, SearchTasksFilters, TaskSearchCursor, \
+    TaskSort
 from infra.repositories.tasks.base import BaseTaskRepository
 from infra.repositories.users.base import BaseUserRepository
-from logic.exceptions.tasks import GetTasksAccessDenied, UsersTasksNotFoundException, UserTaskNotFound
+from logic.exceptions.tasks import UsersTasksNotFoundException, UserTaskNotFound
 from logic.exceptions.users import UserNotFoundByIdException
 from logic.queries.base import BaseQuery, BaseQueryHandler
 
 
+def get_user_tasks_cache_tag(user_oid: str) -> str:
+    return f'tasks:{user_oid}'
+
+
 @dataclass(frozen=True)
 class GetAllUserTasksQuery(BaseQuery):
     user_oid: str
     filters: GetTasksFilters
 
+    def cache_tags(self) -> tuple[str, ...]:
+        return (get_user_tasks_cache_tag(self.user_oid),)
+
 
 @dataclass(frozen=True)
 class GetAllUserTasksQueryHandler(BaseQueryHandler):
     task_repository: BaseTaskRepository
-    user_repository: BaseUserRepository
-
-    async def handle(self, query: GetAllUserTasksQuery) -> Iterable[Task]:
-        user = await self.user_repository.get_user_by_oid(user_oid=query.user_oid)
 
-        if not user:
-            raise UserNotFoundByIdException(user_oid=query.user_oid)
-
-        tasks = await self.task_repository.get_tasks_by_user_oid(
-            user_oid=user.oid,
-            filters=query.filters
+    async def handle(self, query: GetAllUserTasksQuery) -> tuple[Iterable[TaskReadModel], int | None, str | None]:
+        # One extra row tells whether another page exists
+        limit = query.filters.limit
+        tasks, count = await self.task_repository.get_tasks_by_user_oid(
+            user_oid=query.user_oid,
+            filters=replace(query.filters, limit=limit + 1)
         )
-        if not tasks:
+
+        # Filtered views may be empty, an empty listing means there are no tasks at all
+        if not tasks and not query.filters.cursor and not query.filters.is_filtered:
             raise UsersTasksNotFoundException()
-        count = len(tasks)
 
-        return tasks, count
+        next_cursor = None
+
+        if len(tasks) > limit:
+            tasks = tasks[:limit]
+            last = tasks[-1]
+            next_cursor = TaskCursor(
+                created_at=last['created_at'],
+                oid=last['oid'],
+                importance=last['importance'] if query.filters.sort is TaskSort.importance_desc else None
+            ).encode()
+
+        # Sort key fields not asked for come along only for the cursor
+        fields = query.filters.fields
+        if fields:
+            for field in set(query.filters.sort.key_fields).difference(fields):
+                for task in tasks:
+                    del task[field]
+
+        return tasks, count, next_cursor
 
 
 @dataclass(frozen=True)
 class GetUserTaskByOidQuery(BaseQuery):
     task_oid: str
     user_oid: str
+    fields: tuple[str, ...] | None = None
+
+    def cache_tags(self) -> tuple[str, ...]:
+        return (get_user_tasks_cache_tag(self.user_oid),)
 
 
 @dataclass(frozen=True)
@@ -49,17 +77,86 @@ class GetUserTaskByOidQueryHandler(BaseQueryHandler):
     task_repository: BaseTaskRepository
     user_repository: BaseUserRepository
 
-    async def handle(self, query: GetUserTaskByOidQuery) -> Task:
+    async def handle(self, query: GetUserTaskByOidQuery) -> TaskReadModel:
 
         user = await self.user_repository.get_user_by_oid(user_oid=query.user_oid)
 
         if not user:
             raise UserNotFoundByIdException(user_oid=query.user_oid)
 
-        task = await self.task_repository.get_task_by_oid(task_oid=query.task_oid)
+        # Ownership is part of the lookup, foreign tasks look the same as missing ones
+        task = await self.task_repository.get_user_task(
+            task_oid=query.task_oid,
+            user_oid=query.user_oid,
+            fields=query.fields
+        )
 
         if not task:
             raise UserTaskNotFound(task_oid=query.task_oid)
 
         return task
 
+
+@dataclass(frozen=True)
+class SearchUserTasksQuery(BaseQuery):
+    user_oid: str
+    filters: SearchTasksFilters
+
+    def cache_tags(self) -> tuple[str, ...]:
+        return (get_user_tasks_cache_tag(self.user_oid),)
+
+
+@dataclass(frozen=True)
+class SearchUserTasksQueryHandler(BaseQueryHandler):
+    task_repository: BaseTaskRepository
+
+    async def handle(self, query: SearchUserTasksQuery) -> tuple[list[TaskSearchReadModel], str | None]:
+        # One extra row tells whether another page exists
+        limit = query.filters.limit
+        tasks = await self.task_repository.search_user_tasks(
+            user_oid=query.user_oid,
+            filters=replace(query.filters, limit=limit + 1)
+        )
+
+        next_cursor = None
+
+        if len(tasks) > limit:
+            tasks = tasks[:limit]
+            next_cursor = TaskSearchCursor(rank=tasks[-1]['rank'], oid=tasks[-1]['oid']).encode()
+
+        return tasks, next_cursor
+
+
+@dataclass(frozen=True)
+class GetUserTaskStatsQuery(BaseQuery):
+    user_oid: str
+
+    def cache_tags(self) -> tuple[str, ...]:
+        return (get_user_tasks_cache_tag(self.user_oid),)
+
+
+@dataclass(frozen=True)
+class GetUserTaskStatsQueryHandler(BaseQueryHandler):
+    task_repository: BaseTaskRepository
+
+    async def handle(self, query: GetUserTaskStatsQuery) -> TaskStatsReadModel:
+        # Served from maintained counters, tasks themselves are not scanned
+        return await self.task_repository.get_user_task_stats(user_oid=query.user_oid)
+
+
+@dataclass(frozen=True)
+class ExportUserTasksQuery(BaseQuery):
+    user_oid: str
+    chunk_size: int = 1000
+
+
+@dataclass(frozen=True)
+class ExportUserTasksQueryHandler(BaseQueryHandler):
+    task_repository: BaseTaskRepository
+
+    async def handle(self, query: ExportUserTasksQuery) -> AsyncIterator[list[Task]]:
+        # Rows are read lazily while the response is being sent, in its own transaction
+        return self.task_repository.stream_tasks_by_user_oid(
+            user_oid=query.user_oid,
+            chunk_size=query.chunk_size
+        )
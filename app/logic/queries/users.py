@@ -1,3 +1,5 @@
+import hashlib
+import time
 from dataclasses import dataclass
 
 import jwt
@@ -5,6 +7,7 @@ from fastapi import HTTPException, status
 from jwt import InvalidTokenError
 
 from domain.entities.users import User
+from infra.cache.base import BaseCache
 from infra.repositories.users.base import BaseUserRepository
 from logic.exceptions.users import UserNotFoundByEmailException
 from logic.queries.base import BaseQuery, BaseQueryHandler
@@ -20,6 +23,23 @@ class GetCurrentUserQuery(BaseQuery):
 class GetCurrentUserQueryHandler(BaseQueryHandler):
     user_repository: BaseUserRepository
     config: Config
+    claims_cache: BaseCache
+
+    def _decode_token(self, token: str) -> dict:
+        """ Verified claims of token, repeated tokens are served from cache until they expire """
+        key = hashlib.sha256(token.encode()).digest()
+        payload = self.claims_cache.get(key)
+
+        if payload is not None:
+            return payload
+
+        payload = jwt.decode(token, self.config.secret_key, algorithms=[self.config.algorithm])
+        expires_at = payload.get("exp")
+
+        if expires_at is not None:
+            self.claims_cache.set(key, payload, ttl=expires_at - time.time())
+
+        return payload
 
     async def handle(self, query: GetCurrentUserQuery) -> User:
         credentials_exception = HTTPException(
@@ -28,7 +48,7 @@ class GetCurrentUserQueryHandler(BaseQueryHandler):
             headers={"WWW-Authenticate": "Bearer"},
         )
         try:
-            payload = jwt.decode(query.token, self.config.secret_key, algorithms=[self.config.algorithm])
+            payload = self._decode_token(query.token)
             email: str = payload.get("email")
 
             if not email:
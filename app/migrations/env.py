@@ -8,6 +8,8 @@ from alembic import context
 
 from infra.db.models.user import Users
 from infra.db.models.task import Tasks
+from infra.db.models.outbox import Outbox
+from infra.db.models.task_counters import TaskCounters
 from infra.db.models.base import Base
 from logic.init import get_container
 from settings.config import Config
@@ -0,0 +1,37 @@
+"""outbox table for domain events
+
+Revision ID: 3e8d5a1f6c27
+Revises: 9c4f0a7e3b12
+Create Date: 2026-10-18 18:12:09.541207
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3e8d5a1f6c27'
+down_revision: Union[str, None] = '9c4f0a7e3b12'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'Outbox',
+        sa.Column('id', sa.String(), nullable=False),
+        sa.Column('event_type', sa.String(length=100), nullable=False),
+        sa.Column('payload', postgresql.JSONB(astext_type=sa.Text()), nullable=False),
+        sa.Column('created_at', sa.DateTime(), server_default=sa.text("TIMEZONE('utc', now())"), nullable=False),
+        sa.Column('attempts', sa.Integer(), server_default=sa.text('0'), nullable=False),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_outbox_created_at', 'Outbox', ['created_at'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_outbox_created_at', table_name='Outbox')
+    op.drop_table('Outbox')
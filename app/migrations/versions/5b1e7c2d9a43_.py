@@ -0,0 +1,31 @@
+"""tasks keyset pagination index
+
+Revision ID: 5b1e7c2d9a43
+Revises: 040cf8c651ba
+Create Date: 2026-10-18 10:12:31.517204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5b1e7c2d9a43'
+down_revision: Union[str, None] = '040cf8c651ba'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Built concurrently so that live tables are not locked for writes
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_tasks_user_id_created_at_id', 'Tasks', ['user_id', 'created_at', 'id'],
+            unique=False, postgresql_concurrently=True
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_tasks_user_id_created_at_id', table_name='Tasks', postgresql_concurrently=True)
@@ -0,0 +1,38 @@
+"""lookup indexes for users email and open tasks
+
+Revision ID: 9c4f0a7e3b12
+Revises: 5b1e7c2d9a43
+Create Date: 2026-10-18 11:02:47.093318
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9c4f0a7e3b12'
+down_revision: Union[str, None] = '5b1e7c2d9a43'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Built concurrently so that live tables are not locked for writes,
+    # the unique index fails if duplicated emails are already stored
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_users_email', 'Users', ['email'],
+            unique=True, postgresql_concurrently=True
+        )
+        op.create_index(
+            'ix_tasks_user_id_created_at_id_open', 'Tasks', ['user_id', 'created_at', 'id'],
+            unique=False, postgresql_concurrently=True, postgresql_where=sa.text('NOT is_completed')
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_tasks_user_id_created_at_id_open', table_name='Tasks', postgresql_concurrently=True)
+        op.drop_index('ix_users_email', table_name='Users', postgresql_concurrently=True)
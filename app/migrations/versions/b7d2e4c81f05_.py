@@ -0,0 +1,49 @@
+"""full-text search vector for tasks
+
+Revision ID: b7d2e4c81f05
+Revises: 3e8d5a1f6c27
+Create Date: 2026-10-18 20:41:36.208114
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b7d2e4c81f05'
+down_revision: Union[str, None] = '3e8d5a1f6c27'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Stored generated column rewrites the table once, the index is then built without blocking writes
+    op.add_column(
+        'Tasks',
+        sa.Column(
+            'search_vector',
+            postgresql.TSVECTOR(),
+            sa.Computed(
+                "setweight(to_tsvector('simple', title), 'A') || "
+                "setweight(to_tsvector('simple', task_body), 'B')",
+                persisted=True
+            ),
+            nullable=False
+        )
+    )
+
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_tasks_search_vector', 'Tasks', ['search_vector'],
+            unique=False, postgresql_using='gin', postgresql_concurrently=True
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_tasks_search_vector', table_name='Tasks', postgresql_concurrently=True)
+
+    op.drop_column('Tasks', 'search_vector')
@@ -0,0 +1,42 @@
+"""task listing indexes for filters and sort orders
+
+Revision ID: e4a9c3b05d18
+Revises: b7d2e4c81f05
+Create Date: 2026-10-18 22:07:13.540921
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e4a9c3b05d18'
+down_revision: Union[str, None] = 'b7d2e4c81f05'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Built concurrently so that live tables are not locked for writes.
+    # Completed tasks are read off the full indexes, only open ones get partial indexes
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_tasks_user_id_importance_created_at_id', 'Tasks',
+            ['user_id', sa.text('importance DESC'), 'created_at', 'id'],
+            unique=False, postgresql_concurrently=True
+        )
+        op.create_index(
+            'ix_tasks_user_id_importance_created_at_id_open', 'Tasks',
+            ['user_id', sa.text('importance DESC'), 'created_at', 'id'],
+            unique=False, postgresql_concurrently=True, postgresql_where=sa.text('NOT is_completed')
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_tasks_user_id_importance_created_at_id_open', table_name='Tasks', postgresql_concurrently=True
+        )
+        op.drop_index('ix_tasks_user_id_importance_created_at_id', table_name='Tasks', postgresql_concurrently=True)
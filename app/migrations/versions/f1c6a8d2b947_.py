@@ -0,0 +1,35 @@
+"""per-user task counters
+
+Revision ID: f1c6a8d2b947
+Revises: e4a9c3b05d18
+Create Date: 2026-10-18 23:18:52.716034
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f1c6a8d2b947'
+down_revision: Union[str, None] = 'e4a9c3b05d18'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Filled by application.cli.rebuild_task_counters once writers maintain the counters
+    op.create_table(
+        'TaskCounters',
+        sa.Column('user_id', sa.String(), nullable=False),
+        sa.Column('importance', sa.Integer(), nullable=False),
+        sa.Column('total', sa.Integer(), server_default=sa.text('0'), nullable=False),
+        sa.Column('completed', sa.Integer(), server_default=sa.text('0'), nullable=False),
+        sa.ForeignKeyConstraint(['user_id'], ['Users.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('user_id', 'importance')
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('TaskCounters')
@@ -6,7 +6,37 @@ class Config(BaseSettings):
     secret_key: str = Field(default='', alias='SECRET_KEY')
     algorithm: str = Field(default='', alias='ALGORITHM')
     token_expire_min: int = Field(default=30, alias='ACCESS_TOKEN_EXPIRE_MINUTES')
+    validate_trusted_values: bool = Field(default=False, alias='VALIDATE_TRUSTED_VALUES')
     database_url: str = Field(default='postgresql+asyncpg://postgres:rootroot@db_app:5432/Todo', alias='DATABASE_URL')
+    database_echo: bool = Field(default=False, alias='DATABASE_ECHO')
+    database_pool_size: int = Field(default=5, alias='DATABASE_POOL_SIZE')
+    database_max_overflow: int = Field(default=10, alias='DATABASE_MAX_OVERFLOW')
+    database_pool_timeout: float = Field(default=30.0, alias='DATABASE_POOL_TIMEOUT')
+    database_pool_pre_ping: bool = Field(default=True, alias='DATABASE_POOL_PRE_PING')
+    database_pool_recycle: int = Field(default=1800, alias='DATABASE_POOL_RECYCLE')
+    database_statement_cache_size: int = Field(default=100, alias='DATABASE_STATEMENT_CACHE_SIZE')
+
+    password_hash_rounds: int = Field(default=29000, alias='PASSWORD_HASH_ROUNDS')
+    password_hash_workers: int = Field(default=4, alias='PASSWORD_HASH_WORKERS')
+
+    user_cache_size: int = Field(default=10000, alias='USER_CACHE_SIZE')
+    user_cache_ttl: float = Field(default=60.0, alias='USER_CACHE_TTL_SECONDS')
+    token_cache_size: int = Field(default=10000, alias='TOKEN_CACHE_SIZE')
+    query_cache_size: int = Field(default=10000, alias='QUERY_CACHE_SIZE')
+    query_cache_ttl: float = Field(default=5.0, alias='QUERY_CACHE_TTL_SECONDS')
+
+    # outbox stores events with the command transaction, memory keeps them in process only
+    event_bus_backend: str = Field(default='outbox', alias='EVENT_BUS_BACKEND')
+    event_bus_queue_size: int = Field(default=10000, alias='EVENT_BUS_QUEUE_SIZE')
+    event_bus_workers: int = Field(default=2, alias='EVENT_BUS_WORKERS')
+    event_bus_batch_size: int = Field(default=100, alias='EVENT_BUS_BATCH_SIZE')
+    outbox_poll_interval: float = Field(default=1.0, alias='OUTBOX_POLL_INTERVAL_SECONDS')
+    outbox_max_attempts: int = Field(default=5, alias='OUTBOX_MAX_ATTEMPTS')
+
+    tasks_import_batch_size: int = Field(default=5000, alias='TASKS_IMPORT_BATCH_SIZE')
+    tasks_import_rejects_sample: int = Field(default=100, alias='TASKS_IMPORT_REJECTS_SAMPLE')
+    tasks_import_max_line_length: int = Field(default=64 * 1024, alias='TASKS_IMPORT_MAX_LINE_LENGTH')
+    task_counters_batch_size: int = Field(default=1000, alias='TASK_COUNTERS_BATCH_SIZE')
 
     class Config:
         env_file = ".env"
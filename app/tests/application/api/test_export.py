@@ -0,0 +1,84 @@
+import asyncio
+import csv
+import io
+import json
+from datetime import datetime, timedelta
+
+import pytest
+
+from application.api.tasks.export import EXPORT_FIELDS, TaskFileFormat, encode_tasks
+from domain.entities.tasks import Task
+from domain.values.tasks import Title, TaskBody, Importance
+from infra.repositories.tasks.memory import MemoryTaskRepository
+from logic.queries.tasks import ExportUserTasksQuery, ExportUserTasksQueryHandler
+
+USER_OID = 'user'
+
+
+def create_tasks(user_oid: str, amount: int) -> list[Task]:
+    started_at = datetime(2024, 6, 25)
+
+    return [
+        Task(
+            title=Title(f'Task {number}'),
+            task_body=TaskBody('Body, with "quotes"'),
+            importance=Importance(number % 3 + 1),
+            user_oid=user_oid,
+            created_at=started_at + timedelta(minutes=number)
+        )
+        for number in range(amount)
+    ]
+
+
+def export_tasks(tasks: list[Task], export_format: TaskFileFormat, chunk_size: int) -> list[bytes]:
+    handler = ExportUserTasksQueryHandler(task_repository=MemoryTaskRepository(_saved_tasks=tasks))
+
+    async def collect() -> list[bytes]:
+        chunks = await handler.handle(ExportUserTasksQuery(user_oid=USER_OID, chunk_size=chunk_size))
+
+        return [part async for part in encode_tasks(chunks=chunks, export_format=export_format)]
+
+    return asyncio.run(collect())
+
+
+@pytest.fixture
+def tasks() -> list[Task]:
+    return create_tasks(user_oid=USER_OID, amount=5) + create_tasks(user_oid='foreign', amount=2)
+
+
+def test_export_ndjson_in_chunks(tasks: list[Task]):
+    parts = export_tasks(tasks, TaskFileFormat.ndjson, chunk_size=2)
+    rows = [json.loads(line) for line in b''.join(parts).decode().splitlines()]
+
+    assert len(parts) == 3
+    assert [row['title'] for row in rows] == [f'Task {number}' for number in range(5)]
+    assert rows[0] == {
+        'oid': tasks[0].oid,
+        'title': 'Task 0',
+        'task_body': 'Body, with "quotes"',
+        'importance': 1,
+        'created_at': '2024-06-25T00:00:00',
+        'is_completed': False,
+    }
+
+
+def test_export_csv_in_chunks(tasks: list[Task]):
+    parts = export_tasks(tasks, TaskFileFormat.csv, chunk_size=2)
+    rows = list(csv.reader(io.StringIO(b''.join(parts).decode())))
+
+    assert len(parts) == 3
+    assert rows[0] == list(EXPORT_FIELDS)
+    assert [row[1] for row in rows[1:]] == [f'Task {number}' for number in range(5)]
+    assert rows[1][2] == 'Body, with "quotes"'
+    # Header is sent once, with the first chunk
+    assert parts[1].count(b'oid,title') == 0
+
+
+@pytest.mark.parametrize('export_format, expected', [
+    (TaskFileFormat.ndjson, b''),
+    (TaskFileFormat.csv, (','.join(EXPORT_FIELDS) + '\r\n').encode()),
+])
+def test_export_without_tasks(export_format: TaskFileFormat, expected: bytes):
+    parts = export_tasks(create_tasks(user_oid='foreign', amount=2), export_format, chunk_size=2)
+
+    assert b''.join(parts) == expected
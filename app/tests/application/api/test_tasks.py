@@ -0,0 +1,217 @@
+import asyncio
+import os
+import timeit
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+
+import pytest
+from fastapi import FastAPI
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse, ORJSONResponse
+from fastapi.testclient import TestClient
+from punq import Container
+from pydantic import ValidationError
+
+from application.api.tasks.filters import GetTasksFilters, SearchTasksFilters
+from application.api.tasks.handlers import router
+from application.api.tasks.schemas import TaskDetailSchema
+from domain.entities.tasks import Task
+from domain.entities.users import User
+from domain.values.tasks import Title, TaskBody, Importance
+from domain.values.users import Username, Email, Password
+from infra.repositories.converters.tasks.converters import convert_task_row_to_read_model
+from infra.repositories.filters.tasks import TaskCursor
+from infra.repositories.tasks.memory import MemoryTaskRepository
+from infra.repositories.users.memory import MemoryUserRepository
+from infra.services.user.auth.current_user import get_current_user
+from logic.commands.tasks import CreateTaskCommand, CreateTaskCommandHandler, ImportTasksCommand, \
+    ImportTasksCommandHandler
+from logic.events.bus import AsyncioEventBus
+from logic.init import get_container
+from logic.mediator.base import Mediator
+from logic.queries.tasks import GetAllUserTasksQuery, GetAllUserTasksQueryHandler
+from settings.config import Config
+
+
+@pytest.fixture
+def user() -> User:
+    return User(
+        username=Username('Petya'),
+        email=Email('Petya489@gmail.com'),
+        password=Password('petrovi448')
+    )
+
+
+@pytest.fixture
+def task_repository() -> MemoryTaskRepository:
+    return MemoryTaskRepository()
+
+
+@pytest.fixture
+def client(user: User, task_repository: MemoryTaskRepository) -> TestClient:
+    user_repository = MemoryUserRepository(_saved_users=[user])
+    mediator = Mediator()
+    mediator.register_command(
+        ImportTasksCommand,
+        [
+            ImportTasksCommandHandler(
+                _mediator=mediator,
+                task_repository=task_repository,
+                user_repository=user_repository
+            )
+        ]
+    )
+    mediator.register_command(
+        CreateTaskCommand,
+        [
+            CreateTaskCommandHandler(
+                _mediator=mediator,
+                task_repository=task_repository,
+                user_repository=user_repository,
+                event_bus=AsyncioEventBus()
+            )
+        ]
+    )
+
+    container = Container()
+    container.register(Mediator, instance=mediator)
+    container.register(Config, instance=Config(TASKS_IMPORT_REJECTS_SAMPLE=2))
+
+    app = FastAPI()
+    app.include_router(router=router, prefix='/tasks')
+    app.dependency_overrides[get_container] = lambda: container
+    app.dependency_overrides[get_current_user] = lambda: user
+
+    return TestClient(app)
+
+
+def test_create_task_returns_task_detail(client: TestClient, user: User, task_repository: MemoryTaskRepository):
+    response = client.post('/tasks/create', json={'title': 'Buy milk', 'task_body': 'Two bottles', 'importance': 3})
+
+    assert response.status_code == 201
+
+    body = response.json()
+    task, = task_repository._saved_tasks
+
+    assert set(body) == {'oid', 'title', 'task_body', 'importance', 'created_at', 'is_completed'}
+    assert body['oid'] == task.oid
+    assert (body['title'], body['task_body'], body['importance'], body['is_completed']) == (
+        'Buy milk', 'Two bottles', 3, False
+    )
+
+
+def test_import_tasks_returns_sample_of_rejected_rows(client: TestClient, task_repository: MemoryTaskRepository):
+    rows = [
+        '{"title": "Walk", "task_body": "Dog", "importance": 2}',
+        'not json',
+        '{"title": 5, "task_body": "Body", "importance": 1}',
+        '{"title": "Read", "task_body": "Book", "importance": 11}',
+    ]
+
+    response = client.post('/tasks/import?format=ndjson', content='\n'.join(rows).encode())
+
+    assert response.status_code == 201
+
+    body = response.json()
+
+    assert (body['imported'], body['rejected']) == (1, 3)
+    assert [reject['line'] for reject in body['rejects']] == [2, 3]
+    assert body['rejects'][1]['row'] == {'title': 5, 'task_body': 'Body', 'importance': 1}
+    assert len(task_repository._saved_tasks) == 1
+
+
+@pytest.mark.parametrize('params', [{'limit': 0}, {'limit': -1}, {'limit': 101}, {'offset': -1}])
+def test_get_tasks_filters_bounds(params: dict):
+    with pytest.raises(ValidationError):
+        GetTasksFilters(**params)
+
+
+@pytest.mark.parametrize('limit', [0, -1, 101])
+def test_search_tasks_filters_bounds(limit: int):
+    with pytest.raises(ValidationError):
+        SearchTasksFilters(q='milk', limit=limit)
+
+
+def test_get_tasks_filters_accept_aware_datetimes(user: User):
+    started_at = datetime(2024, 6, 25)
+    tasks = [
+        Task(
+            title=Title(f'Task {number}'),
+            task_body=TaskBody('Body'),
+            importance=Importance(1),
+            user_oid=user.oid,
+            created_at=started_at + timedelta(hours=number)
+        )
+        for number in range(5)
+    ]
+    cursor = TaskCursor(
+        created_at=tasks[1].created_at.replace(tzinfo=timezone.utc).astimezone(timezone(timedelta(hours=3))),
+        oid=tasks[1].oid
+    )
+    filters = GetTasksFilters(
+        created_from='2024-06-25T01:00:00Z',
+        created_to='2024-06-25T07:00:00+03:00',
+        cursor=cursor.encode()
+    ).to_infra()
+
+    assert filters.created_from == datetime(2024, 6, 25, 1)
+    assert filters.created_to == datetime(2024, 6, 25, 4)
+    assert filters.cursor.created_at == tasks[1].created_at
+
+    handler = GetAllUserTasksQueryHandler(task_repository=MemoryTaskRepository(_saved_tasks=tasks))
+    page, _, _ = asyncio.run(handler.handle(GetAllUserTasksQuery(user_oid=user.oid, filters=filters)))
+
+    assert [task['oid'] for task in page] == [tasks[2].oid, tasks[3].oid]
+
+
+@pytest.mark.skipif(not os.environ.get('RUN_BENCHMARKS'), reason='RUN_BENCHMARKS is not set')
+def test_read_model_page_renders_faster_than_entity_page():
+    """ 100 task page from fetched rows to response body, database time left out """
+    rows = [
+        SimpleNamespace(
+            id=f'task-{number}',
+            title=f'Task {number}',
+            task_body='Body',
+            importance=number % 10 + 1,
+            user_id='user',
+            created_at=datetime(2024, 6, 25) + timedelta(minutes=number),
+            is_completed=bool(number % 2)
+        )
+        for number in range(100)
+    ]
+    for row in rows:
+        row._mapping = {'oid': row.id, **vars(row)}
+
+    def entity_page() -> bytes:
+        tasks = [
+            Task(
+                oid=row.id,
+                title=Title(row.title),
+                task_body=TaskBody(row.task_body),
+                importance=Importance(row.importance),
+                user_oid=row.user_id,
+                is_completed=row.is_completed,
+                created_at=row.created_at
+            )
+            for row in rows
+        ]
+        items = [TaskDetailSchema.from_entity(task=task) for task in tasks]
+        return JSONResponse(content=jsonable_encoder({'items': items})).body
+
+    def read_model_page() -> bytes:
+        return ORJSONResponse(content={'items': [convert_task_row_to_read_model(row) for row in rows]}).body
+
+    entity_time = min(timeit.repeat(entity_page, number=100, repeat=5)) / 100
+    read_model_time = min(timeit.repeat(read_model_page, number=100, repeat=5)) / 100
+    print(f'\nentity page: {entity_time * 1000:.2f} ms, read model page: {read_model_time * 1000:.2f} ms')
+
+    assert read_model_time < entity_time / 2
+
+
+def test_sparse_task_responses_are_documented(client: TestClient):
+    schemas = client.get('/openapi.json').json()['components']['schemas']
+
+    assert schemas['TaskFieldsSchema']['required'] == ['oid']
+    assert schemas['GetTasksQueryResponseSchema']['properties']['items']['items'] == {
+        '$ref': '#/components/schemas/TaskFieldsSchema'
+    }
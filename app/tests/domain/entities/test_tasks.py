@@ -0,0 +1,90 @@
+import os
+import tracemalloc
+from datetime import datetime
+
+import pytest
+
+from domain.entities.tasks import Task
+from domain.events.tasks import NewTaskCreatedEvent
+from domain.values.tasks import Title, TaskBody, Importance
+
+
+def create_task() -> Task:
+    return Task(
+        title=Title('Task'),
+        task_body=TaskBody('Body'),
+        importance=Importance(1),
+        user_oid='user'
+    )
+
+
+def test_fresh_task_has_no_events():
+    task = create_task()
+
+    assert task.pull_events() == []
+    assert task.pull_events() == []
+
+
+def test_pull_events_returns_registered_events_once():
+    task = Task.create_task(
+        title=Title('Task'),
+        task_body=TaskBody('Body'),
+        importance=Importance(1),
+        user_oid='user'
+    )
+
+    [event] = task.pull_events()
+
+    assert isinstance(event, NewTaskCreatedEvent)
+    assert event.task_oid == task.oid
+    assert task.pull_events() == []
+
+
+def test_events_can_be_registered_after_pull():
+    task = create_task()
+    first, second = (
+        NewTaskCreatedEvent(task_oid=task.oid, title=task.title, importance=task.importance, user_oid='user')
+        for _ in range(2)
+    )
+
+    task.register_event(first)
+    assert task.pull_events() == [first]
+
+    task.register_event(second)
+    task.register_event(first)
+    assert task.pull_events() == [second, first]
+
+
+@pytest.mark.skipif(not os.environ.get('RUN_BENCHMARKS'), reason='RUN_BENCHMARKS is not set')
+def test_task_memory_per_instance():
+    """ Bytes per hydrated task, field values are shared so only instances are counted """
+    amount = 10_000
+    created_at = datetime(2024, 6, 25)
+    oids = [f'task-{number}' for number in range(amount)]
+
+    tracemalloc.start()
+    try:
+        before = tracemalloc.take_snapshot()
+        tasks = [
+            Task(
+                oid=oid,
+                title=Title.trusted('Task'),
+                task_body=TaskBody.trusted('Body'),
+                importance=Importance.trusted(1),
+                user_oid='user',
+                created_at=created_at
+            )
+            for oid in oids
+        ]
+        after = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+
+    allocated = sum(stat.size_diff for stat in after.compare_to(before, 'filename'))
+    per_task = allocated / amount
+    print(f'\n{per_task:.0f} bytes per task with its value objects')
+
+    assert not hasattr(tasks[0], '__dict__')
+    assert tasks[0]._events is None
+    # Slotted instances without an event list, dict based ones took about twice as much
+    assert per_task < 350
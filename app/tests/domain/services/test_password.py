@@ -0,0 +1,80 @@
+import asyncio
+import hashlib
+import os
+import time
+
+import pytest
+
+from domain.services.user.password.password import PasswordManager
+
+
+def test_hash_and_verify_password():
+    password_manager = PasswordManager(rounds=1000, max_workers=1)
+    hashed = password_manager.hash_password('petrovi448')
+
+    assert hashed.startswith('$pbkdf2-sha256$1000$')
+    assert password_manager.verify_password('petrovi448', hashed)
+    assert not password_manager.verify_password('petrovi449', hashed)
+
+
+def test_verify_legacy_sha256_password():
+    password_manager = PasswordManager(rounds=1000, max_workers=1)
+    hashed = hashlib.sha256('petrovi448'.encode()).hexdigest()
+
+    assert password_manager.verify_password('petrovi448', hashed)
+    assert not password_manager.verify_password('petrovi449', hashed)
+
+
+def test_verify_unknown_hash_format():
+    password_manager = PasswordManager(rounds=1000, max_workers=1)
+
+    assert not password_manager.verify_password('petrovi448', 'not a hash')
+
+
+def test_async_password_hashing():
+    password_manager = PasswordManager(rounds=1000, max_workers=2)
+
+    async def scenario():
+        hashed = await password_manager.hash_password_async('petrovi448')
+        return await asyncio.gather(
+            password_manager.verify_password_async('petrovi448', hashed),
+            password_manager.verify_password_async('petrovi449', hashed),
+        )
+
+    assert asyncio.run(scenario()) == [True, False]
+
+
+@pytest.mark.skipif(not os.environ.get('RUN_BENCHMARKS'), reason='RUN_BENCHMARKS is not set')
+def test_async_password_hashing_does_not_block_event_loop():
+    password_manager = PasswordManager(rounds=300000, max_workers=4)
+
+    started_at = time.perf_counter()
+    hashed = password_manager.hash_password('petrovi448')
+    hash_time = time.perf_counter() - started_at
+
+    async def measure_loop_lag() -> float:
+        done = asyncio.Event()
+        max_lag = 0.0
+
+        async def ticker():
+            nonlocal max_lag
+
+            while not done.is_set():
+                ticked_at = time.perf_counter()
+                await asyncio.sleep(0.005)
+                max_lag = max(max_lag, time.perf_counter() - ticked_at - 0.005)
+
+        ticker_task = asyncio.create_task(ticker())
+        await asyncio.gather(*(
+            password_manager.verify_password_async('petrovi448', hashed) for _ in range(8)
+        ))
+        done.set()
+        await ticker_task
+
+        return max_lag
+
+    max_lag = asyncio.run(measure_loop_lag())
+    print(f'\nhash: {hash_time * 1000:.1f} ms, max event loop lag: {max_lag * 1000:.1f} ms')
+
+    # Hashing inline would stall the loop for at least one full hash
+    assert max_lag < hash_time / 4
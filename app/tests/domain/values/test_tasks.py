@@ -0,0 +1,70 @@
+import gc
+import os
+import time
+from datetime import datetime
+from types import SimpleNamespace
+
+import pytest
+
+from domain.exceptions.tasks import EmptyTitleException
+from domain.values.base import BaseValueObject
+from domain.values.tasks import Title, TaskBody, Importance
+from infra.repositories.converters.tasks.converters import convert_task_db_model_to_entity
+
+
+def test_trusted_value_skips_validation():
+    title = Title.trusted('')
+
+    assert title == Title.trusted('')
+    assert title.as_generic_type() == ''
+
+
+def test_trusted_value_validates_in_debug_mode(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(BaseValueObject, 'validate_trusted', True)
+
+    with pytest.raises(EmptyTitleException):
+        Title.trusted('')
+
+
+def test_value_validates_by_default():
+    with pytest.raises(EmptyTitleException):
+        Title('')
+
+
+@pytest.mark.skipif(not os.environ.get('RUN_BENCHMARKS'), reason='RUN_BENCHMARKS is not set')
+def test_trusted_values_hydrate_faster():
+    rows = [
+        SimpleNamespace(
+            id=f'task-{number}',
+            title=f'Task {number}',
+            task_body='Body',
+            importance=number % 10 + 1,
+            user_id='user',
+            created_at=datetime(2024, 6, 25),
+            is_completed=False
+        )
+        for number in range(100_000)
+    ]
+
+    def measure(call) -> float:
+        gc.disable()
+        try:
+            started_at = time.perf_counter()
+            call()
+            return time.perf_counter() - started_at
+        finally:
+            gc.enable()
+
+    validated = measure(lambda: [
+        (Title(row.title), TaskBody(row.task_body), Importance(row.importance)) for row in rows
+    ])
+    trusted = measure(lambda: [
+        (Title.trusted(row.title), TaskBody.trusted(row.task_body), Importance.trusted(row.importance)) for row in rows
+    ])
+    hydrated = measure(lambda: [convert_task_db_model_to_entity(row) for row in rows])
+    print(
+        f'\n100k rows, values validated: {validated:.3f} s, trusted: {trusted:.3f} s, '
+        f'task entities: {hydrated:.3f} s'
+    )
+
+    assert trusted < validated
@@ -0,0 +1,63 @@
+from infra.cache.memory import MemoryLRUCache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_cache_hit_and_miss():
+    cache = MemoryLRUCache(max_size=2, ttl=10)
+
+    assert cache.get('missing') is None
+
+    cache.set('key', 'value')
+
+    assert cache.get('key') == 'value'
+    assert cache.stats.hits == 1
+    assert cache.stats.misses == 1
+
+
+def test_cache_evicts_least_recently_used():
+    cache = MemoryLRUCache(max_size=2, ttl=10)
+
+    cache.set('first', 1)
+    cache.set('second', 2)
+    cache.get('first')
+    cache.set('third', 3)
+
+    assert cache.get('second') is None
+    assert cache.get('first') == 1
+    assert cache.get('third') == 3
+    assert cache.stats.evictions == 1
+
+
+def test_cache_entry_expires():
+    clock = FakeClock()
+    cache = MemoryLRUCache(max_size=2, ttl=10, _clock=clock)
+
+    cache.set('default', 1)
+    cache.set('short', 2, ttl=1)
+
+    clock.now = 5
+
+    assert cache.get('short') is None
+    assert cache.get('default') == 1
+
+    clock.now = 10
+
+    assert cache.get('default') is None
+    assert cache.stats.expirations == 2
+
+
+def test_cache_invalidate():
+    cache = MemoryLRUCache(max_size=2, ttl=10)
+
+    cache.set('key', 'value')
+    cache.invalidate('key')
+
+    assert cache.get('key') is None
+    assert len(cache) == 0
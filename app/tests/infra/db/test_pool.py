@@ -0,0 +1,50 @@
+import asyncio
+from unittest.mock import MagicMock
+
+import pytest
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.util import greenlet_spawn
+
+from infra.db.manager.pool import InstrumentedAsyncAdaptedQueuePool
+
+
+def run_in_pool(scenario) -> None:
+    # Async adapted pool waits through the greenlet bridge, as under AsyncEngine
+    asyncio.run(greenlet_spawn(scenario))
+
+
+def test_pool_counts_only_blocked_checkouts_as_waits():
+    pool = InstrumentedAsyncAdaptedQueuePool(creator=MagicMock, pool_size=1, max_overflow=1, timeout=0.05)
+
+    def scenario():
+        # New connect, overflow connect and idle reuse do not wait
+        first, second = pool.connect(), pool.connect()
+        first.close()
+        first = pool.connect()
+
+        assert pool.wait_stats.waits == 0
+
+        with pytest.raises(PoolTimeoutError):
+            pool.connect()
+
+        first.close()
+        second.close()
+
+    run_in_pool(scenario)
+
+    assert pool.wait_stats.waits == 1
+    assert pool.wait_stats.max_wait > 0
+
+
+def test_pool_without_overflow_limit_never_waits():
+    pool = InstrumentedAsyncAdaptedQueuePool(creator=MagicMock, pool_size=1, max_overflow=-1)
+
+    def scenario():
+        connections = [pool.connect() for _ in range(3)]
+
+        for connection in connections:
+            connection.close()
+
+    run_in_pool(scenario)
+
+    assert pool.wait_stats.waits == 0
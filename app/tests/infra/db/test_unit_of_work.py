@@ -0,0 +1,161 @@
+import asyncio
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from typing import AsyncIterator
+
+import pytest
+
+from infra.db.manager.postgre import PostgresDatabaseManager
+from infra.db.manager.unit_of_work import PostgresUnitOfWork, current_session
+from logic.events.bus import AsyncioEventBus
+from logic.commands.base import BaseCommand, BaseCommandHandler
+from logic.exceptions.tasks import UsersTasksNotFoundException
+from logic.mediator.base import Mediator
+from tests.logic.events.test_bus import create_event
+
+
+@dataclass(eq=False)
+class FakeSession:
+    committed: bool = False
+    rolled_back: bool = False
+
+
+@dataclass
+class FakeSessionMaker:
+    """ Mimics async_sessionmaker.begin(): commits on success, rolls back on error """
+    sessions: list[FakeSession] = field(default_factory=list)
+
+    @asynccontextmanager
+    async def begin(self) -> AsyncIterator[FakeSession]:
+        session = FakeSession()
+        self.sessions.append(session)
+
+        try:
+            yield session
+        except BaseException:
+            session.rolled_back = True
+            raise
+
+        session.committed = True
+
+
+@dataclass(frozen=True)
+class SessionsCommand(BaseCommand):
+    fail: bool = False
+
+
+@dataclass(frozen=True)
+class SessionsCommandHandler(BaseCommandHandler[SessionsCommand, list[FakeSession]]):
+    database_manager: PostgresDatabaseManager
+
+    async def handle(self, command: SessionsCommand) -> list[FakeSession]:
+        sessions = []
+
+        # Each repository call opens its own session() scope
+        for _ in range(2):
+            async with self.database_manager.session() as session:
+                sessions.append(session)
+
+        if command.fail:
+            raise UsersTasksNotFoundException()
+
+        return sessions
+
+
+@pytest.fixture
+def session_maker() -> FakeSessionMaker:
+    return FakeSessionMaker()
+
+
+@pytest.fixture
+def mediator(session_maker: FakeSessionMaker) -> Mediator:
+    database_manager = PostgresDatabaseManager(_session_maker=session_maker, _engine=None)
+    mediator = Mediator(unit_of_work=PostgresUnitOfWork(_database_manager=database_manager))
+    mediator.register_command(
+        SessionsCommand,
+        [SessionsCommandHandler(_mediator=mediator, database_manager=database_manager)]
+    )
+
+    return mediator
+
+
+def test_nested_sessions_share_one_transaction(mediator: Mediator, session_maker: FakeSessionMaker):
+    [sessions] = asyncio.run(mediator.handle_command(SessionsCommand()))
+
+    assert session_maker.sessions == [sessions[0]]
+    assert sessions[0] is sessions[1]
+    assert sessions[0].committed
+    assert current_session.get() is None
+
+
+def test_handler_error_rolls_back_and_resets_session(mediator: Mediator, session_maker: FakeSessionMaker):
+    async def handle() -> None:
+        try:
+            await mediator.handle_command(SessionsCommand(fail=True))
+        finally:
+            assert current_session.get() is None
+
+    with pytest.raises(UsersTasksNotFoundException):
+        asyncio.run(handle())
+
+    [session] = session_maker.sessions
+
+    assert session.rolled_back
+    assert not session.committed
+
+
+def test_isolated_scope_gets_own_session(session_maker: FakeSessionMaker):
+    database_manager = PostgresDatabaseManager(_session_maker=session_maker, _engine=None)
+    unit_of_work = PostgresUnitOfWork(_database_manager=database_manager)
+
+    async def scopes() -> tuple[FakeSession, FakeSession, FakeSession]:
+        async with unit_of_work.begin():
+            outer = current_session.get()
+
+            async with unit_of_work.begin(isolated=True):
+                isolated = current_session.get()
+
+            return outer, isolated, current_session.get()
+
+    outer, isolated, restored = asyncio.run(scopes())
+
+    assert outer is not isolated
+    assert restored is outer
+    assert session_maker.sessions == [outer, isolated]
+
+
+@pytest.mark.parametrize('fail', [False, True])
+def test_events_are_queued_only_after_commit(session_maker: FakeSessionMaker, fail: bool):
+    database_manager = PostgresDatabaseManager(_session_maker=session_maker, _engine=None)
+    event_bus = AsyncioEventBus(unit_of_work=PostgresUnitOfWork(_database_manager=database_manager))
+    unit_of_work = event_bus.unit_of_work
+
+    async def scenario() -> tuple[int, int]:
+        try:
+            async with unit_of_work.begin():
+                await event_bus.publish([create_event(1), create_event(2)])
+                queued_in_scope = event_bus.queue.qsize()
+
+                if fail:
+                    raise UsersTasksNotFoundException()
+        except UsersTasksNotFoundException:
+            pass
+
+        return queued_in_scope, event_bus.queue.qsize()
+
+    queued_in_scope, queued = asyncio.run(scenario())
+
+    assert queued_in_scope == 0
+    assert queued == (0 if fail else 2)
+    assert session_maker.sessions[0].committed is not fail
+
+
+def test_events_outside_of_scope_are_queued_right_away(session_maker: FakeSessionMaker):
+    database_manager = PostgresDatabaseManager(_session_maker=session_maker, _engine=None)
+    event_bus = AsyncioEventBus(unit_of_work=PostgresUnitOfWork(_database_manager=database_manager))
+
+    async def scenario() -> int:
+        await event_bus.publish([create_event(1)])
+        return event_bus.queue.qsize()
+
+    assert asyncio.run(scenario()) == 1
@@ -0,0 +1,81 @@
+import asyncio
+
+from domain.entities.users import User
+from domain.values.users import Username, Email, Password
+from infra.cache.memory import MemoryLRUCache
+from infra.metrics.cache import register_cache_metrics
+from infra.metrics.registry import MetricsRegistry
+from infra.repositories.users.cached import CachedUserRepository
+from infra.repositories.users.memory import MemoryUserRepository
+
+
+def create_user() -> User:
+    return User(
+        username=Username('Petya'),
+        email=Email('Petya489@gmail.com'),
+        password=Password('petrovi448')
+    )
+
+
+def test_cached_user_repository_serves_from_cache():
+    user = create_user()
+    memory_repository = MemoryUserRepository(_saved_users=[user])
+    repository = CachedUserRepository(
+        _user_repository=memory_repository,
+        _cache=MemoryLRUCache(max_size=10, ttl=60)
+    )
+
+    async def scenario():
+        assert await repository.get_user_by_email(email=user.email.as_generic_type()) is user
+
+        memory_repository._saved_users.clear()
+
+        assert await repository.get_user_by_email(email=user.email.as_generic_type()) is user
+        assert await repository.get_user_by_oid(user_oid=user.oid) is user
+
+    asyncio.run(scenario())
+
+    assert repository.cache_stats.hits == 2
+    assert repository.cache_stats.misses == 1
+
+
+def test_cached_user_repository_delete_invalidates():
+    user = create_user()
+    repository = CachedUserRepository(
+        _user_repository=MemoryUserRepository(_saved_users=[user]),
+        _cache=MemoryLRUCache(max_size=10, ttl=60)
+    )
+
+    async def scenario():
+        await repository.get_user_by_email(email=user.email.as_generic_type())
+        await repository.delete_user(user_oid=user.oid)
+
+        assert await repository.get_user_by_email(email=user.email.as_generic_type()) is None
+        assert await repository.get_user_by_oid(user_oid=user.oid) is None
+
+    asyncio.run(scenario())
+
+
+def test_cached_user_repository_stats_are_exported_as_metrics():
+    user = create_user()
+    cache = MemoryLRUCache(max_size=10, ttl=60)
+    repository = CachedUserRepository(
+        _user_repository=MemoryUserRepository(_saved_users=[user]),
+        _cache=cache
+    )
+    registry = MetricsRegistry()
+    register_cache_metrics(registry=registry, cache_name='users', cache=cache)
+
+    async def scenario():
+        for _ in range(3):
+            await repository.get_user_by_oid(user_oid=user.oid)
+
+        await repository.get_user_by_oid(user_oid='missing')
+
+    asyncio.run(scenario())
+    metrics = registry.render()
+
+    assert '# TYPE cache_hits_total counter' in metrics
+    assert 'cache_hits_total{cache="users"} 2' in metrics
+    assert 'cache_misses_total{cache="users"} 2' in metrics
+    assert 'cache_evictions_total{cache="users"} 0' in metrics
@@ -0,0 +1,134 @@
+import asyncio
+import os
+from datetime import datetime
+from typing import Awaitable, Callable
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
+
+from infra.db.manager.postgre import PostgresDatabaseManager
+from infra.db.models.base import Base
+from infra.db.models.task import Tasks  # noqa: F401
+from infra.db.models.user import Users  # noqa: F401
+from infra.repositories.filters.tasks import GetTasksFilters, SearchTasksFilters, TaskSort, TaskCursor
+from infra.repositories.tasks.postgres import PostgresTaskRepository
+from infra.repositories.users.postgres import PostgresUserRepository
+
+DATABASE_URL = os.getenv('TEST_DATABASE_URL')
+
+pytestmark = pytest.mark.skipif(not DATABASE_URL, reason='TEST_DATABASE_URL is not set')
+
+
+def explain(call: Callable[[PostgresDatabaseManager], Awaitable]) -> list[str]:
+    """ Run repository call against an empty schema and EXPLAIN every statement it sent """
+
+    async def scenario() -> list[str]:
+        engine = create_async_engine(DATABASE_URL)
+        statements = []
+
+        def capture(conn, cursor, statement, parameters, context, executemany):
+            statements.append((statement, parameters))
+
+        async with engine.begin() as connection:
+            await connection.run_sync(Base.metadata.create_all)
+
+        try:
+            event.listen(engine.sync_engine, 'before_cursor_execute', capture)
+            await call(
+                PostgresDatabaseManager(
+                    _session_maker=async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False),
+                    _engine=engine
+                )
+            )
+            event.remove(engine.sync_engine, 'before_cursor_execute', capture)
+
+            plans = []
+
+            async with engine.connect() as connection:
+                # Tables are empty, so the planner has to be kept off sequential scans
+                await connection.exec_driver_sql('SET enable_seqscan = off')
+
+                for statement, parameters in statements:
+                    result = await connection.exec_driver_sql(f'EXPLAIN {statement}', parameters)
+                    plans.append('\n'.join(row[0] for row in result))
+
+            return plans
+        finally:
+            async with engine.begin() as connection:
+                await connection.run_sync(Base.metadata.drop_all)
+
+            await engine.dispose()
+
+    return asyncio.run(scenario())
+
+
+def test_get_user_by_email_uses_email_index():
+    plans = explain(
+        lambda manager: PostgresUserRepository(_database_manager=manager).get_user_by_email(email='a@b.cd')
+    )
+
+    assert plans
+    assert all('ix_users_email' in plan for plan in plans)
+
+
+def test_check_user_by_email_uses_email_index():
+    plans = explain(
+        lambda manager: PostgresUserRepository(_database_manager=manager).check_user_by_email(email='a@b.cd')
+    )
+
+    assert plans
+    assert all('ix_users_email' in plan for plan in plans)
+
+
+def test_get_tasks_by_user_oid_uses_composite_index():
+    plans = explain(
+        lambda manager: PostgresTaskRepository(_database_manager=manager).get_tasks_by_user_oid(
+            user_oid='user-oid',
+            filters=GetTasksFilters(limit=10)
+        )
+    )
+
+    assert plans
+    assert all('ix_tasks_user_id_created_at_id ' in plan for plan in plans)
+
+
+def test_search_user_tasks_uses_search_vector_index():
+    plans = explain(
+        lambda manager: PostgresTaskRepository(_database_manager=manager).search_user_tasks(
+            user_oid='user-oid',
+            filters=SearchTasksFilters(text='buy milk')
+        )
+    )
+
+    assert plans
+    assert all('ix_tasks_search_vector' in plan for plan in plans)
+
+
+@pytest.mark.parametrize(
+    'filters, index',
+    [
+        (GetTasksFilters(sort=TaskSort.created_at_desc), 'ix_tasks_user_id_created_at_id'),
+        (GetTasksFilters(is_completed=True), 'ix_tasks_user_id_created_at_id'),
+        (GetTasksFilters(is_completed=False), 'ix_tasks_user_id_created_at_id_open'),
+        (GetTasksFilters(sort=TaskSort.importance_desc, importance_min=3), 'ix_tasks_user_id_importance_created_at_id'),
+        (
+            GetTasksFilters(
+                sort=TaskSort.importance_desc,
+                is_completed=False,
+                cursor=TaskCursor(created_at=datetime(2024, 6, 25), oid='task-oid', importance=5)
+            ),
+            'ix_tasks_user_id_importance_created_at_id_open'
+        ),
+    ]
+)
+def test_filtered_task_listings_use_matching_index(filters: GetTasksFilters, index: str):
+    plans = explain(
+        lambda manager: PostgresTaskRepository(_database_manager=manager).get_tasks_by_user_oid(
+            user_oid='user-oid',
+            filters=filters
+        )
+    )
+
+    assert plans
+    assert all(f'{index} ' in plan for plan in plans)
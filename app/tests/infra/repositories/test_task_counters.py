@@ -0,0 +1,150 @@
+import asyncio
+import os
+from datetime import datetime
+from typing import Awaitable, Callable
+
+import pytest
+from sqlalchemy import insert, select, func, update, delete
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
+
+from domain.entities.tasks import Task
+from domain.values.tasks import Title, TaskBody, Importance
+from infra.db.manager.postgre import PostgresDatabaseManager
+from infra.db.models.base import Base
+from infra.db.models.task import Tasks
+from infra.db.models.task_counters import TaskCounters
+from infra.db.models.user import Users
+from infra.repositories.converters.tasks.converters import convert_task_counts_to_stats
+from infra.repositories.dtos.task import TaskStatsReadModel
+from infra.repositories.tasks.postgres import PostgresTaskRepository
+
+DATABASE_URL = os.getenv('TEST_DATABASE_URL')
+
+pytestmark = pytest.mark.skipif(not DATABASE_URL, reason='TEST_DATABASE_URL is not set')
+
+USER_OIDS = ('user-a', 'user-b')
+
+
+def run(scenario: Callable[[PostgresTaskRepository, PostgresDatabaseManager], Awaitable[None]]) -> None:
+    """ Run scenario against a fresh schema with USER_OIDS registered """
+
+    async def main() -> None:
+        engine = create_async_engine(DATABASE_URL)
+
+        async with engine.begin() as connection:
+            await connection.run_sync(Base.metadata.create_all)
+            await connection.execute(
+                insert(Users),
+                [
+                    {'id': oid, 'name': oid, 'email': f'{oid}@b.cd', 'password': '', 'created_at': datetime.now()}
+                    for oid in USER_OIDS
+                ]
+            )
+
+        try:
+            manager = PostgresDatabaseManager(
+                _session_maker=async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False),
+                _engine=engine
+            )
+            await scenario(PostgresTaskRepository(_database_manager=manager), manager)
+        finally:
+            async with engine.begin() as connection:
+                await connection.run_sync(Base.metadata.drop_all)
+
+            await engine.dispose()
+
+    asyncio.run(main())
+
+
+async def recount(manager: PostgresDatabaseManager, user_oid: str) -> TaskStatsReadModel:
+    async with manager.session() as session:
+        result = await session.execute(
+            select(Tasks.importance, func.count(), func.count().filter(Tasks.is_completed))
+            .where(Tasks.user_id == user_oid)
+            .group_by(Tasks.importance)
+        )
+
+        return convert_task_counts_to_stats(result.tuples())
+
+
+async def assert_counters_match(repository: PostgresTaskRepository, manager: PostgresDatabaseManager) -> None:
+    for user_oid in USER_OIDS:
+        assert await repository.get_user_task_stats(user_oid=user_oid) == await recount(manager, user_oid)
+
+
+def create_task(importance: int, is_completed: bool = False, user_oid: str = USER_OIDS[0]) -> Task:
+    return Task(
+        title=Title('Title'),
+        task_body=TaskBody('Body'),
+        importance=Importance(importance),
+        user_oid=user_oid,
+        is_completed=is_completed
+    )
+
+
+def test_counters_follow_task_changes():
+    tasks = [create_task(3), create_task(3), create_task(5, is_completed=True), create_task(1), create_task(5)]
+
+    async def scenario(repository: PostgresTaskRepository, manager: PostgresDatabaseManager) -> None:
+        await repository.create_task(task=tasks[0])
+        await repository.create_tasks(tasks=[tasks[1], tasks[2], create_task(2, user_oid=USER_OIDS[1])])
+        await repository.copy_tasks(tasks=tasks[3:])
+        await assert_counters_match(repository, manager)
+
+        stats = await repository.get_user_task_stats(user_oid=USER_OIDS[0])
+        assert (stats['total'], stats['completed'], stats['open']) == (5, 1, 4)
+
+        assert await repository.complete_user_task(task_oid=tasks[0].oid, user_oid=USER_OIDS[0])
+        # Completing a completed task still succeeds, but is not counted again
+        assert await repository.complete_user_task(task_oid=tasks[0].oid, user_oid=USER_OIDS[0])
+        await repository.complete_user_tasks(task_oids=[tasks[1].oid, tasks[2].oid, 'missing'], user_oid=USER_OIDS[0])
+        # Foreign tasks are neither completed nor counted
+        await repository.complete_user_tasks(task_oids=[tasks[3].oid], user_oid=USER_OIDS[1])
+        await assert_counters_match(repository, manager)
+
+        assert await repository.get_user_task_stats(user_oid=USER_OIDS[0]) == {
+            'total': 5,
+            'completed': 3,
+            'open': 2,
+            'by_importance': [
+                {'importance': 1, 'total': 1, 'completed': 0, 'open': 1},
+                {'importance': 3, 'total': 2, 'completed': 2, 'open': 0},
+                {'importance': 5, 'total': 2, 'completed': 1, 'open': 1},
+            ]
+        }
+
+        await repository.delete_user_task(task_oid=tasks[2].oid, user_oid=USER_OIDS[0])
+        await repository.delete_user_tasks(task_oids=[tasks[0].oid, tasks[4].oid], user_oid=USER_OIDS[0])
+        await assert_counters_match(repository, manager)
+
+    run(scenario)
+
+
+def test_rebuild_task_counters_restores_fresh_counts():
+    async def scenario(repository: PostgresTaskRepository, manager: PostgresDatabaseManager) -> None:
+        await repository.create_tasks(tasks=[create_task(3), create_task(4, is_completed=True)])
+
+        # Drifted counters, a missing one and a stale one for a user without tasks
+        async with manager.session() as session:
+            await session.execute(update(TaskCounters).values(total=TaskCounters.total + 7))
+            await session.execute(delete(TaskCounters).where(TaskCounters.importance == 4))
+            await session.execute(
+                insert(TaskCounters).values(user_id=USER_OIDS[1], importance=1, total=2, completed=1)
+            )
+
+        last_user_oid = None
+        batches = 0
+
+        while last_user_oid := await repository.rebuild_task_counters(after_user_oid=last_user_oid, batch_size=1):
+            batches += 1
+
+        assert batches == len(USER_OIDS)
+        await assert_counters_match(repository, manager)
+
+        async with manager.session() as session:
+            assert await session.scalar(
+                select(func.count()).select_from(TaskCounters).where(TaskCounters.user_id == USER_OIDS[1])
+            ) == 0
+
+    run(scenario)
+
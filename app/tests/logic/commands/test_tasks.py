@@ -0,0 +1,283 @@
+import asyncio
+import io
+import json
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from typing import AsyncIterator
+
+import pytest
+
+from application.api.tasks.export import TaskFileFormat
+from application.api.tasks.imports import parse_tasks
+from domain.entities.tasks import Task
+from domain.entities.users import User
+from domain.values.tasks import Title, TaskBody, Importance
+from domain.values.users import Username, Email, Password
+from infra.db.manager.unit_of_work import BaseUnitOfWork
+from infra.repositories.tasks.memory import MemoryTaskRepository
+from infra.repositories.users.memory import MemoryUserRepository
+from logic.commands.tasks import (
+    CompleteTaskCommand, CompleteTaskCommandHandler, DeleteTaskCommand, DeleteTaskCommandHandler,
+    CreateTasksBatchCommand, CreateTasksBatchCommandHandler, CreateTaskItem,
+    CompleteTasksBatchCommand, CompleteTasksBatchCommandHandler, ImportTasksCommand, ImportTasksCommandHandler, \
+    ImportTaskRow
+)
+from logic.events.bus import AsyncioEventBus
+from logic.exceptions.tasks import TaskNotFoundException, TaskAccessDeniedException
+from logic.mediator.base import Mediator
+
+
+def create_task(user_oid: str) -> Task:
+    return Task(
+        title=Title('Buy milk'),
+        task_body=TaskBody('Two bottles'),
+        importance=Importance(3),
+        user_oid=user_oid
+    )
+
+
+def test_complete_own_task():
+    task = create_task(user_oid='owner')
+    handler = CompleteTaskCommandHandler(
+        _mediator=Mediator(),
+        task_repository=MemoryTaskRepository(_saved_tasks=[task])
+    )
+
+    asyncio.run(handler.handle(CompleteTaskCommand(task_oid=task.oid, user_oid='owner')))
+
+    assert task.is_completed
+
+
+def test_complete_foreign_task():
+    task = create_task(user_oid='owner')
+    handler = CompleteTaskCommandHandler(
+        _mediator=Mediator(),
+        task_repository=MemoryTaskRepository(_saved_tasks=[task])
+    )
+
+    with pytest.raises(TaskAccessDeniedException):
+        asyncio.run(handler.handle(CompleteTaskCommand(task_oid=task.oid, user_oid='stranger')))
+
+    assert not task.is_completed
+
+
+def test_delete_missing_task():
+    handler = DeleteTaskCommandHandler(
+        _mediator=Mediator(),
+        task_repository=MemoryTaskRepository()
+    )
+
+    with pytest.raises(TaskNotFoundException):
+        asyncio.run(handler.handle(DeleteTaskCommand(task_oid='missing', user_oid='owner')))
+
+
+def test_delete_own_task():
+    task = create_task(user_oid='owner')
+    repository = MemoryTaskRepository(_saved_tasks=[task])
+    handler = DeleteTaskCommandHandler(
+        _mediator=Mediator(),
+        task_repository=repository
+    )
+
+    asyncio.run(handler.handle(DeleteTaskCommand(task_oid=task.oid, user_oid='owner')))
+
+    assert asyncio.run(repository.get_task_by_oid(task_oid=task.oid)) is None
+
+
+def test_create_tasks_batch_reports_invalid_items():
+    repository = MemoryTaskRepository()
+    event_bus = AsyncioEventBus()
+    handler = CreateTasksBatchCommandHandler(
+        _mediator=Mediator(),
+        task_repository=repository,
+        event_bus=event_bus
+    )
+
+    result = asyncio.run(handler.handle(
+        CreateTasksBatchCommand(
+            items=[
+                CreateTaskItem(title='Buy milk', task_body='Two bottles', importance=3),
+                CreateTaskItem(title='', task_body='No title', importance=3),
+                CreateTaskItem(title='Call mom', task_body='Sunday', importance=11),
+            ],
+            user_oid='owner'
+        )
+    ))
+
+    assert [task.title.as_generic_type() for task in result.created] == ['Buy milk']
+    assert [error.index for error in result.errors] == [1, 2]
+    assert repository._saved_tasks == result.created
+    assert event_bus.get_stats().queued == 1
+
+
+def test_complete_tasks_batch_classifies_oids():
+    own_task = create_task(user_oid='owner')
+    foreign_task = create_task(user_oid='stranger')
+    handler = CompleteTasksBatchCommandHandler(
+        _mediator=Mediator(),
+        task_repository=MemoryTaskRepository(_saved_tasks=[own_task, foreign_task])
+    )
+
+    result = asyncio.run(handler.handle(
+        CompleteTasksBatchCommand(
+            task_oids=[own_task.oid, foreign_task.oid, 'missing', own_task.oid],
+            user_oid='owner'
+        )
+    ))
+
+    assert result.affected == [own_task.oid]
+    assert result.denied == [foreign_task.oid]
+    assert result.missing == ['missing']
+    assert own_task.is_completed and not foreign_task.is_completed
+
+
+def test_import_tasks_in_batches_and_rejects_invalid_rows():
+    user = User(username=Username('Petya'), email=Email('Petya489@gmail.com'), password=Password('petrovi448'))
+    task_repository = MemoryTaskRepository()
+    handler = ImportTasksCommandHandler(
+        _mediator=Mediator(),
+        task_repository=task_repository,
+        user_repository=MemoryUserRepository(_saved_users=[user])
+    )
+    data = (
+        'title,task_body,importance\n'
+        '"Buy ""milk""","Two\nbottles",3\n'
+        ',Empty title,1\n'
+        'Call mom,Sunday,eleven\n'
+        'Walk,Dog,2\n'
+        'Read,Book,5\n'
+    ).encode()
+
+    async def stream():
+        for start in range(0, len(data), 7):
+            yield data[start:start + 7]
+
+    rejects = io.StringIO()
+    result = asyncio.run(handler.handle(
+        ImportTasksCommand(
+            rows=parse_tasks(stream=stream(), import_format=TaskFileFormat.csv),
+            user_oid=user.oid,
+            rejects=rejects,
+            batch_size=2
+        )
+    ))
+
+    assert (result.imported, result.rejected) == (3, 2)
+    assert [task.title.as_generic_type() for task in task_repository._saved_tasks] == ['Buy "milk"', 'Walk', 'Read']
+    assert task_repository._saved_tasks[0].task_body.as_generic_type() == 'Two\nbottles'
+    assert [json.loads(line)['line'] for line in rejects.getvalue().splitlines()] == [4, 5]
+
+
+@pytest.mark.parametrize(
+    'data',
+    [
+        {'title': 5, 'task_body': 'Body', 'importance': 1},
+        {'title': 'Title', 'task_body': ['b'], 'importance': 1},
+        {'task_body': 'Body', 'importance': 1},
+        {'title': 'Title', 'task_body': 'Body', 'importance': 2.9},
+        {'title': 'Title', 'task_body': 'Body', 'importance': True},
+        {'title': 'Title', 'task_body': 'Body', 'importance': '2.9'},
+        {'title': 'Title', 'task_body': 'Body', 'importance': 1, 'is_completed': 'maybe'},
+        {'title': 'Title', 'task_body': 'Body', 'importance': 1, 'is_completed': 1},
+    ]
+)
+def test_import_tasks_rejects_rows_with_wrong_field_types(data: dict):
+    user = User(username=Username('Petya'), email=Email('Petya489@gmail.com'), password=Password('petrovi448'))
+    task_repository = MemoryTaskRepository()
+    handler = ImportTasksCommandHandler(
+        _mediator=Mediator(),
+        task_repository=task_repository,
+        user_repository=MemoryUserRepository(_saved_users=[user])
+    )
+    good = {'title': 'Walk', 'task_body': 'Dog', 'importance': '2', 'is_completed': 'true'}
+
+    async def rows():
+        yield ImportTaskRow(number=1, data=data)
+        yield ImportTaskRow(number=2, data=good)
+
+    rejects = io.StringIO()
+    result = asyncio.run(handler.handle(
+        ImportTasksCommand(rows=rows(), user_oid=user.oid, rejects=rejects)
+    ))
+
+    assert (result.imported, result.rejected) == (1, 1)
+    assert json.loads(rejects.getvalue())['line'] == 1
+    task, = task_repository._saved_tasks
+    assert (task.importance.as_generic_type(), task.is_completed) == (2, True)
+
+
+@dataclass
+class RecordingUnitOfWork(BaseUnitOfWork):
+    """ Records how many tasks were stored when each scope committed """
+    task_repository: MemoryTaskRepository
+    commits: list[int] = field(default_factory=list)
+
+    @asynccontextmanager
+    async def begin(self, isolated: bool = False) -> AsyncIterator[None]:
+        assert isolated
+        yield
+        self.commits.append(len(self.task_repository._saved_tasks))
+
+
+def test_import_tasks_commits_every_batch():
+    user = User(username=Username('Petya'), email=Email('Petya489@gmail.com'), password=Password('petrovi448'))
+    task_repository = MemoryTaskRepository()
+    unit_of_work = RecordingUnitOfWork(task_repository=task_repository)
+    handler = ImportTasksCommandHandler(
+        _mediator=Mediator(),
+        task_repository=task_repository,
+        user_repository=MemoryUserRepository(_saved_users=[user]),
+        unit_of_work=unit_of_work
+    )
+
+    async def rows():
+        for number in range(1, 6):
+            yield ImportTaskRow(number=number, data={'title': f'Task {number}', 'task_body': 'Body', 'importance': 1})
+
+        raise ConnectionResetError('Client went away')
+
+    with pytest.raises(ConnectionResetError):
+        asyncio.run(handler.handle(
+            ImportTasksCommand(rows=rows(), user_oid=user.oid, rejects=io.StringIO(), batch_size=2)
+        ))
+
+    # User lookup, then one scope per full batch, the unfinished batch is never copied
+    assert unit_of_work.commits == [0, 2, 4]
+
+
+@pytest.mark.parametrize(
+    'import_format, data, line',
+    [
+        (
+            TaskFileFormat.ndjson,
+            '{"title": "Walk", "task_body": "Dog", "importance": 2}\n'
+            '{"title": "Read", "task_body": "' + 'x' * 100 + '", "importance": 1}\n'
+            '{"title": "Swim", "task_body": "Pool", "importance": 3}\n',
+            2
+        ),
+        (
+            TaskFileFormat.csv,
+            'title,task_body,importance\n'
+            'Walk,Dog,2\n'
+            'Read,"' + 'x\n' * 50 + '",1\n'
+            'Swim,Pool,3\n',
+            3
+        ),
+    ]
+)
+def test_import_tasks_rejects_oversized_lines(import_format: TaskFileFormat, data: str, line: int):
+    encoded = data.encode()
+
+    async def stream():
+        for start in range(0, len(encoded), 16):
+            yield encoded[start:start + 16]
+
+    async def parse() -> list[ImportTaskRow]:
+        return [row async for row in parse_tasks(stream(), import_format=import_format, max_line_length=64)]
+
+    rows = asyncio.run(parse())
+    rejected = [row for row in rows if row.error]
+
+    assert [row.data['title'] for row in rows if row.data] == ['Walk', 'Swim']
+    assert [row.number for row in rejected] == [line]
+    assert rejected[0].error == 'Line is longer than 64 characters'
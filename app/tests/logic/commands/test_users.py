@@ -0,0 +1,91 @@
+import asyncio
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from typing import AsyncIterator
+
+from domain.entities.users import User
+from domain.services.user.password.password import PasswordManager
+from domain.values.users import Username, Email, Password
+from infra.db.manager.unit_of_work import BaseUnitOfWork
+from infra.repositories.users.memory import MemoryUserRepository
+from logic.commands.auth import AuthenticateUserCommand, AuthenticateUserCommandHandler
+from logic.commands.users import CreateUserCommand, CreateUserCommandHandler
+from logic.events.bus import AsyncioEventBus
+from logic.mediator.base import Mediator
+
+
+@dataclass
+class RecordingUserRepository(MemoryUserRepository):
+    calls: list[str] = field(default_factory=list, kw_only=True)
+
+    async def get_user_by_email(self, email: str) -> User | None:
+        self.calls.append('get_user_by_email')
+        return await super().get_user_by_email(email=email)
+
+    async def check_user_by_email(self, email: str) -> bool:
+        self.calls.append('check_user_by_email')
+        return await super().check_user_by_email(email=email)
+
+
+@dataclass
+class RecordingPasswordManager(PasswordManager):
+    calls: list[str] = field(default_factory=list, kw_only=True)
+
+    async def hash_password_async(self, raw_password: str) -> str:
+        self.calls.append('hash')
+        return await super().hash_password_async(raw_password)
+
+    async def verify_password_async(self, raw_password: str, hashed_password: str) -> bool:
+        self.calls.append('verify')
+        return await super().verify_password_async(raw_password, hashed_password)
+
+
+@dataclass
+class RecordingUnitOfWork(BaseUnitOfWork):
+    calls: list[str]
+
+    @asynccontextmanager
+    async def begin(self, isolated: bool = False) -> AsyncIterator[None]:
+        self.calls.append('begin')
+        yield
+        self.calls.append('commit')
+
+
+def test_create_user_hashes_password_before_repository_calls():
+    calls = []
+    password_hasher = RecordingPasswordManager(rounds=1000, max_workers=1, calls=calls)
+    handler = CreateUserCommandHandler(
+        _mediator=Mediator(),
+        user_repository=RecordingUserRepository(calls=calls),
+        password_hasher=password_hasher,
+        event_bus=AsyncioEventBus()
+    )
+
+    user = asyncio.run(handler.handle(
+        CreateUserCommand(username='Petya', password='petrovi448', email='Petya489@gmail.com')
+    ))
+
+    assert calls == ['hash', 'check_user_by_email']
+    assert password_hasher.verify_password('petrovi448', user.password.as_generic_type())
+
+
+def test_authenticate_user_verifies_password_after_lookup_scope():
+    calls = []
+    password_hasher = RecordingPasswordManager(rounds=1000, max_workers=1, calls=calls)
+    user = User(
+        username=Username('Petya'),
+        email=Email('Petya489@gmail.com'),
+        password=Password(password_hasher.hash_password('petrovi448'))
+    )
+    handler = AuthenticateUserCommandHandler(
+        _mediator=Mediator(),
+        user_repository=RecordingUserRepository(_saved_users=[user], calls=calls),
+        password_hasher=password_hasher,
+        unit_of_work=RecordingUnitOfWork(calls=calls)
+    )
+
+    result = asyncio.run(handler.handle(AuthenticateUserCommand(email='Petya489@gmail.com', password='petrovi448')))
+
+    assert result is user
+    # Lookup commits in its own scope, the connection is free while the password is checked
+    assert calls == ['begin', 'get_user_by_email', 'commit', 'verify']
@@ -0,0 +1,60 @@
+import asyncio
+from dataclasses import dataclass, field
+
+from domain.events.tasks import NewTaskCreatedEvent
+from domain.values.tasks import Title, Importance
+from logic.events.base import BaseEventHandler
+from logic.events.bus import AsyncioEventBus
+from logic.mediator.base import Mediator
+
+
+@dataclass
+class CollectEventHandler(BaseEventHandler[NewTaskCreatedEvent, None]):
+    handled: list[NewTaskCreatedEvent] = field(default_factory=list)
+
+    async def handle(self, event: NewTaskCreatedEvent) -> None:
+        self.handled.append(event)
+
+
+def create_event(number: int) -> NewTaskCreatedEvent:
+    return NewTaskCreatedEvent(
+        task_oid=str(number),
+        title=Title('Buy milk'),
+        importance=Importance(1),
+        user_oid='owner'
+    )
+
+
+def test_event_bus_delivers_events_in_batches():
+    handler = CollectEventHandler()
+    mediator = Mediator()
+    mediator.register_event(NewTaskCreatedEvent, [handler])
+    event_bus = AsyncioEventBus(max_size=100, workers=1, batch_size=10)
+
+    async def scenario():
+        await event_bus.publish(create_event(number) for number in range(25))
+        await event_bus.start(mediator=mediator)
+        await event_bus.stop()
+
+    asyncio.run(scenario())
+
+    stats = event_bus.get_stats()
+    assert [event.task_oid for event in handler.handled] == [str(number) for number in range(25)]
+    assert (stats.delivered, stats.batches, stats.queued) == (25, 3, 0)
+
+
+def test_event_bus_backpressure():
+    mediator = Mediator()
+    mediator.register_event(NewTaskCreatedEvent, [CollectEventHandler()])
+    event_bus = AsyncioEventBus(max_size=2, workers=1, batch_size=1)
+
+    async def scenario():
+        await event_bus.start(mediator=mediator)
+        await event_bus.publish(create_event(number) for number in range(10))
+        await event_bus.stop()
+
+    asyncio.run(scenario())
+
+    stats = event_bus.get_stats()
+    assert stats.delivered == 10
+    assert stats.blocked > 0
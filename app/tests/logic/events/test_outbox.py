@@ -0,0 +1,115 @@
+import asyncio
+from contextlib import nullcontext
+from dataclasses import dataclass, field
+
+from domain.events.tasks import NewTaskCreatedEvent
+from domain.exceptions.tasks import EmptyTitleException
+from domain.values.tasks import Title, Importance
+from infra.db.manager.unit_of_work import BaseUnitOfWork
+from infra.repositories.converters.events.converters import convert_event_to_outbox_row, convert_outbox_row_to_event
+from infra.repositories.outbox.memory import MemoryOutboxRepository
+from logic.events.base import BaseEventHandler
+from logic.events.outbox import OutboxEventBus
+from logic.mediator.base import Mediator
+
+
+@dataclass
+class NullUnitOfWork(BaseUnitOfWork):
+    def begin(self, isolated: bool = False):
+        return nullcontext()
+
+
+@dataclass
+class CollectEventHandler(BaseEventHandler[NewTaskCreatedEvent, None]):
+    handled: list[NewTaskCreatedEvent] = field(default_factory=list)
+    fail: bool = False
+    # Task oid of events that always fail
+    poison: str | None = None
+
+    async def handle(self, event: NewTaskCreatedEvent) -> None:
+        if self.fail or event.task_oid == self.poison:
+            raise EmptyTitleException()
+
+        self.handled.append(event)
+
+
+def create_event(task_oid: str = 'task') -> NewTaskCreatedEvent:
+    return NewTaskCreatedEvent(task_oid=task_oid, title=Title('Buy milk'), importance=Importance(3), user_oid='owner')
+
+
+def create_bus(handler: CollectEventHandler, repository: MemoryOutboxRepository) -> OutboxEventBus:
+    mediator = Mediator()
+    mediator.register_event(NewTaskCreatedEvent, [handler])
+    event_bus = OutboxEventBus(
+        outbox_repository=repository,
+        unit_of_work=NullUnitOfWork(),
+        batch_size=10,
+        max_attempts=2
+    )
+    event_bus._mediator = mediator
+
+    return event_bus
+
+
+def test_outbox_row_round_trip():
+    event = create_event()
+    row = convert_event_to_outbox_row(event=event)
+
+    assert row['payload']['title'] == 'Buy milk'
+    assert convert_outbox_row_to_event(event_type=row['event_type'], payload=row['payload']) == event
+
+
+def test_outbox_relay_delivers_and_deletes():
+    handler = CollectEventHandler()
+    repository = MemoryOutboxRepository()
+    event_bus = create_bus(handler=handler, repository=repository)
+
+    async def scenario():
+        await event_bus.publish([create_event(), create_event()])
+        return await event_bus.relay_batch()
+
+    assert asyncio.run(scenario()) == 2
+    assert len(handler.handled) == 2
+    assert repository._saved_events == []
+
+
+def test_outbox_relay_gives_up_after_max_attempts():
+    repository = MemoryOutboxRepository()
+    event_bus = create_bus(handler=CollectEventHandler(fail=True), repository=repository)
+
+    async def scenario():
+        await event_bus.publish([create_event()])
+
+        for _ in range(3):
+            await event_bus.relay_batch()
+
+        await event_bus.refresh_status()
+
+    asyncio.run(scenario())
+
+    stats = event_bus.get_stats()
+    assert (stats.failed, stats.dead, stats.queued) == (2, 1, 0)
+
+
+def test_outbox_relay_charges_only_poison_event_of_failed_batch():
+    handler = CollectEventHandler(poison='poison')
+    repository = MemoryOutboxRepository()
+    event_bus = create_bus(handler=handler, repository=repository)
+    poison = create_event(task_oid='poison')
+    healthy = [create_event(), create_event(), create_event()]
+
+    async def scenario():
+        await event_bus.publish([healthy[0], poison, *healthy[1:]])
+        relayed = [await event_bus.relay_batch() for _ in range(3)]
+        await event_bus.refresh_status()
+        return relayed
+
+    # Healthy events are delivered on the first relay, the poison event alone dies
+    assert asyncio.run(scenario()) == [3, 0, 0]
+    # Delivery is at least once, events handled before the poison one in the failed batch are handled again
+    assert {event.event_id for event in handler.handled} == {event.event_id for event in healthy}
+    assert repository._saved_events == [poison]
+    assert repository._attempts == {poison.event_id: 2}
+
+    stats = event_bus.get_stats()
+    assert (stats.delivered, stats.failed, stats.dead, stats.queued) == (3, 2, 1, 0)
@@ -0,0 +1,117 @@
+import asyncio
+from dataclasses import dataclass, field
+
+import pytest
+
+from infra.cache.memory import MemoryLRUCache
+from infra.metrics.registry import MetricsRegistry
+from logic.commands.base import BaseCommand, BaseCommandHandler
+from logic.exceptions.tasks import UsersTasksNotFoundException
+from logic.mediator.behaviors import MetricsBehavior, QueryCacheBehavior
+from logic.mediator.dispatch import DispatchPolicy
+from logic.mediator.base import Mediator
+from logic.queries.base import BaseQuery, BaseQueryHandler
+from tests.logic.mediator.test_dispatch import SleepCommand, SleepCommandHandler
+
+
+@dataclass(frozen=True)
+class CountQuery(BaseQuery):
+    owner: str
+
+    def cache_tags(self) -> tuple[str, ...]:
+        return (self.owner,)
+
+
+@dataclass(frozen=True)
+class CountQueryHandler(BaseQueryHandler[CountQuery, int]):
+    calls: list[CountQuery] = field(default_factory=list)
+
+    async def handle(self, query: CountQuery) -> int:
+        self.calls.append(query)
+        return len(self.calls)
+
+
+@dataclass(frozen=True)
+class TouchCommand(BaseCommand):
+    owner: str
+
+    def invalidates(self) -> tuple[str, ...]:
+        return (self.owner,)
+
+
+@dataclass(frozen=True)
+class TouchCommandHandler(BaseCommandHandler[TouchCommand, None]):
+    async def handle(self, command: TouchCommand) -> None:
+        ...
+
+
+def test_metrics_behavior_records_latency_and_errors():
+    registry = MetricsRegistry()
+    mediator = Mediator(behaviors=[MetricsBehavior(registry=registry)])
+    mediator.register_command(
+        SleepCommand,
+        [SleepCommandHandler(_mediator=mediator, delay=0, fail=True)],
+        policy=DispatchPolicy()
+    )
+
+    with pytest.raises(UsersTasksNotFoundException):
+        asyncio.run(mediator.handle_command(SleepCommand()))
+
+    metrics = registry.render()
+
+    assert 'mediator_request_duration_seconds_count{kind="command",type="SleepCommand"} 1' in metrics
+    assert (
+        'mediator_request_errors_total{kind="command",type="SleepCommand",error="UsersTasksNotFoundException"} 1'
+        in metrics
+    )
+    assert 'mediator_requests_in_flight{kind="command",type="SleepCommand"} 0' in metrics
+
+
+def test_query_cache_behavior_serves_hits_until_command_invalidates():
+    query_handler = CountQueryHandler()
+    mediator = Mediator(
+        behaviors=[QueryCacheBehavior(cache=MemoryLRUCache(max_size=10, ttl=60), cached_queries={CountQuery: None})]
+    )
+    mediator.register_query(CountQuery, query_handler)
+    mediator.register_command(TouchCommand, [TouchCommandHandler(_mediator=mediator)])
+
+    async def scenario() -> list[int]:
+        return [
+            await mediator.handle_query(CountQuery(owner='first')),
+            await mediator.handle_query(CountQuery(owner='first')),
+            await mediator.handle_query(CountQuery(owner='second')),
+            *await mediator.handle_command(TouchCommand(owner='first')),
+            await mediator.handle_query(CountQuery(owner='first')),
+            await mediator.handle_query(CountQuery(owner='second')),
+        ]
+
+    assert asyncio.run(scenario()) == [1, 1, 2, None, 3, 2]
+    assert len(query_handler.calls) == 3
+
+
+def test_query_cache_behavior_bounds_tag_versions():
+    query_handler = CountQueryHandler()
+    tag_versions = MemoryLRUCache(max_size=1, ttl=60)
+    mediator = Mediator(
+        behaviors=[
+            QueryCacheBehavior(
+                cache=MemoryLRUCache(max_size=10, ttl=60),
+                cached_queries={CountQuery: None},
+                tag_versions=tag_versions
+            )
+        ]
+    )
+    mediator.register_query(CountQuery, query_handler)
+    mediator.register_command(TouchCommand, [TouchCommandHandler(_mediator=mediator)])
+
+    async def scenario() -> list[int]:
+        first = await mediator.handle_query(CountQuery(owner='first'))
+
+        for number in range(5):
+            await mediator.handle_command(TouchCommand(owner=f'other-{number}'))
+
+        # Version of the first tag was forgotten, a new one can not match the cached result
+        return [first, await mediator.handle_query(CountQuery(owner='first'))]
+
+    assert asyncio.run(scenario()) == [1, 2]
+    assert len(tag_versions) == 1
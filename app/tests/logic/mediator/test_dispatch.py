@@ -0,0 +1,116 @@
+import asyncio
+from dataclasses import dataclass
+
+import pytest
+
+from logic.commands.base import BaseCommand, BaseCommandHandler
+from logic.exceptions.mediator import HandlerTimeoutException, HandlersFailedException
+from logic.exceptions.tasks import UsersTasksNotFoundException
+from logic.mediator.base import Mediator
+from logic.mediator.dispatch import DispatchPolicy
+
+
+@dataclass(frozen=True)
+class SleepCommand(BaseCommand):
+    ...
+
+
+@dataclass(frozen=True)
+class SleepCommandHandler(BaseCommandHandler[SleepCommand, float]):
+    delay: float
+    fail: bool = False
+
+    async def handle(self, command: SleepCommand) -> float:
+        await asyncio.sleep(self.delay)
+
+        if self.fail:
+            raise UsersTasksNotFoundException()
+
+        return self.delay
+
+
+def create_mediator(policy: DispatchPolicy, *handlers: tuple[float, bool]) -> Mediator:
+    mediator = Mediator()
+    mediator.register_command(
+        SleepCommand,
+        [SleepCommandHandler(_mediator=mediator, delay=delay, fail=fail) for delay, fail in handlers],
+        policy=policy
+    )
+
+    return mediator
+
+
+@dataclass(frozen=True)
+class BarrierCommandHandler(BaseCommandHandler[SleepCommand, int]):
+    """ Returns only once all handlers sharing the barrier have started """
+    barrier: asyncio.Barrier
+    number: int
+    finished: list[int]
+
+    async def handle(self, command: SleepCommand) -> int:
+        await self.barrier.wait()
+
+        # Later handlers finish first
+        for _ in range(self.barrier.parties - self.number):
+            await asyncio.sleep(0)
+
+        self.finished.append(self.number)
+
+        return self.number
+
+
+def test_concurrent_handlers_overlap_and_keep_order():
+    mediator = Mediator()
+    barrier = asyncio.Barrier(3)
+    finished = []
+    mediator.register_command(
+        SleepCommand,
+        [
+            BarrierCommandHandler(_mediator=mediator, barrier=barrier, number=number, finished=finished)
+            for number in range(3)
+        ],
+        policy=DispatchPolicy(concurrent=True)
+    )
+
+    async def scenario() -> list[int]:
+        # Sequential handlers would wait at the barrier forever
+        async with asyncio.timeout(5):
+            return await mediator.handle_command(SleepCommand())
+
+    assert asyncio.run(scenario()) == [0, 1, 2]
+    assert finished == [2, 1, 0]
+
+
+def test_concurrent_handler_errors_are_aggregated():
+    mediator = create_mediator(DispatchPolicy(concurrent=True), (0.01, True), (0.05, False), (0.02, True))
+
+    with pytest.raises(HandlersFailedException) as error:
+        asyncio.run(mediator.handle_command(SleepCommand()))
+
+    assert len(error.value.errors) == 2
+
+
+def test_handler_timeout():
+    mediator = create_mediator(DispatchPolicy(timeout=0.05), (0.01, False), (1, False))
+
+    with pytest.raises(HandlerTimeoutException):
+        asyncio.run(mediator.handle_command(SleepCommand()))
+
+
+@dataclass(frozen=True)
+class TimingOutCommandHandler(BaseCommandHandler[SleepCommand, None]):
+    async def handle(self, command: SleepCommand) -> None:
+        # E.g. a client call giving up on its own deadline
+        raise TimeoutError('upstream timed out')
+
+
+def test_handler_own_timeout_error_is_not_converted():
+    mediator = Mediator()
+    mediator.register_command(
+        SleepCommand,
+        [TimingOutCommandHandler(_mediator=mediator)],
+        policy=DispatchPolicy(timeout=1)
+    )
+
+    with pytest.raises(TimeoutError, match='upstream timed out'):
+        asyncio.run(mediator.handle_command(SleepCommand()))
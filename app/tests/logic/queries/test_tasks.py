@@ -0,0 +1,211 @@
+import asyncio
+from datetime import datetime, timedelta
+
+import pytest
+
+from domain.entities.tasks import Task
+from domain.entities.users import User
+from domain.values.tasks import Title, TaskBody, Importance
+from domain.values.users import Username, Email, Password
+from infra.repositories.filters.tasks import GetTasksFilters, TaskCursor, SearchTasksFilters, TaskSearchCursor, \
+    TaskSort
+from infra.repositories.tasks.memory import MemoryTaskRepository
+from logic.queries.tasks import GetAllUserTasksQuery, GetAllUserTasksQueryHandler, SearchUserTasksQuery, \
+    SearchUserTasksQueryHandler, GetUserTaskStatsQuery, GetUserTaskStatsQueryHandler
+
+
+@pytest.fixture
+def user() -> User:
+    return User(
+        username=Username('Petya'),
+        email=Email('Petya489@gmail.com'),
+        password=Password('petrovi448')
+    )
+
+
+def create_tasks(user_oid: str, amount: int) -> list[Task]:
+    started_at = datetime(2024, 6, 25)
+
+    return [
+        Task(
+            title=Title(f'Task {number}'),
+            task_body=TaskBody('Body'),
+            importance=Importance(1),
+            user_oid=user_oid,
+            created_at=started_at + timedelta(minutes=number)
+        )
+        for number in range(amount)
+    ]
+
+
+def test_task_cursor_round_trip():
+    cursor = TaskCursor(created_at=datetime(2024, 6, 25, 19, 15), oid='task-oid')
+
+    assert TaskCursor.decode(cursor.encode()) == cursor
+
+
+def test_task_cursor_invalid():
+    with pytest.raises(ValueError):
+        TaskCursor.decode('not a cursor')
+
+
+def test_get_tasks_keyset_pages(user: User):
+    tasks = create_tasks(user_oid=user.oid, amount=5)
+    handler = GetAllUserTasksQueryHandler(
+        task_repository=MemoryTaskRepository(_saved_tasks=list(reversed(tasks)))
+    )
+
+    async def fetch(cursor: TaskCursor | None):
+        return await handler.handle(
+            GetAllUserTasksQuery(user_oid=user.oid, filters=GetTasksFilters(limit=2, cursor=cursor))
+        )
+
+    pages = []
+    cursor = None
+
+    while True:
+        page, count, next_cursor = asyncio.run(fetch(cursor))
+        pages.append([task['oid'] for task in page])
+
+        assert count == 5
+
+        if not next_cursor:
+            break
+
+        cursor = TaskCursor.decode(next_cursor)
+
+    assert pages == [
+        [tasks[0].oid, tasks[1].oid],
+        [tasks[2].oid, tasks[3].oid],
+        [tasks[4].oid],
+    ]
+
+
+def test_get_tasks_sparse_fields(user: User):
+    tasks = create_tasks(user_oid=user.oid, amount=3)
+    handler = GetAllUserTasksQueryHandler(
+        task_repository=MemoryTaskRepository(_saved_tasks=tasks)
+    )
+
+    page, _, next_cursor = asyncio.run(handler.handle(
+        GetAllUserTasksQuery(user_oid=user.oid, filters=GetTasksFilters(limit=2, fields=('oid', 'title')))
+    ))
+
+    assert page == [{'oid': tasks[0].oid, 'title': 'Task 0'}, {'oid': tasks[1].oid, 'title': 'Task 1'}]
+    assert TaskCursor.decode(next_cursor) == TaskCursor(created_at=tasks[1].created_at, oid=tasks[1].oid)
+
+
+def test_search_tasks_ranks_title_matches_first(user: User):
+    title_match = Task(
+        title=Title('Buy milk'), task_body=TaskBody('Corner shop'), importance=Importance(1), user_oid=user.oid
+    )
+    body_match = Task(
+        title=Title('Shopping'), task_body=TaskBody('Milk and bread'), importance=Importance(1), user_oid=user.oid
+    )
+    excluded = Task(
+        title=Title('Milk'), task_body=TaskBody('Oat milk only'), importance=Importance(1), user_oid=user.oid
+    )
+    foreign = Task(
+        title=Title('Buy milk'), task_body=TaskBody('Corner shop'), importance=Importance(1), user_oid='other'
+    )
+    repository = MemoryTaskRepository(_saved_tasks=[body_match, foreign, excluded])
+    asyncio.run(repository.create_task(title_match))
+    handler = SearchUserTasksQueryHandler(task_repository=repository)
+
+    def search(text: str, cursor: str | None = None):
+        return asyncio.run(handler.handle(
+            SearchUserTasksQuery(
+                user_oid=user.oid,
+                filters=SearchTasksFilters(
+                    text=text, limit=1, cursor=TaskSearchCursor.decode(cursor) if cursor else None
+                )
+            )
+        ))
+
+    first_page, next_cursor = search('MILK -oat')
+    second_page, last_cursor = search('MILK -oat', next_cursor)
+
+    assert [task['oid'] for task in first_page + second_page] == [title_match.oid, body_match.oid]
+    assert first_page[0]['rank'] > second_page[0]['rank']
+    assert last_cursor is None
+
+    asyncio.run(repository.delete_user_task(task_oid=title_match.oid, user_oid=user.oid))
+
+    assert [task['oid'] for task in search('milk -oat')[0]] == [body_match.oid]
+
+
+def test_get_tasks_filtered_by_completion_sorted_by_importance(user: User):
+    tasks = create_tasks(user_oid=user.oid, amount=6)
+    for number, task in enumerate(tasks):
+        task.importance = Importance(number % 3 + 1)
+    tasks[5].is_completed = True
+
+    handler = GetAllUserTasksQueryHandler(
+        task_repository=MemoryTaskRepository(_saved_tasks=tasks)
+    )
+
+    async def fetch(cursor: TaskCursor | None):
+        return await handler.handle(
+            GetAllUserTasksQuery(
+                user_oid=user.oid,
+                filters=GetTasksFilters(
+                    limit=2,
+                    cursor=cursor,
+                    fields=('oid',),
+                    sort=TaskSort.importance_desc,
+                    is_completed=False,
+                    importance_min=2
+                )
+            )
+        )
+
+    pages = []
+    cursor = None
+
+    while True:
+        page, count, next_cursor = asyncio.run(fetch(cursor))
+        pages.append([task['oid'] for task in page])
+
+        assert count == 3
+
+        if not next_cursor:
+            break
+
+        cursor = TaskCursor.decode(next_cursor)
+        assert cursor.importance is not None
+
+    # Importance 3, then importance 2 oldest first, completed task 5 is filtered out
+    assert pages == [[tasks[2].oid, tasks[1].oid], [tasks[4].oid]]
+    assert page == [{'oid': tasks[4].oid}]
+
+
+def test_get_tasks_empty_filtered_view(user: User):
+    handler = GetAllUserTasksQueryHandler(
+        task_repository=MemoryTaskRepository(_saved_tasks=create_tasks(user_oid=user.oid, amount=2))
+    )
+
+    page, count, next_cursor = asyncio.run(handler.handle(
+        GetAllUserTasksQuery(user_oid=user.oid, filters=GetTasksFilters(is_completed=True))
+    ))
+
+    assert (page, count, next_cursor) == ([], 0, None)
+
+
+def test_get_user_task_stats(user: User):
+    tasks = create_tasks(user_oid=user.oid, amount=4)
+    tasks[0].importance = Importance(3)
+    tasks[1].is_completed = True
+    repository = MemoryTaskRepository(_saved_tasks=tasks + create_tasks(user_oid='other', amount=2))
+    handler = GetUserTaskStatsQueryHandler(task_repository=repository)
+
+    stats = asyncio.run(handler.handle(GetUserTaskStatsQuery(user_oid=user.oid)))
+
+    assert stats == {
+        'total': 4,
+        'completed': 1,
+        'open': 3,
+        'by_importance': [
+            {'importance': 1, 'total': 3, 'completed': 1, 'open': 2},
+            {'importance': 3, 'total': 1, 'completed': 0, 'open': 1},
+        ]
+    }
@@ -0,0 +1,127 @@
+import asyncio
+import time
+
+import jwt
+import pytest
+from fastapi import HTTPException
+
+from domain.entities.users import User
+from domain.values.users import Username, Email, Password
+from infra.cache.memory import MemoryLRUCache
+from infra.repositories.users.memory import MemoryUserRepository
+from logic.queries import users
+from logic.queries.users import GetCurrentUserQuery, GetCurrentUserQueryHandler
+from settings.config import Config
+
+SECRET_KEY = 'secret'
+ALGORITHM = 'HS256'
+
+
+class Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def user() -> User:
+    return User(
+        username=Username('Petya'),
+        email=Email('Petya489@gmail.com'),
+        password=Password('petrovi448')
+    )
+
+
+@pytest.fixture
+def clock() -> Clock:
+    return Clock()
+
+
+@pytest.fixture
+def decode_calls(monkeypatch) -> list[str]:
+    calls = []
+    decode = jwt.decode
+
+    def counting_decode(token, *args, **kwargs):
+        calls.append(token)
+        return decode(token, *args, **kwargs)
+
+    monkeypatch.setattr(users.jwt, 'decode', counting_decode)
+
+    return calls
+
+
+@pytest.fixture
+def handler(user: User, clock: Clock) -> GetCurrentUserQueryHandler:
+    return GetCurrentUserQueryHandler(
+        user_repository=MemoryUserRepository(_saved_users=[user]),
+        config=Config(SECRET_KEY=SECRET_KEY, ALGORITHM=ALGORITHM),
+        claims_cache=MemoryLRUCache(max_size=10, ttl=None, _clock=clock)
+    )
+
+
+def create_token(user: User, expires_in: float) -> str:
+    return jwt.encode(
+        {'email': user.email.as_generic_type(), 'exp': int(time.time() + expires_in)},
+        SECRET_KEY,
+        algorithm=ALGORITHM
+    )
+
+
+def get_current_user(handler: GetCurrentUserQueryHandler, token: str) -> User:
+    return asyncio.run(handler.handle(GetCurrentUserQuery(token=token)))
+
+
+def test_cached_token_skips_decoding(handler: GetCurrentUserQueryHandler, user: User, decode_calls: list[str]):
+    token = create_token(user, expires_in=600)
+
+    assert get_current_user(handler, token) == user
+    assert get_current_user(handler, token) == user
+    assert decode_calls == [token]
+
+
+def test_token_is_not_served_from_cache_after_expiry(
+        handler: GetCurrentUserQueryHandler,
+        user: User,
+        clock: Clock,
+        decode_calls: list[str]
+):
+    token = create_token(user, expires_in=60)
+
+    get_current_user(handler, token)
+    clock.now += 61
+    get_current_user(handler, token)
+
+    assert decode_calls == [token, token]
+
+
+def test_expired_token_is_rejected(handler: GetCurrentUserQueryHandler, user: User):
+    token = create_token(user, expires_in=-60)
+
+    for _ in range(2):
+        with pytest.raises(HTTPException) as error:
+            get_current_user(handler, token)
+
+        assert error.value.status_code == 401
+
+    assert len(handler.claims_cache) == 0
+
+
+def test_tampered_token_misses_cache_and_is_rejected(
+        handler: GetCurrentUserQueryHandler,
+        user: User,
+        decode_calls: list[str]
+):
+    token = create_token(user, expires_in=600)
+    get_current_user(handler, token)
+
+    header, payload, signature = token.split('.')
+    tampered = '.'.join([header, payload, signature[:-2] + ('AA' if signature[-2:] != 'AA' else 'BB')])
+
+    with pytest.raises(HTTPException) as error:
+        get_current_user(handler, tampered)
+
+    assert error.value.status_code == 401
+    assert decode_calls == [token, tampered]